@@ -1,53 +1,110 @@
 import sys
-import psutil
-import time
-import platform
-import os
-import socket
-import urllib.request
-import ctypes
-from PySide6.QtGui import QDrag, QPixmap, QPainter
-from PySide6.QtCore import QMimeData
-
-from PySide6.QtWidgets import (QApplication, QWidget, QVBoxLayout, QHBoxLayout, 
-                               QLabel, QProgressBar, QPushButton, QMenu, QFrame, 
-                               QSizeGrip, QMessageBox, QFileIconProvider, 
-                               QGraphicsDropShadowEffect)
-from PySide6.QtCore import (Qt, QThread, Signal, QPoint, QSettings, QSize, QUrl, 
-                            QFileInfo, QEasingCurve, QVariantAnimation)
-from PySide6.QtGui import (QAction, QFont, QDesktopServices, QDragEnterEvent, 
-                           QDropEvent, QColor)
+import importlib.util
+
+# Profiler di-import pertama agar import berikutnya ikut terukur (--profile-startup)
+from macan_startup import PROFILER
+
+with PROFILER.section("import", "stdlib"):
+    import platform
+    import os
+    import socket
+    import ctypes
+
+with PROFILER.section("import", "psutil"):
+    import psutil
+
+with PROFILER.section("import", "PySide6"):
+    from PySide6.QtGui import QDrag, QPixmap, QPainter
+    from PySide6.QtCore import QMimeData
+
+    from PySide6.QtWidgets import (QApplication, QWidget, QVBoxLayout, QHBoxLayout, 
+                                   QLabel, QProgressBar, QPushButton, QMenu, QFrame, 
+                                   QSizeGrip, QMessageBox, QFileIconProvider, 
+                                   QGraphicsDropShadowEffect)
+    from PySide6.QtCore import (Qt, QThread, Signal, QPoint, QSettings, QSize, QUrl, 
+                                QFileInfo, QEasingCurve, QVariantAnimation)
+    from PySide6.QtGui import (QAction, QActionGroup, QFont, QDesktopServices, QDragEnterEvent, 
+                               QDropEvent, QColor)
 
 # --- IMPORT THEME MANAGER ---
-try:
-    from macan_theme import get_theme_manager
-    THEME_AVAILABLE = True
-except ImportError:
-    THEME_AVAILABLE = False
-    print("Warning: macan_theme.py not found. Using default dark theme.")
-
-# --- IMPORT MODULES MODULAR (OPTIONAL) ---
-try:
+with PROFILER.section("import", "macan_theme"):
+    try:
+        from macan_theme import get_theme_manager
+        THEME_AVAILABLE = True
+    except ImportError:
+        THEME_AVAILABLE = False
+        print("Warning: macan_theme.py not found. Using default dark theme.")
+
+with PROFILER.section("import", "macan_sampler/policy"):
+    from macan_sampler import (get_sampling_hub, METRIC_SYSTEM, METRIC_NET,
+                               METRIC_BATTERY)
+    from macan_policy import get_sampling_policy
+    from macan_history import (get_metric_store, configure_metric_store,
+                               RETENTION_24H, RETENTION_7D)
+
+# --- IMPORT MODULES MODULAR (OPTIONAL, DEFERRED) ---
+# Module opsional baru di-import saat pertama kali dipakai. Import ditulis
+# eksplisit di fungsi loader (bukan importlib + string) agar PyInstaller
+# tetap mendeteksi dan mem-bundle module tersebut.
+def _load_clock():
     from macan_clock import MacanClock
+    return MacanClock
+
+def _load_dock():
     from macan_dock import MacanDock
+    return MacanDock
+
+def _load_analog():
     from macan_analog import MacanAnalog
+    return MacanAnalog
+
+def _load_memo():
     from macan_memo import MacanMemo
-    from macan_task import MacanTask
+    return MacanMemo
+
+def _load_network():
     from macan_network import MacanNetwork
+    return MacanNetwork
+
+def _load_disk():
     from macan_disk import MacanDisk
+    return MacanDisk
+
+def _load_url():
     from macan_url import MacanURL
+    return MacanURL
+
+def _load_task():
+    from macan_task import MacanTask
+    return MacanTask
+
+def _load_history_view():
+    from macan_historyview import MetricHistoryWindow
+    return MetricHistoryWindow
+
+def _load_about_update():
     import macan_about_update
-    
-except ImportError as e:
-    MacanClock = None
-    MacanDock = None
-    MacanAnalog = None
-    MacanMemo = None
-    MacanTask = None
-    MacanNetwork = None
-    MacanDisk = None
-    MacanURL = None
-    macan_about_update = None
+    return macan_about_update
+
+_module_cache = {}
+
+def module_available(module_name):
+    """Cek keberadaan module tanpa meng-import-nya"""
+    if module_name not in _module_cache:
+        _module_cache[module_name] = importlib.util.find_spec(module_name) is not None
+    return _module_cache[module_name]
+
+def load_optional(module_name, loader):
+    """Jalankan loader (sekali import, berikutnya dari sys.modules); None jika gagal"""
+    if not module_available(module_name):
+        return None
+    try:
+        with PROFILER.section("import", module_name):
+            return loader()
+    except ImportError as e:
+        print(f"Warning: failed to import {module_name}: {e}")
+        _module_cache[module_name] = False
+        return None
 
 APP_NAME = "Macan Monitoring"
 ORG_NAME = "MacanAngkasa"
@@ -379,56 +436,6 @@ class MacanSidebar(QWidget):
 # BAGIAN: SYSTEM MONITORING UTAMA
 # ==========================================
 
-class SystemMonitor(QThread):
-    stats_signal = Signal(float, float, float, float, float, int, bool, bool) 
-
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.running = True  # Flag untuk mengontrol loop
-
-    def run(self):
-        last_net = psutil.net_io_counters()
-        # FIX: Ubah while True menjadi while self.running
-        while self.running:
-            try:
-                cpu = psutil.cpu_percent(interval=None)
-                ram = psutil.virtual_memory().percent
-                swap = psutil.swap_memory().percent
-
-                current_net = psutil.net_io_counters()
-                bytes_sent = current_net.bytes_sent - last_net.bytes_sent
-                bytes_recv = current_net.bytes_recv - last_net.bytes_recv
-                last_net = current_net
-                
-                batt = psutil.sensors_battery()
-                batt_percent = 0
-                batt_plugged = False
-                show_widget = True 
-                
-                if batt:
-                    batt_percent = int(batt.percent)
-                    batt_plugged = batt.power_plugged
-                else:
-                    batt_percent = -1 
-                    batt_plugged = True 
-
-                self.stats_signal.emit(cpu, ram, swap, float(bytes_recv), float(bytes_sent),
-                                       batt_percent, batt_plugged, show_widget)
-                
-                # FIX: Gunakan sleep yang bisa diinterupsi atau cek running setelah sleep
-                for _ in range(10): # Sleep 1 detik (10 x 0.1s) agar responsif saat stop
-                    if not self.running: break
-                    time.sleep(0.1)
-
-            except Exception as e:
-                print(f"Monitor error: {e}")
-                break
-    
-    def stop(self):
-        """Method untuk menghentikan thread secara aman"""
-        self.running = False
-        self.wait(3000)
-
 class NetworkInfoWorker(QThread):
     info_signal = Signal(str, str, str)
 
@@ -457,6 +464,7 @@ class NetworkInfoWorker(QThread):
             return
 
         try:
+            import urllib.request  # deferred: hanya dibutuhkan thread ini
             url = "https://api.ipify.org"
             with urllib.request.urlopen(url, timeout=4) as response:
                 public_ip = response.read().decode('utf-8')
@@ -617,6 +625,30 @@ class NetStat(QWidget):
         elif bytes_sec < 1024 * 1024: return f"{bytes_sec / 1024:.1f} KB/s"
         else: return f"{bytes_sec / (1024 * 1024):.1f} MB/s"
 
+# Key module -> (nama module, loader); module None = class di file ini
+MODULE_SPECS = {
+    "clock": ("macan_clock", _load_clock),
+    "dock": ("macan_dock", _load_dock),
+    "sidebar": (None, lambda: MacanSidebar),
+    "analog": ("macan_analog", _load_analog),
+    "memo": ("macan_memo", _load_memo),
+    "network": ("macan_network", _load_network),
+    "disk": ("macan_disk", _load_disk),
+    "url": ("macan_url", _load_url),
+}
+
+# Key module -> nama attribute di WidgetMonitor (settings key: show_<key>)
+MODULE_ATTRS = {
+    "clock": "clock_widget",
+    "dock": "dock_widget",
+    "sidebar": "sidebar_widget",
+    "analog": "analog_widget",
+    "memo": "memo_widget",
+    "network": "network_widget",
+    "disk": "disk_widget",
+    "url": "url_widget",
+}
+
 class WidgetMonitor(QWidget):
     def __init__(self):
         super().__init__()
@@ -629,29 +661,37 @@ class WidgetMonitor(QWidget):
         
         # Modules State placeholders
         self.task_window = None
+        self.history_window = None
 
-        # Load Modules
-        self.clock_widget = MacanClock() if MacanClock else None
-        self.dock_widget = MacanDock() if MacanDock else None
-        self.analog_widget = MacanAnalog() if MacanAnalog else None
-        self.memo_widget = MacanMemo() if MacanMemo else None
-        self.network_widget = MacanNetwork() if MacanNetwork else None
-        self.disk_widget = MacanDisk() if MacanDisk else None
-        self.url_widget = MacanURL() if MacanURL else None
-        self.sidebar_widget = MacanSidebar()
+        # Modules dibuat lazy lewat ensure_module(): hanya saat toggle_* atau
+        # saved state memintanya, sehingga module yang tidak dipakai tidak
+        # memakan memory dan tidak menjalankan thread/subscription.
+        for attr in MODULE_ATTRS.values():
+            setattr(self, attr, None)
         
         self.old_pos = None
         self.settings = QSettings(ORG_NAME, APP_NAME)
 
+        # History metrik di-mmap ke disk; harus dipilih sebelum module atau
+        # sampling hub pertama kali memakai get_metric_store()
+        configure_metric_store(self.settings.value("history_retention", RETENTION_24H, type=int))
+
         self.setup_ui()
         self.load_settings()
         self.load_module_states() 
         
         self._is_closing = False
 
-        self.monitor_thread = SystemMonitor(self)
-        self.monitor_thread.stats_signal.connect(self.update_stats)
-        self.monitor_thread.start()
+        # Semua metrik diambil oleh sampling hub bersama (lihat macan_sampler.py)
+        self.hub = get_sampling_hub()
+        self.store = get_metric_store()
+        self.hub.sample_ready.connect(self.on_sample)
+        self.hub.subscribe(self, (METRIC_SYSTEM, METRIC_NET, METRIC_BATTERY))
+
+        # Rate sampling mengikuti visibilitas widget & status session
+        # (modul lain mendaftar sendiri; toggle_*/close_or_hide cukup hide/show)
+        self.policy = get_sampling_policy()
+        self.policy.register(self)
 
         self.net_info_thread = NetworkInfoWorker(self)
         self.net_info_thread.info_signal.connect(self.update_network_info)
@@ -929,13 +969,42 @@ class WidgetMonitor(QWidget):
             self.analog_widget.update() # Triggers paintEvent
 
     # --- SLOTS & UPDATES ---
-    def update_stats(self, cpu, ram, swap, dl, ul, batt_pct, batt_plugged, show_widget):
+    def on_sample(self, sample):
+        if 'cpu' in sample:
+            self.update_stats(sample['cpu'], sample['ram'], sample['swap'])
+        if 'dl' in sample:
+            self.update_net(sample['dl'], sample['ul'])
+        self.update_history_tooltips()
+        if 'batt_percent' in sample:
+            self.update_battery(sample['batt_percent'], sample['batt_plugged'])
+        if 'tick_cost' in sample:
+            self.lbl_title.setToolTip(
+                f"Sampler: {sample['backend']} ({sample['tick_cost'] * 1e6:.0f} µs/tick)\n"
+                f"Jitter: {sample['jitter_mean'] * 1e3:.1f} ms avg / {sample['jitter_max'] * 1e3:.1f} ms max")
+
+    def update_stats(self, cpu, ram, swap):
         self.row_cpu.update_value(cpu)
         self.row_ram.update_value(ram)
         self.row_swap.update_value(swap)
+
+    def update_net(self, dl, ul):
         self.row_dl.update_speed(dl)
         self.row_ul.update_speed(ul)
-        
+
+    def update_history_tooltips(self):
+        """Tooltip ringkasan 1 menit terakhir dari metric store"""
+        for row, name in ((self.row_cpu, "cpu"), (self.row_ram, "ram"), (self.row_swap, "swap")):
+            series = self.store.get(name)
+            stats = series.stats(seconds=60) if series else None
+            if stats:
+                row.setToolTip(f"Last 1 min — min {stats[0]:.1f}% / avg {stats[2]:.1f}% / max {stats[1]:.1f}%")
+        for row, name in ((self.row_dl, "dl"), (self.row_ul, "ul")):
+            series = self.store.get(name)
+            stats = series.stats(seconds=60) if series else None
+            if stats:
+                row.setToolTip(f"Last 1 min — avg {row.format_speed(stats[2])} / max {row.format_speed(stats[1])}")
+
+    def update_battery(self, batt_pct, batt_plugged, show_widget=True):
         if show_widget:
             c = self.theme.get_colors() if self.theme else {
                 'accent_green': '#00ff00', 'accent_orange': '#ff9800', 'accent_red': '#ff5555', 'accent_cyan': '#00ffcc'
@@ -1009,20 +1078,21 @@ class WidgetMonitor(QWidget):
 
         menu.addSeparator()
         
-        for name, widget, method in [
-            ("Digital Clock", self.clock_widget, self.toggle_clock),
-            ("Analog Clock", self.analog_widget, self.toggle_analog),
-            ("App Dock", self.dock_widget, self.toggle_dock),
-            ("Sidebar Launcher", self.sidebar_widget, self.toggle_sidebar),
-            ("Memo / Sticky", self.memo_widget, self.toggle_memo),
-            ("Ext Network", self.network_widget, self.toggle_network),
-            ("Disk Info", self.disk_widget, self.toggle_disk),
-            ("URL / Search Bar", self.url_widget, self.toggle_url)
+        for name, key, method in [
+            ("Digital Clock", "clock", self.toggle_clock),
+            ("Analog Clock", "analog", self.toggle_analog),
+            ("App Dock", "dock", self.toggle_dock),
+            ("Sidebar Launcher", "sidebar", self.toggle_sidebar),
+            ("Memo / Sticky", "memo", self.toggle_memo),
+            ("Ext Network", "network", self.toggle_network),
+            ("Disk Info", "disk", self.toggle_disk),
+            ("URL / Search Bar", "url", self.toggle_url)
         ]:
-            if widget:
+            if self.module_is_available(key):
+                widget = getattr(self, MODULE_ATTRS[key])
                 act = QAction(f"Show {name}", self)
                 act.setCheckable(True)
-                act.setChecked(widget.isVisible())
+                act.setChecked(widget is not None and widget.isVisible())
                 act.triggered.connect(method)
                 menu.addAction(act)
 
@@ -1044,10 +1114,29 @@ class WidgetMonitor(QWidget):
         action_refresh.triggered.connect(self.refresh_network_info)
         menu.addAction(action_refresh)
 
+        history_menu = menu.addMenu("Metric History")
+        if self.theme:
+            history_menu.setStyleSheet(self.theme.get_menu_style())
+        current = self.settings.value("history_retention", RETENTION_24H, type=int)
+        group = QActionGroup(history_menu)
+        for label, seconds in [("Keep 24 Hours", RETENTION_24H),
+                               ("Keep 7 Days", RETENTION_7D),
+                               ("Off (memory only)", 0)]:
+            act = QAction(label, history_menu)
+            act.setCheckable(True)
+            act.setChecked(current == seconds)
+            act.triggered.connect(lambda _=False, s=seconds: self.set_history_retention(s))
+            group.addAction(act)
+            history_menu.addAction(act)
+        history_menu.addSeparator()
+        act_view = QAction("Show History...", history_menu)
+        act_view.triggered.connect(self.open_history_window)
+        history_menu.addAction(act_view)
+
         # ==========================================
         # BAGIAN BARU: UPDATE & ABOUT
         # ==========================================
-        if macan_about_update:
+        if module_available("macan_about_update"):
             # 1. Check for Updates
             action_update = QAction("Check for Updates...", self)
             action_update.triggered.connect(self.trigger_check_update)
@@ -1085,7 +1174,14 @@ class WidgetMonitor(QWidget):
 
         menu.exec(self.btn_settings.mapToGlobal(QPoint(0, self.btn_settings.height())))
 
+    def set_history_retention(self, seconds):
+        """Simpan retention history; file di-resize/migrasi saat start berikutnya"""
+        self.settings.setValue("history_retention", seconds)
+        QMessageBox.information(self, "Metric History",
+                                "History retention will be applied after restarting Macan Monitoring.")
+
     def trigger_check_update(self):
+        macan_about_update = load_optional("macan_about_update", _load_about_update)
         if macan_about_update:
             # Panggil fungsi helper dari modul, passing versi saat ini dan parent (self)
             macan_about_update.check_update_manual(APP_VERSION, self)
@@ -1093,6 +1189,7 @@ class WidgetMonitor(QWidget):
             QMessageBox.warning(self, "Error", "Module macan_about_update not found.")
 
     def trigger_about(self):
+        macan_about_update = load_optional("macan_about_update", _load_about_update)
         if macan_about_update:
             macan_about_update.show_about(APP_VERSION, self)
         else:
@@ -1104,39 +1201,76 @@ class WidgetMonitor(QWidget):
         self.show()
         self.save_settings()
 
+    def ensure_module(self, key):
+        """Return module widget, dibuat saat pertama kali dibutuhkan (lazy)"""
+        attr = MODULE_ATTRS[key]
+        widget = getattr(self, attr)
+        if widget is None:
+            module_name, loader = MODULE_SPECS[key]
+            factory = loader() if module_name is None else load_optional(module_name, loader)
+            if factory is None:
+                return None
+            with PROFILER.section("construct", factory.__name__):
+                widget = factory()
+            setattr(self, attr, widget)
+        return widget
+
+    def module_is_available(self, key):
+        module_name = MODULE_SPECS[key][0]
+        return module_name is None or module_available(module_name)
+
+    def set_module_visible(self, key, checked):
+        # Hide tidak perlu membuat module yang belum pernah dibangun
+        widget = self.ensure_module(key) if checked else getattr(self, MODULE_ATTRS[key])
+        if widget:
+            widget.setVisible(checked)
+        self.save_module_states()
+
     def toggle_clock(self, checked):
-        if self.clock_widget: self.clock_widget.setVisible(checked); self.save_module_states()
+        self.set_module_visible("clock", checked)
 
     def toggle_dock(self, checked):
-        if self.dock_widget: self.dock_widget.setVisible(checked); self.save_module_states()
+        self.set_module_visible("dock", checked)
     
     def toggle_sidebar(self, checked):
-        if self.sidebar_widget: self.sidebar_widget.setVisible(checked); self.save_module_states()
+        self.set_module_visible("sidebar", checked)
 
     def toggle_analog(self, checked):
-        if self.analog_widget: self.analog_widget.setVisible(checked); self.save_module_states()
+        self.set_module_visible("analog", checked)
 
     def toggle_memo(self, checked):
-        if self.memo_widget: self.memo_widget.setVisible(checked); self.save_module_states()
+        self.set_module_visible("memo", checked)
 
     def toggle_network(self, checked):
-        if self.network_widget: self.network_widget.setVisible(checked); self.save_module_states()
+        self.set_module_visible("network", checked)
 
     def toggle_disk(self, checked):
-        if self.disk_widget: self.disk_widget.setVisible(checked); self.save_module_states()
+        self.set_module_visible("disk", checked)
 
     def toggle_url(self, checked):
-        if self.url_widget: self.url_widget.setVisible(checked); self.save_module_states()
+        self.set_module_visible("url", checked)
 
     def open_task_manager(self):
+        MacanTask = load_optional("macan_task", _load_task)
         if MacanTask:
             if not self.task_window:
-                self.task_window = MacanTask(self)
+                with PROFILER.section("construct", "MacanTask"):
+                    self.task_window = MacanTask(self)
             self.task_window.show()
             self.task_window.raise_()
         else:
             QMessageBox.warning(self, "Error", "Module macan_task.py not found.")
 
+    def open_history_window(self):
+        MetricHistoryWindow = load_optional("macan_historyview", _load_history_view)
+        if MetricHistoryWindow:
+            if not self.history_window:
+                self.history_window = MetricHistoryWindow(self, self.theme)
+            self.history_window.show()
+            self.history_window.raise_()
+        else:
+            QMessageBox.warning(self, "Error", "Module macan_historyview.py not found.")
+
     def open_recycle_bin(self):
         try:
             os.system('start shell:RecycleBinFolder')
@@ -1229,24 +1363,18 @@ class WidgetMonitor(QWidget):
             return False
 
     def load_module_states(self):
-        if self.clock_widget and self.settings.value("show_clock", False, type=bool): self.clock_widget.show()
-        if self.dock_widget and self.settings.value("show_dock", False, type=bool): self.dock_widget.show()
-        if self.sidebar_widget and self.settings.value("show_sidebar", False, type=bool): self.sidebar_widget.show()
-        if self.analog_widget and self.settings.value("show_analog", False, type=bool): self.analog_widget.show()
-        if self.memo_widget and self.settings.value("show_memo", False, type=bool): self.memo_widget.show()
-        if self.network_widget and self.settings.value("show_network", False, type=bool): self.network_widget.show()
-        if self.disk_widget and self.settings.value("show_disk", False, type=bool): self.disk_widget.show()
-        if self.url_widget and self.settings.value("show_url", False, type=bool): self.url_widget.show()
+        # Hanya module yang tersimpan "show" yang dibangun saat startup
+        for key in MODULE_ATTRS:
+            if self.settings.value(f"show_{key}", False, type=bool):
+                widget = self.ensure_module(key)
+                if widget: widget.show()
 
     def save_module_states(self):
-        if self.clock_widget: self.settings.setValue("show_clock", self.clock_widget.isVisible())
-        if self.dock_widget: self.settings.setValue("show_dock", self.dock_widget.isVisible())
-        if self.sidebar_widget: self.settings.setValue("show_sidebar", self.sidebar_widget.isVisible())
-        if self.analog_widget: self.settings.setValue("show_analog", self.analog_widget.isVisible())
-        if self.memo_widget: self.settings.setValue("show_memo", self.memo_widget.isVisible())
-        if self.network_widget: self.settings.setValue("show_network", self.network_widget.isVisible())
-        if self.disk_widget: self.settings.setValue("show_disk", self.disk_widget.isVisible())
-        if self.url_widget: self.settings.setValue("show_url", self.url_widget.isVisible())
+        for key, attr in MODULE_ATTRS.items():
+            if not self.module_is_available(key):
+                continue
+            widget = getattr(self, attr)
+            self.settings.setValue(f"show_{key}", widget is not None and widget.isVisible())
 
     def load_settings(self):
         pos = self.settings.value("pos", QPoint(100, 100))
@@ -1272,8 +1400,8 @@ class WidgetMonitor(QWidget):
 
         # Stop threads — thread sudah ber-parent self, tapi kita stop manual
         # agar tidak ada emit ke widget yang sedang di-destroy
-        if hasattr(self, 'monitor_thread') and self.monitor_thread.isRunning():
-            self.monitor_thread.stop()
+        if hasattr(self, 'hub'):
+            self.hub.unsubscribe(self)
 
         if hasattr(self, 'net_info_thread') and self.net_info_thread.isRunning():
             self.net_info_thread.stop()
@@ -1281,13 +1409,22 @@ class WidgetMonitor(QWidget):
         # Tutup semua module widget
         for w in [self.clock_widget, self.dock_widget, self.sidebar_widget,
                   self.analog_widget, self.memo_widget, self.network_widget,
-                  self.disk_widget, self.url_widget, self.task_window]:
+                  self.disk_widget, self.url_widget, self.task_window,
+                  self.history_window]:
             if w is not None:
                 try:
                     w.close()
                 except Exception:
                     pass
 
+        # Hub berhenti terakhir, setelah semua module unsubscribe
+        if hasattr(self, 'hub') and self.hub.isRunning():
+            self.hub.stop()
+
+        # Store ditutup setelah hub berhenti (tidak ada append lagi)
+        if hasattr(self, 'store'):
+            self.store.close()
+
     def closeEvent(self, event):
         self._shutdown()
         event.accept()
@@ -1296,6 +1433,10 @@ class WidgetMonitor(QWidget):
         self._shutdown()
         QApplication.quit()
     
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        PROFILER.first_paint()
+
     def resizeEvent(self, event):
         if hasattr(self, 'sizegrip'):
             rect = self.geometry()
@@ -1320,6 +1461,7 @@ if __name__ == "__main__":
     app = QApplication(sys.argv)
     font = QFont("Segoe UI", 9)
     app.setFont(font)
-    window = WidgetMonitor()
+    with PROFILER.section("construct", "WidgetMonitor"):
+        window = WidgetMonitor()
     window.show()
     sys.exit(app.exec())
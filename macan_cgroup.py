@@ -0,0 +1,211 @@
+"""
+Macan Cgroup - Pembaca cgroup v2 (Linux) untuk Macan Task Manager
+File: macan_cgroup.py
+
+Tiga bagian:
+  read_proc_cgroup() - path cgroup v2 proses dari /proc/<pid>/cgroup (baris "0::")
+  cgroup_unit()      - path -> grup tampilan: container (docker/podman/
+                       containerd/cri-o/lxc) atau unit systemd terdalam
+                       (.service/.scope/.slice)
+  CgroupStats        - total CPU/memory per grup langsung dari cpu.stat &
+                       memory.current (satu read per grup, bukan per PID),
+                       plus CPU quota cgroup tempat Macan sendiri berjalan
+
+Hanya cgroup v2 (unified, termasuk mode hybrid); di host cgroup v1 murni
+atau selain Linux CGROUP_AVAILABLE = False dan semua fungsi return kosong.
+"""
+
+import os
+import re
+import sys
+import time
+from functools import lru_cache
+
+MB = 1024 * 1024
+
+# Komponen path yang menandai container: (pola, runtime). Id dipotong 12 karakter
+CONTAINER_PATTERNS = [
+    (re.compile(r"^docker-([0-9a-f]{12,})\.scope$"), "docker"),
+    (re.compile(r"^libpod-([0-9a-f]{12,})\.scope$"), "podman"),
+    (re.compile(r"^cri-containerd-([0-9a-f]{12,})\.scope$"), "containerd"),
+    (re.compile(r"^crio-([0-9a-f]{12,})\.scope$"), "cri-o"),
+    (re.compile(r"^lxc\.payload\.(.+)$"), "lxc"),
+]
+# Driver cgroupfs (bukan systemd): /docker/<id>
+CONTAINER_PARENTS = {"docker": "docker", "libpod_parent": "podman"}
+CONTAINER_ID = re.compile(r"^[0-9a-f]{12,}$")
+UNIT_SUFFIXES = (".service", ".scope", ".slice")
+ROOT_LABEL = "/ (root cgroup)"
+
+
+def cgroup2_root(mountinfo="/proc/self/mountinfo"):
+    """Mount point cgroup2; None bila tidak ada (cgroup v1 murni / bukan Linux)"""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        with open(mountinfo, "rb") as f:
+            for line in f:
+                left, _, right = line.partition(b" - ")
+                if right.split(b" ", 1)[0] == b"cgroup2":
+                    return left.split()[4].decode("utf-8", "replace")
+    except (OSError, IndexError):
+        pass
+    return None
+
+
+CGROUP_ROOT = cgroup2_root()
+CGROUP_AVAILABLE = CGROUP_ROOT is not None
+
+
+def read_proc_cgroup(pid_dir):
+    """Path cgroup v2 proses dari <pid_dir>/cgroup; "" bila tidak ada/tidak bisa dibaca"""
+    try:
+        fd = os.open(pid_dir + "/cgroup", os.O_RDONLY)
+        try:
+            data = os.read(fd, 4096)
+        finally:
+            os.close(fd)
+    except OSError:
+        return ""
+    for line in data.split(b"\n"):
+        if line.startswith(b"0::"):
+            return line[3:].decode("utf-8", "replace")
+    return ""
+
+
+def unescape_unit(name):
+    # systemd meng-escape karakter di nama unit: "foo\x2dbar" -> "foo-bar"
+    return re.sub(r"\\x([0-9a-fA-F]{2})", lambda m: chr(int(m.group(1), 16)), name)
+
+
+@lru_cache(maxsize=4096)
+def cgroup_unit(path):
+    """
+    (key, label) grup untuk path cgroup proses. key = path direktori cgroup
+    grup tsb (tempat cpu.stat/memory.current dibaca). Container menang atas
+    unit systemd; tanpa unit sama sekali key = path itu sendiri.
+    """
+    if not path:
+        return "", "(no cgroup)"
+    parts = [part for part in path.split("/") if part]
+    if not parts:
+        return "/", ROOT_LABEL
+    unit = None
+    for i, part in enumerate(parts):
+        for pattern, runtime in CONTAINER_PATTERNS:
+            match = pattern.match(part)
+            if match:
+                return "/" + "/".join(parts[:i + 1]), f"{runtime} {match.group(1)[:12]}"
+        if i and parts[i - 1] in CONTAINER_PARENTS and CONTAINER_ID.match(part):
+            return "/" + "/".join(parts[:i + 1]), f"{CONTAINER_PARENTS[parts[i - 1]]} {part[:12]}"
+        if part.endswith(UNIT_SUFFIXES):
+            unit = i
+    if unit is None:
+        return "/" + "/".join(parts), parts[-1]
+    return "/" + "/".join(parts[:unit + 1]), unescape_unit(parts[unit])
+
+
+def read_usage_usec(cgroup_dir):
+    """usage_usec kumulatif dari cpu.stat; None bila tidak bisa dibaca"""
+    try:
+        with open(cgroup_dir + "/cpu.stat", "rb") as f:
+            for line in f:
+                if line.startswith(b"usage_usec "):
+                    return int(line[11:])
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def read_memory_mb(cgroup_dir):
+    """memory.current (MB, termasuk page cache); None di root cgroup / tanpa controller memory"""
+    try:
+        with open(cgroup_dir + "/memory.current", "rb") as f:
+            return int(f.read()) / MB
+    except (OSError, ValueError):
+        return None
+
+
+def cpu_quota(root=CGROUP_ROOT, own_path=None, cpu_count=None):
+    """
+    (cores, path) CPU quota cgroup tempat Macan berjalan: cpu.max terkecil
+    di sepanjang path ke root, dibatasi jumlah CPU affinity. `path` = cgroup
+    pemilik quota (cpu.stat-nya mengukur pemakaian). None bila tidak dibatasi.
+    """
+    if root is None:
+        return None
+    if own_path is None:
+        own_path = read_proc_cgroup("/proc/self")
+    if cpu_count is None:
+        try:
+            cpu_count = len(os.sched_getaffinity(0))
+        except (AttributeError, OSError):
+            cpu_count = os.cpu_count() or 1
+    parts = [part for part in own_path.split("/") if part]
+    best = None
+    for depth in range(len(parts), -1, -1):
+        path = "/" + "/".join(parts[:depth])
+        try:
+            with open(os.path.join(root, *parts[:depth], "cpu.max"), "rb") as f:
+                quota, period = f.read().split()[:2]
+        except (OSError, ValueError):
+            continue
+        if quota == b"max":
+            continue
+        cores = int(quota) / int(period)
+        if best is None or cores < best[0]:
+            best = (cores, path)
+    if best is None or best[0] >= cpu_count:
+        return None
+    return best
+
+
+class CgroupStats:
+    """
+    CPU% & memory per cgroup dari file cgroup v2. CPU% = delta usage_usec / dt
+    dengan skala yang sama dengan kolom proses (100 = satu core penuh), jadi
+    total grup sebanding dengan jumlah member-nya. Baseline hanya disimpan
+    untuk path yang dibaca pada panggilan terakhir.
+    """
+
+    def __init__(self, root=CGROUP_ROOT, own_path=None):
+        self.root = root
+        self.quota = cpu_quota(root, own_path) if root is not None else None
+        self._prev = {}  # path -> (timestamp, usage_usec)
+        self._quota_prev = None
+
+    def read(self, paths, now=None):
+        """{path: {"cpu": %, "mem": MB}}; field yang tidak bisa dibaca tidak ada"""
+        if self.root is None:
+            return {}
+        now = time.monotonic() if now is None else now
+        stats, fresh = {}, {}
+        for path in paths:
+            cgroup_dir = self.root + path.rstrip("/")
+            out = {}
+            usage = read_usage_usec(cgroup_dir)
+            if usage is not None:
+                fresh[path] = (now, usage)
+                prev = self._prev.get(path)
+                if prev is not None and now > prev[0]:
+                    out["cpu"] = round(max(usage - prev[1], 0) / 1e4 / (now - prev[0]), 1)
+            mem = read_memory_mb(cgroup_dir)
+            if mem is not None:
+                out["mem"] = mem
+            if out:
+                stats[path] = out
+        self._prev = fresh
+        return stats
+
+    def read_quota(self, now=None):
+        """{"cpu": % dari quota, "cores": quota} untuk cgroup Macan sendiri; None bila tanpa quota"""
+        if self.quota is None:
+            return None
+        cores, path = self.quota
+        now = time.monotonic() if now is None else now
+        usage = read_usage_usec(self.root + path.rstrip("/"))
+        prev, self._quota_prev = self._quota_prev, (now, usage)
+        if usage is None or prev is None or prev[1] is None or now <= prev[0]:
+            return None
+        cpu = max(usage - prev[1], 0) / 1e4 / (now - prev[0])
+        return {"cpu": min(cpu / cores, 100.0), "cores": cores}
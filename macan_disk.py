@@ -1,14 +1,15 @@
 import sys
-import psutil
-import time
 import os
 import shutil
 from PySide6.QtWidgets import (QApplication, QWidget, QVBoxLayout, QHBoxLayout, 
                                QLabel, QProgressBar, QPushButton, QMenu, QFrame, 
                                QSizeGrip, QScrollArea, QMessageBox)
-from PySide6.QtCore import Qt, QThread, Signal, QPoint, QSettings, QSize
+from PySide6.QtCore import Qt, QPoint, QSettings, QSize
 from PySide6.QtGui import QAction, QFont
 
+from macan_sampler import get_sampling_hub, METRIC_DISK
+from macan_policy import get_sampling_policy
+
 # --- IMPORT THEME MANAGER ---
 try:
     from macan_theme import get_theme_manager
@@ -19,56 +20,6 @@ except ImportError:
 APP_NAME = "Macan Disk Info"
 ORG_NAME = "MacanAngkasa"
 
-# --- WORKER: DISK MONITOR ---
-class DiskWorker(QThread):
-    stats_signal = Signal(list)
-
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self._running = True
-
-    def run(self):
-        while self._running:
-            disk_data = []
-            try:
-                partitions = psutil.disk_partitions(all=False)
-                for p in partitions:
-                    if not self._running:
-                        return
-                    try:
-                        if 'cdrom' in p.opts or p.fstype == '':
-                            continue
-                        usage = psutil.disk_usage(p.mountpoint)
-                        name = p.mountpoint
-                        if name.endswith('\\'): name = name[:-1]
-                        disk_data.append({
-                            'name': name,
-                            'device': p.device,
-                            'total': usage.total,
-                            'free': usage.free,
-                            'used': usage.used,
-                            'percent': usage.percent
-                        })
-                    except PermissionError:
-                        continue
-
-                if self._running:
-                    self.stats_signal.emit(disk_data)
-
-                # Sleep interruptible 5 detik
-                for _ in range(50):
-                    if not self._running:
-                        return
-                    time.sleep(0.1)
-
-            except Exception as e:
-                print(f"Disk monitor error: {e}")
-                break
-
-    def stop(self):
-        self._running = False
-        self.wait(3000)
-
 # --- UI COMPONENT: DISK BAR ---
 class DiskBar(QWidget):
     def __init__(self, drive_name, theme_manager=None):
@@ -172,9 +123,10 @@ class MacanDisk(QWidget):
         self.setup_ui()
         self.load_settings()
 
-        self.worker = DiskWorker(self)
-        self.worker.stats_signal.connect(self.update_ui)
-        self.worker.start()
+        self.hub = get_sampling_hub()
+        self.hub.sample_ready.connect(self.on_sample)
+        self.hub.subscribe(self, (METRIC_DISK,))
+        get_sampling_policy().register(self)
 
     def setup_ui(self):
         self.container = QFrame()
@@ -287,6 +239,10 @@ class MacanDisk(QWidget):
                 QPushButton:disabled { color: #555; background: transparent; border-color: transparent; }
             """)
 
+    def on_sample(self, sample):
+        if 'disks' in sample:
+            self.update_ui(sample['disks'])
+
     def update_ui(self, disk_data_list):
         present_drives = []
         
@@ -400,8 +356,8 @@ class MacanDisk(QWidget):
 
     def closeEvent(self, event):
         self.save_settings()
-        if hasattr(self, 'worker') and self.worker.isRunning():
-            self.worker.stop()
+        if hasattr(self, 'hub'):
+            self.hub.unsubscribe(self)
         event.accept()
 
     def mousePressEvent(self, event):
@@ -424,4 +380,4 @@ if __name__ == "__main__":
     app.setFont(font)
     w = MacanDisk()
     w.show()
-    sys.exit(app.exec())
\ No newline at end of file
+    sys.exit(app.exec())
\ No newline at end of file
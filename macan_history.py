@@ -0,0 +1,614 @@
+"""
+Macan History - Time-series store untuk metrik live Macan Monitoring
+File: macan_history.py
+
+Setiap metrik (cpu, ram, swap, dl, ul, disk:<mount>) punya satu RingSeries:
+dua kolom float64 (timestamp & value) yang dialokasikan sekali di depan,
+append O(1), dan statistik window (min/max/mean) yang di-vectorize dengan
+NumPy bila tersedia. Graph, alert dan export membaca langsung dari buffer.
+
+PersistentMetricStore menyimpan series yang sama ke file fixed-record yang
+di-mmap (satu file per metrik), sehingga history bertahan setelah restart:
+file cukup di-map ulang tanpa parsing.
+
+ProcessHistoryPool menyimpan history CPU/memory per proses untuk sparkline
+MacanTask dalam satu pool slot preallocated (ukuran tetap).
+"""
+
+import os
+import re
+import mmap
+import time
+import zlib
+import struct
+import threading
+from array import array
+from bisect import bisect_left
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+DEFAULT_CAPACITY = 3600  # 1 jam pada interval 1 detik
+
+METRIC_NAMES = ("cpu", "ram", "swap", "dl", "ul")
+DISK_PREFIX = "disk:"
+
+# --- PERSISTENT HISTORY ---
+RETENTION_24H = 24 * 3600
+RETENTION_7D = 7 * 24 * 3600
+RETENTION_OPTIONS = (RETENTION_24H, RETENTION_7D)
+DISK_PERIOD = 5.0        # Sama dengan interval default METRIC_DISK di sampler
+FLUSH_INTERVAL = 60.0    # msync berkala; crash proses tidak butuh flush
+
+HISTORY_EXT = ".mhist"
+HISTORY_MAGIC = b"MCNHIST1"
+HISTORY_VERSION = 1
+# magic, version, capacity, nama metrik (utf-8, padded)
+HEADER_STATIC = struct.Struct("<8sII48s")
+# Dua slot commit bergantian: seq, head, count, crc32
+HEADER_SLOT = struct.Struct("<QQQI4x")
+SLOT_OFFSETS = (HEADER_STATIC.size, HEADER_STATIC.size + HEADER_SLOT.size)
+HEADER_SIZE = 128
+
+# --- PROCESS HISTORY ---
+PROCESS_HISTORY_SAMPLES = 150   # 5 menit pada interval ProcessWorker 2 detik
+PROCESS_HISTORY_SLOTS = 4096    # Maks proses yang dilacak sekaligus
+
+
+def make_buffer(n):
+    """Buffer float preallocated untuk RingSeries.latest()"""
+    return np.zeros(n) if NUMPY_AVAILABLE else [0.0] * n
+
+
+class RingSeries:
+    """
+    Ring buffer kolumnar (timestamp, value). `storage` adalah buffer mentah
+    (bytearray default, atau mmap); layout mulai `offset`: ts[capacity] lalu
+    values[capacity].
+    """
+
+    def __init__(self, capacity=DEFAULT_CAPACITY, storage=None, offset=0):
+        self.capacity = capacity
+        self._storage = storage if storage is not None else bytearray(capacity * 16)
+        view = memoryview(self._storage)
+        self.ts = view[offset:offset + capacity * 8].cast('d')
+        self.values = view[offset + capacity * 8:offset + capacity * 16].cast('d')
+        if NUMPY_AVAILABLE:
+            # View tanpa copy ke buffer yang sama
+            self.np_ts = np.frombuffer(self._storage, dtype=np.float64,
+                                       count=capacity, offset=offset)
+            self.np_values = np.frombuffer(self._storage, dtype=np.float64,
+                                           count=capacity, offset=offset + capacity * 8)
+        self.head = 0   # index tulis berikutnya
+        self.count = 0  # jumlah sample valid
+        self.max_count = capacity
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return self.count
+
+    def append(self, t, value):
+        with self._lock:
+            if self.count:
+                # Timestamp dijaga monoton naik (bisect/searchsorted), juga
+                # bila jam sistem mundur di antara dua sesi
+                t = max(t, self.ts[(self.head - 1) % self.capacity])
+            self.ts[self.head] = t
+            self.values[self.head] = value
+            self.head = (self.head + 1) % self.capacity
+            if self.count < self.max_count:
+                self.count += 1
+            self._commit()
+
+    def _commit(self):
+        """Hook setelah append (MappedSeries: tulis header)"""
+        pass
+
+    def chronological(self):
+        """Copy (ts, values) kronologis sebagai dua list; untuk migrasi/export"""
+        with self._lock:
+            ts, values = [], []
+            for a, b in self._segments(self.count):
+                ts.extend(self.ts[a:b])
+                values.extend(self.values[a:b])
+            return ts, values
+
+    def last(self):
+        """Return (timestamp, value) terakhir atau None"""
+        with self._lock:
+            if not self.count:
+                return None
+            i = (self.head - 1) % self.capacity
+            return self.ts[i], self.values[i]
+
+    def _segments(self, n):
+        """Range index (start, stop) kronologis untuk n sample terakhir (maks 2 segmen)"""
+        n = min(n, self.count)
+        if n <= 0:
+            return []
+        start = (self.head - n) % self.capacity
+        if start + n <= self.capacity:
+            return [(start, start + n)]
+        return [(start, self.capacity), (0, self.head)]
+
+    def _count_since(self, since):
+        """Jumlah sample dengan timestamp >= since (timestamp monoton naik)"""
+        total = 0
+        for start, stop in reversed(self._segments(self.count)):
+            if NUMPY_AVAILABLE:
+                idx = int(np.searchsorted(self.np_ts[start:stop], since, side='left')) + start
+            else:
+                idx = bisect_left(self.ts, since, start, stop)
+            total += stop - idx
+            if idx > start:
+                break
+        return total
+
+    def _views(self, n, seconds, now):
+        if seconds is not None:
+            now = time.time() if now is None else now
+            n = self._count_since(now - seconds)
+        elif n is None:
+            n = self.count
+        ts, values = (self.np_ts, self.np_values) if NUMPY_AVAILABLE else (self.ts, self.values)
+        return [(ts[a:b], values[a:b]) for a, b in self._segments(n)]
+
+    def segments(self, n=None, seconds=None, now=None):
+        """
+        View kronologis (tanpa copy) untuk n sample terakhir atau `seconds`
+        terakhir. Return list berisi (ts_view, value_view), maks 2 segmen.
+        """
+        with self._lock:
+            return self._views(n, seconds, now)
+
+    def latest(self, n, out):
+        """
+        Isi `out` (panjang n, preallocated) dengan n value terakhir secara
+        kronologis; bagian depan diisi 0 bila sample belum cukup.
+        """
+        with self._lock:
+            segs = self._segments(n)
+            filled = sum(b - a for a, b in segs)
+            pos = n - filled
+            for i in range(pos):
+                out[i] = 0.0
+            for a, b in segs:
+                out[pos:pos + (b - a)] = (self.np_values if NUMPY_AVAILABLE else self.values)[a:b]
+                pos += b - a
+        return out
+
+    def recent(self, seconds, now=None):
+        """Copy (ts, values) kronologis untuk sample `seconds` terakhir sebelum `now`"""
+        now = time.time() if now is None else now
+        with self._lock:
+            ts, values = [], []
+            for a, b in self._segments(self._count_since(now - seconds)):
+                ts.extend(self.ts[a:b])
+                values.extend(self.values[a:b])
+            return ts, values
+
+    def binned(self, seconds, out, now=None):
+        """
+        Isi `out` (panjang n, preallocated) dengan rata-rata value per bucket:
+        `seconds` terakhir sebelum `now` dibagi n bucket sama lebar. Bucket
+        tanpa sample (app tidak jalan, sampling di-pause) diisi NaN = celah.
+        """
+        now = time.time() if now is None else now
+        n = len(out)
+        start = now - seconds
+        width = seconds / n
+        with self._lock:
+            views = self._views(None, seconds, now)
+            if NUMPY_AVAILABLE:
+                sums = np.zeros(n)
+                counts = np.zeros(n)
+                for ts, values in views:
+                    idx = np.clip(((ts - start) / width).astype(np.intp), 0, n - 1)
+                    sums += np.bincount(idx, weights=values, minlength=n)
+                    counts += np.bincount(idx, minlength=n)
+                with np.errstate(invalid="ignore"):
+                    out[:] = sums / counts  # 0/0 = NaN
+                return out
+            sums = [0.0] * n
+            counts = [0] * n
+            for ts, values in views:
+                for t, v in zip(ts, values):
+                    i = min(max(int((t - start) / width), 0), n - 1)
+                    sums[i] += v
+                    counts[i] += 1
+        for i in range(n):
+            out[i] = sums[i] / counts[i] if counts[i] else float("nan")
+        return out
+
+    def stats(self, seconds=None, n=None, now=None):
+        """Return (min, max, mean) untuk window; None bila kosong"""
+        with self._lock:
+            values = [v for _, v in self._views(n, seconds, now) if len(v)]
+            if not values:
+                return None
+            if NUMPY_AVAILABLE:
+                lo = min(float(v.min()) for v in values)
+                hi = max(float(v.max()) for v in values)
+                total = sum(float(v.sum()) for v in values)
+            else:
+                lo = min(min(v) for v in values)
+                hi = max(max(v) for v in values)
+                total = sum(sum(v) for v in values)
+            return lo, hi, total / sum(len(v) for v in values)
+
+
+class MappedSeries(RingSeries):
+    """
+    RingSeries di atas file mmap: header 128 byte lalu kolom ts & values.
+
+    Header punya dua slot (seq, head, count, crc32) yang ditulis bergantian
+    setelah data record ditulis. Saat dibuka, slot valid dengan seq tertinggi
+    yang dipakai, jadi write yang terpotong (crash di tengah append) paling
+    banyak kehilangan sample terakhir, bukan seluruh file.
+
+    Maks capacity - 1 sample: entry di `head` tidak pernah tercakup slot
+    yang sudah di-commit, jadi append menulis data di luar range slot itu
+    dan slot hanya pernah menunjuk data yang sudah lengkap ditulis.
+    """
+
+    def __init__(self, path, name, capacity):
+        self.path = path
+        self.name = name
+        size = HEADER_SIZE + capacity * 16
+        migrated = self._prepare_file(path, name, capacity, size)
+
+        self._file = open(path, "r+b")
+        self._mm = mmap.mmap(self._file.fileno(), size)
+        super().__init__(capacity, storage=self._mm, offset=HEADER_SIZE)
+        self.max_count = capacity - 1
+
+        self._static = HEADER_STATIC.pack(HISTORY_MAGIC, HISTORY_VERSION, capacity,
+                                          name.encode("utf-8")[:48])
+        if migrated is None:
+            self._seq, self.head, self.count = self._read_slots()
+            # File lama bisa penuh sampai capacity; sample tertua dilepas
+            self.count = min(self.count, self.max_count)
+        else:
+            self._seq = 0
+            self._mm[:HEADER_STATIC.size] = self._static
+            for t, v in zip(*migrated):
+                RingSeries.append(self, t, v)
+
+    @staticmethod
+    def read_header(path):
+        """Return (capacity, name) dari header file, atau None bila bukan file history"""
+        try:
+            with open(path, "rb") as f:
+                magic, version, capacity, name = HEADER_STATIC.unpack(f.read(HEADER_STATIC.size))
+        except (OSError, struct.error):
+            return None
+        if magic != HISTORY_MAGIC or version != HISTORY_VERSION:
+            return None
+        return capacity, name.rstrip(b"\0").decode("utf-8", "replace")
+
+    def _prepare_file(self, path, name, capacity, size):
+        """
+        Siapkan file berukuran tepat. Return None bila file lama bisa di-map
+        apa adanya, atau (ts, values) untuk ditulis ulang (file baru/migrasi).
+        """
+        header = self.read_header(path) if os.path.exists(path) else None
+        if header is not None and header[0] == capacity and os.path.getsize(path) == size:
+            return None
+
+        data = ([], [])
+        if header is not None and os.path.getsize(path) == HEADER_SIZE + header[0] * 16:
+            # Retention berubah: salin sample terakhir ke kapasitas baru
+            try:
+                old = MappedSeries(path, name, header[0])
+                data = old.chronological()
+                old.close()
+            except Exception as e:
+                print(f"History migrate error ({name}): {e}")
+        elif os.path.exists(path):
+            print(f"History file invalid, recreated: {path}")
+
+        with open(path, "wb") as f:
+            f.truncate(size)  # sparse: halaman kosong tidak memakan disk
+        return data[0][-capacity:], data[1][-capacity:]
+
+    def _slot_crc(self, seq, head, count):
+        return zlib.crc32(self._static + struct.pack("<QQQ", seq, head, count))
+
+    def _read_slots(self):
+        best = (0, 0, 0)
+        for offset in SLOT_OFFSETS:
+            seq, head, count, crc = HEADER_SLOT.unpack_from(self._mm, offset)
+            if crc != self._slot_crc(seq, head, count):
+                continue
+            if head >= self.capacity or count > self.capacity:
+                continue
+            if seq > best[0]:
+                best = (seq, head, count)
+        return best
+
+    def _commit(self):
+        self._seq += 1
+        HEADER_SLOT.pack_into(self._mm, SLOT_OFFSETS[self._seq % 2], self._seq,
+                              self.head, self.count,
+                              self._slot_crc(self._seq, self.head, self.count))
+
+    def flush(self):
+        with self._lock:
+            if not self._mm.closed:
+                self._mm.flush()
+
+    def close(self):
+        """Lepas semua view lalu tutup mmap & file"""
+        with self._lock:
+            if self._mm.closed:
+                return
+            self._mm.flush()
+            self.ts.release()
+            self.values.release()
+            if NUMPY_AVAILABLE:
+                del self.np_ts, self.np_values
+            try:
+                self._mm.close()
+            except BufferError:
+                pass  # Masih ada view aktif di luar; ditutup saat GC
+            self._file.close()
+
+
+class MetricStore:
+    """Kumpulan RingSeries per nama metrik, dibuat saat pertama kali di-append"""
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        self.capacity = capacity
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def series(self, name):
+        s = self._series.get(name)
+        if s is None:
+            with self._lock:
+                s = self._series.get(name)
+                if s is None:
+                    s = self._create_series(name)
+                    self._series[name] = s
+        return s
+
+    def _create_series(self, name):
+        return RingSeries(self.capacity)
+
+    def get(self, name):
+        """Series yang sudah ada atau None (tanpa membuat baru)"""
+        return self._series.get(name)
+
+    def names(self):
+        return list(self._series)
+
+    def append(self, name, t, value):
+        self.series(name).append(t, value)
+
+    def append_sample(self, sample, t=None):
+        """Simpan semua metrik numerik dari satu sample hub"""
+        t = time.time() if t is None else t
+        for name in METRIC_NAMES:
+            if name in sample:
+                self.series(name).append(t, sample[name])
+        for disk in sample.get('disks', ()):
+            self.series(DISK_PREFIX + disk['name']).append(t, disk['percent'])
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class PersistentMetricStore(MetricStore):
+    """
+    MetricStore dengan satu MappedSeries per metrik di `directory`.
+    Kapasitas = retention / periode sampling, jadi file berukuran tetap.
+    File yang sudah ada langsung di-map saat store dibuat.
+    """
+
+    def __init__(self, directory, retention=RETENTION_24H):
+        super().__init__()
+        self.directory = directory
+        self.retention = retention
+        self._last_flush = time.monotonic()
+        self._paths = {}  # nama metrik -> file yang sudah ada
+        os.makedirs(directory, exist_ok=True)
+
+        for entry in sorted(os.listdir(directory)):
+            if not entry.endswith(HISTORY_EXT):
+                continue
+            header = MappedSeries.read_header(os.path.join(directory, entry))
+            if header is None:
+                continue
+            self._paths[header[1]] = os.path.join(directory, entry)
+            try:
+                self.series(header[1])
+            except Exception as e:
+                print(f"History load error ({entry}): {e}")
+
+    def capacity_for(self, name):
+        period = DISK_PERIOD if name.startswith(DISK_PREFIX) else 1.0
+        return max(2, int(self.retention / period))
+
+    def path_for(self, name):
+        if name in self._paths:
+            return self._paths[name]
+        # Nama metrik bisa berisi path mount; tambah crc agar tetap unik
+        safe = re.sub(r"[^\w.-]", "_", name)
+        return os.path.join(self.directory,
+                            f"{safe}-{zlib.crc32(name.encode('utf-8')):08x}{HISTORY_EXT}")
+
+    def _create_series(self, name):
+        return MappedSeries(self.path_for(name), name, self.capacity_for(name))
+
+    def append_sample(self, sample, t=None):
+        super().append_sample(sample, t)
+        if time.monotonic() - self._last_flush >= FLUSH_INTERVAL:
+            self.flush()
+
+    def flush(self):
+        self._last_flush = time.monotonic()
+        for s in list(self._series.values()):
+            try:
+                s.flush()
+            except Exception as e:
+                print(f"History flush error: {e}")
+
+    def close(self):
+        for s in list(self._series.values()):
+            s.close()
+
+
+class ProcessHistoryPool:
+    """
+    History CPU/memory per proses dalam satu buffer float32 yang dialokasikan
+    sekali: matriks slot x sample per metrik. Proses baru mengambil slot dari
+    free list, proses yang exit mengembalikannya, jadi memory tetap sama
+    berapa pun churn proses. Semua slot berbagi satu kolom tulis (tick()),
+    sehingga satu siklus worker = satu kolom; tiap slot mencatat tick saat
+    dialokasikan untuk tahu berapa sample yang valid. Bila slot habis, proses
+    baru tidak punya history sampai ada slot kosong.
+    """
+
+    def __init__(self, slots=PROCESS_HISTORY_SLOTS, samples=PROCESS_HISTORY_SAMPLES):
+        self.slots = slots
+        self.samples = samples
+        size = slots * samples
+        # Layout: cpu[slots*samples], mem[slots*samples], cur_cpu[slots], cur_mem[slots]
+        self._storage = bytearray((size + slots) * 2 * 4)
+        view = memoryview(self._storage).cast('f')
+        self.cpu = view[:size]
+        self.mem = view[size:2 * size]
+        self.cur_cpu = view[2 * size:2 * size + slots]
+        self.cur_mem = view[2 * size + slots:]
+        if NUMPY_AVAILABLE:
+            flat = np.frombuffer(self._storage, dtype=np.float32)
+            self.np_cpu = flat[:size].reshape(slots, samples)
+            self.np_mem = flat[size:2 * size].reshape(slots, samples)
+            self.np_cur_cpu = flat[2 * size:2 * size + slots]
+            self.np_cur_mem = flat[2 * size + slots:]
+        self._born = array('q', bytes(8 * slots))  # tick saat slot dialokasikan
+        self._free = list(range(slots - 1, -1, -1))
+        self._slot_of = {}   # pid -> slot
+        self._ctime_of = {}  # pid -> ctime (PID daur ulang = proses baru)
+        self.ticks = 0
+
+    def __len__(self):
+        return len(self._slot_of)
+
+    def _track(self, record):
+        pid = record["pid"]
+        slot = self._slot_of.get(pid)
+        if slot is not None and self._ctime_of[pid] != record["ctime"]:
+            self._release(pid)
+            slot = None
+        if slot is None:
+            if not self._free:
+                return
+            slot = self._free.pop()
+            self._slot_of[pid] = slot
+            self._ctime_of[pid] = record["ctime"]
+            self._born[slot] = self.ticks
+        self.cur_cpu[slot] = record["cpu"]
+        self.cur_mem[slot] = record["mem"]
+
+    def _release(self, pid):
+        slot = self._slot_of.pop(pid, None)
+        if slot is not None:
+            del self._ctime_of[pid]
+            self._free.append(slot)
+
+    def apply_delta(self, delta):
+        """Update nilai terkini dari delta ProcessWorker (lihat macan_task.py)"""
+        if delta["full"]:
+            incoming = {d["pid"] for d in delta["added"]}
+            for pid in [pid for pid in self._slot_of if pid not in incoming]:
+                self._release(pid)
+        for pid in delta["removed"]:
+            self._release(pid)
+        for pid, diff in delta["changed"].items():
+            slot = self._slot_of.get(pid)
+            if slot is not None:
+                if "cpu" in diff:
+                    self.cur_cpu[slot] = diff["cpu"]
+                if "mem" in diff:
+                    self.cur_mem[slot] = diff["mem"]
+        for record in delta["added"]:
+            self._track(record)
+
+    def tick(self):
+        """Tulis nilai terkini semua slot ke kolom berikutnya (satu per siklus worker)"""
+        col = self.ticks % self.samples
+        if NUMPY_AVAILABLE:
+            # Slot kosong ikut ditulis; lebih murah daripada indexing per slot
+            self.np_cpu[:, col] = self.np_cur_cpu
+            self.np_mem[:, col] = self.np_cur_mem
+        else:
+            samples = self.samples
+            for slot in self._slot_of.values():
+                self.cpu[slot * samples + col] = self.cur_cpu[slot]
+                self.mem[slot * samples + col] = self.cur_mem[slot]
+        self.ticks += 1
+
+    def history(self, pid):
+        """Return (cpu, mem) kronologis untuk pid (list float), atau None"""
+        slot = self._slot_of.get(pid)
+        if slot is None:
+            return None
+        n = min(self.ticks - self._born[slot], self.samples)
+        if n <= 0:
+            return None
+        base = slot * self.samples
+        start = (self.ticks - n) % self.samples
+        if start + n <= self.samples:
+            ranges = [(base + start, base + start + n)]
+        else:
+            ranges = [(base + start, base + self.samples),
+                      (base, base + start + n - self.samples)]
+        cpu, mem = [], []
+        for a, b in ranges:
+            cpu.extend(self.cpu[a:b])
+            mem.extend(self.mem[a:b])
+        return cpu, mem
+
+
+def default_history_dir():
+    """Folder data per-user: %LOCALAPPDATA% di Windows, XDG_DATA_HOME di Linux"""
+    if os.name == "nt":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+    else:
+        base = os.environ.get("XDG_DATA_HOME") or os.path.expanduser("~/.local/share")
+    return os.path.join(base, "MacanAngkasa", "history")
+
+
+_store_instance = None
+
+def configure_metric_store(retention=None, directory=None):
+    """
+    Pilih jenis store sebelum get_metric_store() pertama kali dipanggil.
+    retention None/0 = hanya di memory; selain itu history disimpan ke disk.
+    """
+    global _store_instance
+    if _store_instance is not None:
+        print("History: metric store already created, configuration ignored")
+        return _store_instance
+    if retention:
+        try:
+            _store_instance = PersistentMetricStore(directory or default_history_dir(), retention)
+        except Exception as e:
+            print(f"History disabled, using memory store: {e}")
+    if _store_instance is None:
+        _store_instance = MetricStore()
+    return _store_instance
+
+def get_metric_store():
+    """Get global metric store instance (Singleton)"""
+    global _store_instance
+    if _store_instance is None:
+        _store_instance = MetricStore()
+    return _store_instance
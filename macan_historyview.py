@@ -0,0 +1,255 @@
+"""
+Macan History View - Grafik history metrik jangka panjang untuk Macan Monitoring
+File: macan_historyview.py
+
+Window "Metric History" membaca metric store bersama (PersistentMetricStore
+bila history disk aktif) per rentang waktu: RingSeries.binned() merata-rata
+sample per bucket waktu, sehingga history 24 jam / 7 hari dari sesi-sesi
+sebelumnya bisa dilihat. Bucket tanpa sample (app tidak jalan, layar
+terkunci) digambar sebagai celah, bukan disambung ke sample berikutnya.
+
+Dipisah dari macan-monitoring.py agar hanya di-import saat window dibuka.
+"""
+
+import time
+from PySide6.QtWidgets import (QDialog, QWidget, QVBoxLayout, QHBoxLayout, QLabel,
+                               QComboBox, QPushButton)
+from PySide6.QtCore import Qt, QTimer
+from PySide6.QtGui import QColor, QFont, QPainter, QPainterPath, QPen, QLinearGradient
+
+from macan_history import (get_metric_store, make_buffer, METRIC_NAMES, DISK_PREFIX,
+                           DEFAULT_CAPACITY)
+from macan_policy import get_sampling_policy
+
+# (label, detik) — hanya rentang <= retention store yang ditawarkan
+HISTORY_RANGES = [
+    ("Last Hour", 3600),
+    ("Last 6 Hours", 6 * 3600),
+    ("Last 24 Hours", 24 * 3600),
+    ("Last 7 Days", 7 * 24 * 3600),
+]
+HISTORY_BUCKETS = 360        # Maks titik per grafik
+MIN_BUCKET_SECONDS = 15.0    # Bucket lebih kecil dari interval idle hub (5 detik) = celah palsu
+HISTORY_REFRESH_MS = 5000
+
+METRIC_LABELS = {"cpu": "CPU", "ram": "RAM", "swap": "Swap", "dl": "Download", "ul": "Upload"}
+RATE_METRICS = ("dl", "ul")  # bytes/s; metrik lain dalam persen
+
+
+def metric_label(name):
+    if name.startswith(DISK_PREFIX):
+        return f"Disk {name[len(DISK_PREFIX):]}"
+    return METRIC_LABELS.get(name, name)
+
+
+def format_value(name, value):
+    if name not in RATE_METRICS:
+        return f"{value:.1f}%"
+    if value < 1024: return f"{value:.0f} B/s"
+    elif value < 1024 * 1024: return f"{value / 1024:.1f} KB/s"
+    else: return f"{value / (1024 * 1024):.1f} MB/s"
+
+
+def format_span(seconds):
+    if seconds >= 24 * 3600 and seconds % (24 * 3600) == 0:
+        return f"{seconds // (24 * 3600)}d"
+    if seconds >= 3600:
+        return f"{seconds / 3600:g}h"
+    return f"{seconds / 60:g}m"
+
+
+class HistoryGraph(QWidget):
+    """Grafik area satu metrik: values per bucket (NaN = celah), kanan = sekarang"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setMinimumHeight(180)
+        self.values = []
+        self.name = "cpu"
+        self.seconds = HISTORY_RANGES[0][1]
+        self.max_value = 100.0
+        self.color = QColor("#00bcd4")
+        self.bg_color = QColor("#222")
+        self.text_color = QColor("#888")
+
+    def set_data(self, name, values, seconds):
+        self.name = name
+        self.values = values
+        self.seconds = seconds
+        if name in RATE_METRICS:
+            peak = max((v for v in values if v == v), default=0.0)
+            self.max_value = max(peak * 1.2, 1024 * 10)
+        else:
+            self.max_value = 100.0
+        self.update()
+
+    def _runs(self):
+        """Index bucket berurutan tanpa NaN"""
+        runs, run = [], []
+        for i, value in enumerate(self.values):
+            if value == value:
+                run.append(i)
+            elif run:
+                runs.append(run)
+                run = []
+        if run:
+            runs.append(run)
+        return runs
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        w, h = self.width(), self.height()
+        painter.fillRect(0, 0, w, h, self.bg_color)
+
+        painter.setFont(QFont("Segoe UI", 8))
+        grid = QPen(QColor(60, 60, 60), 1, Qt.DotLine)
+        for frac in (0.25, 0.5, 0.75):
+            painter.setPen(grid)
+            painter.drawLine(0, int(h * frac), w, int(h * frac))
+            x = int(w * frac)
+            painter.drawLine(x, 0, x, h)
+            painter.setPen(self.text_color)
+            painter.drawText(x + 3, h - 4, f"-{format_span(int(self.seconds * (1 - frac)))}")
+        painter.setPen(self.text_color)
+        painter.drawText(3, 12, format_value(self.name, self.max_value))
+        painter.drawText(w - 26, h - 4, "now")
+
+        n = len(self.values)
+        runs = self._runs()
+        if not runs:
+            painter.drawText(self.rect(), Qt.AlignCenter, "No samples in this range")
+            return
+
+        # Titik bucket di tengah bucket; run satu bucket tetap selebar bucket
+        step = w / n
+        area = QPainterPath()
+        line = QPainterPath()
+        for run in runs:
+            points = [((i + 0.5) * step, h - (self.values[i] / self.max_value * h)) for i in run]
+            if len(points) == 1:
+                x, y = points[0]
+                points = [(x - step / 2, y), (x + step / 2, y)]
+            area.moveTo(points[0][0], h)
+            line.moveTo(*points[0])
+            for x, y in points:
+                area.lineTo(x, y)
+                line.lineTo(x, y)
+            area.lineTo(points[-1][0], h)
+            area.closeSubpath()
+
+        grad = QLinearGradient(0, 0, 0, h)
+        fill = QColor(self.color)
+        fill.setAlpha(110)
+        grad.setColorAt(0, fill)
+        grad.setColorAt(1, Qt.transparent)
+        painter.fillPath(area, grad)
+        painter.setPen(QPen(self.color, 1.5))
+        painter.drawPath(line)
+
+
+class MetricHistoryWindow(QDialog):
+    def __init__(self, parent=None, theme_manager=None):
+        super().__init__(parent)
+        self.theme = theme_manager
+        self.setWindowTitle("Metric History")
+        self.resize(760, 340)
+        self.store = get_metric_store()
+        # PersistentMetricStore: retention; store memory: kapasitas ring (1 sample/detik)
+        self.max_seconds = getattr(self.store, "retention", DEFAULT_CAPACITY)
+        self.buffer = None
+
+        layout = QVBoxLayout(self)
+        bar = QHBoxLayout()
+        self.combo_metric = QComboBox()
+        self.combo_range = QComboBox()
+        for label, seconds in HISTORY_RANGES:
+            if seconds <= self.max_seconds or not self.combo_range.count():
+                self.combo_range.addItem(label, seconds)
+        self.combo_range.setCurrentIndex(self.combo_range.count() - 1)
+        self.lbl_stats = QLabel()
+        self.lbl_stats.setStyleSheet("color: #999;")
+        bar.addWidget(self.combo_metric)
+        bar.addWidget(self.combo_range)
+        bar.addStretch()
+        bar.addWidget(self.lbl_stats)
+        layout.addLayout(bar)
+
+        self.graph = HistoryGraph()
+        layout.addWidget(self.graph, 1)
+
+        footer = QHBoxLayout()
+        if not hasattr(self.store, "retention"):
+            hint = QLabel("Disk history is off: only samples since start are kept")
+            hint.setStyleSheet("color: #777; font-size: 10px;")
+            footer.addWidget(hint)
+        footer.addStretch()
+        self.btn_close = QPushButton("Close")
+        self.btn_close.clicked.connect(self.close)
+        footer.addWidget(self.btn_close)
+        layout.addLayout(footer)
+
+        self.apply_theme()
+        self.load_metrics()
+        self.combo_metric.currentIndexChanged.connect(self.refresh)
+        self.combo_range.currentIndexChanged.connect(self.refresh)
+
+        # Refresh berkala hanya saat window terlihat
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.refresh)
+        get_sampling_policy().register(self, self.set_rate)
+
+    def apply_theme(self):
+        if self.theme:
+            c = self.theme.get_colors()
+            self.setStyleSheet(f"background-color: {c['bg_main']}; color: {c['text_primary']};")
+            self.graph.color = QColor(c['accent_blue'])
+            self.btn_close.setStyleSheet("background-color: #555; color: white; border-radius: 4px; padding: 6px 12px;")
+        else:
+            self.setStyleSheet("background-color: #2b2b2b; color: #eee;")
+            self.btn_close.setStyleSheet("background-color: #555; color: white; padding: 6px;")
+
+    def load_metrics(self):
+        """Isi combo metrik dari series di store (disk baru muncul setelah di-sample)"""
+        current = self.combo_metric.currentData()
+        names = self.store.names()
+        ordered = [n for n in METRIC_NAMES if n in names] + sorted(
+            n for n in names if n not in METRIC_NAMES)
+        self.combo_metric.blockSignals(True)
+        self.combo_metric.clear()
+        for name in ordered:
+            self.combo_metric.addItem(metric_label(name), name)
+        if current in ordered:
+            self.combo_metric.setCurrentIndex(ordered.index(current))
+        self.combo_metric.blockSignals(False)
+
+    def set_rate(self, scale):
+        """Dipanggil SamplingPolicy: None = pause, selain itu refresh berkala"""
+        if scale is None:
+            self.timer.stop()
+            return
+        self.load_metrics()
+        self.refresh()
+        self.timer.start(int(HISTORY_REFRESH_MS * scale))
+
+    def refresh(self):
+        name = self.combo_metric.currentData()
+        seconds = self.combo_range.currentData()
+        series = self.store.get(name) if name else None
+        if series is None or seconds is None:
+            self.graph.set_data("cpu", [], seconds or HISTORY_RANGES[0][1])
+            self.lbl_stats.setText("")
+            return
+        buckets = min(HISTORY_BUCKETS, max(1, int(seconds / MIN_BUCKET_SECONDS)))
+        if self.buffer is None or len(self.buffer) != buckets:
+            self.buffer = make_buffer(buckets)
+        now = time.time()
+        series.binned(seconds, self.buffer, now)
+        self.graph.set_data(name, [float(v) for v in self.buffer], seconds)
+        stats = series.stats(seconds=seconds, now=now)
+        if stats:
+            self.lbl_stats.setText(f"min {format_value(name, stats[0])} / "
+                                   f"avg {format_value(name, stats[2])} / "
+                                   f"max {format_value(name, stats[1])}")
+        else:
+            self.lbl_stats.setText("No samples")
@@ -0,0 +1,466 @@
+"""
+Macan Network Apps - Window "Live App Connections" untuk Macan Network
+File: macan_netapps.py
+
+Dipisah dari macan_network.py agar hanya di-import saat tombol 📊 diklik.
+
+Di Linux koneksi & throughput per proses diambil dari sock_diag
+(macan_sockdiag.py): kolom Download/Upload = byte TCP per detik per aplikasi.
+Platform lain memakai psutil.net_connections tanpa throughput.
+"""
+
+import os
+import subprocess
+import platform
+import threading
+import psutil
+from PySide6.QtWidgets import (QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
+                               QMenu, QDialog, QTableWidget, QTableWidgetItem,
+                               QHeaderView, QMessageBox, QFileIconProvider)
+from PySide6.QtCore import Qt, QThread, Signal, QFileInfo, QSize
+from PySide6.QtGui import QAction, QColor, QBrush, QIcon
+
+from macan_network import get_app_icon
+from macan_policy import get_sampling_policy
+from macan_sockdiag import open_bandwidth, TCP_ESTABLISHED
+
+# --- WORKER: NETWORK APPS SCANNER ---
+APPS_SCAN_INTERVAL = 3.0
+
+# (header, key record) — urutan kolom tabel
+APPS_COLUMNS = [
+    ("App", "name"),
+    ("PID", "pid"),
+    ("Remote Address", "raddr"),
+    ("Download", "rx"),
+    ("Upload", "tx"),
+    ("Status", "status"),
+]
+COL_PID = 1
+COL_RX = 3
+COL_TX = 4
+COL_STATUS = 5
+
+
+def format_speed(bytes_sec):
+    if bytes_sec is None: return "—"
+    if bytes_sec < 1024: return f"{bytes_sec:.0f} B/s"
+    elif bytes_sec < 1024 * 1024: return f"{bytes_sec / 1024:.1f} KB/s"
+    else: return f"{bytes_sec / (1024 * 1024):.1f} MB/s"
+
+
+class NumericItem(QTableWidgetItem):
+    """Item tabel yang di-sort berdasarkan angka (Qt.UserRole), bukan teks"""
+    def __init__(self, text, value):
+        super().__init__(text)
+        self.setData(Qt.UserRole, value)
+
+    def __lt__(self, other):
+        mine, theirs = self.data(Qt.UserRole), other.data(Qt.UserRole)
+        return (mine if mine is not None else -1) < (theirs if theirs is not None else -1)
+
+class NetworkAppsWorker(QThread):
+    apps_signal = Signal(list)
+    # True = sock_diag terbuka (ada throughput), False = fallback psutil
+    backend_ready = Signal(bool)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._running = True
+        self._wake = threading.Event()
+        self.interval = APPS_SCAN_INTERVAL
+
+    def set_rate(self, scale):
+        """Dipanggil SamplingPolicy: None = pause, 1.0 = normal"""
+        self.interval = None if scale is None else APPS_SCAN_INTERVAL * scale
+        self._wake.set()
+
+    def _sleep(self):
+        # Interruptible: stop()/set_rate() membangunkan thread lebih awal.
+        # Event di-clear di awal siklus (run), jadi wake selama scan tidak hilang
+        self._wake.wait(self.interval)
+
+    def scan_psutil(self):
+        """Satu baris per PID dengan koneksi ESTABLISHED; tanpa throughput (rx/tx None)"""
+        data = []
+        seen_pids = set()
+        for conn in psutil.net_connections(kind='inet'):
+            if not self._running:
+                break
+            if conn.status != psutil.CONN_ESTABLISHED:
+                continue
+            if conn.pid in seen_pids:
+                continue
+            try:
+                proc = psutil.Process(conn.pid)
+                proc_name = proc.name()
+                exe_path = proc.exe()
+            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                continue
+
+            raddr = f"{conn.raddr.ip}:{conn.raddr.port}" if conn.raddr else "Unknown"
+            seen_pids.add(conn.pid)
+            data.append({
+                'pid': conn.pid,
+                'name': proc_name,
+                'path': exe_path,
+                'raddr': raddr,
+                'status': conn.status,
+                'rx': None,
+                'tx': None
+            })
+        return data
+
+    def scan_sockdiag(self, bandwidth):
+        """Sama dengan scan_psutil, plus throughput TCP per PID dari sock_diag"""
+        data = []
+        for pid, traffic in bandwidth.sample().items():
+            established = [s for s in traffic['sockets'] if s.state == TCP_ESTABLISHED]
+            if not established:
+                continue
+            try:
+                proc = psutil.Process(pid)
+                proc_name = proc.name()
+                exe_path = proc.exe()
+            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                continue
+
+            ip, port = established[0].raddr
+            data.append({
+                'pid': pid,
+                'name': proc_name,
+                'path': exe_path,
+                'raddr': f"{ip}:{port}",
+                'status': psutil.CONN_ESTABLISHED,
+                'rx': traffic['rx'],
+                'tx': traffic['tx']
+            })
+        return data
+
+    def run(self):
+        # Socket netlink dibuat di thread worker; None = fallback psutil
+        bandwidth = open_bandwidth()
+        self.backend_ready.emit(bandwidth is not None)
+        while self._running:
+            self._wake.clear()
+            try:
+                data = self.scan_sockdiag(bandwidth) if bandwidth else self.scan_psutil()
+                if self._running:
+                    self.apps_signal.emit(data)
+
+            except Exception as e:
+                print(f"Apps Worker Error: {e}")
+
+            self._sleep()
+        if bandwidth:
+            bandwidth.close()
+
+    def stop(self):
+        self._running = False
+        self._wake.set()
+        self.wait(3000)
+
+# --- WINDOW: NETWORK APPS MANAGER ---
+class NetworkAppsWindow(QDialog):
+    def __init__(self, parent=None, theme_manager=None):
+        super().__init__(parent)
+        self.theme = theme_manager
+        self.setWindowTitle("Live App Connections")
+        self.resize(720, 450)
+        self.setWindowIcon(get_app_icon())
+        
+        layout = QVBoxLayout(self)
+
+        # --- BARU: Area Toolbar untuk Tombol Refresh ---
+        toolbar_layout = QHBoxLayout()
+        
+        self.btn_refresh = QPushButton("Refresh Connection")
+        self.btn_refresh.setCursor(Qt.PointingHandCursor)
+        # Style sedikit agar terlihat bagus
+        self.btn_refresh.setStyleSheet("""
+            QPushButton {
+                padding: 6px 15px;
+                font-weight: bold;
+                border-radius: 4px;
+                background-color: #2d2d2d;
+                color: white;
+                border: 1px solid #555;
+            }
+            QPushButton:hover {
+                background-color: #3d3d3d;
+                border: 1px solid #777;
+            }
+            QPushButton:pressed {
+                background-color: #1a1a1a;
+            }
+            QPushButton:disabled {
+                background-color: #1a1a1a;
+                color: #555;
+            }
+        """)
+        self.btn_refresh.clicked.connect(self.handle_refresh)
+
+        toolbar_layout.addWidget(self.btn_refresh)
+        toolbar_layout.addStretch() # Mendorong tombol ke kiri (spasi kosong di kanan)
+        
+        layout.addLayout(toolbar_layout)
+        # -----------------------------------------------
+        
+        # Info
+        info_layout = QHBoxLayout()
+        lbl_info = QLabel("<b>Active Connections</b>")
+        lbl_hint = QLabel("Requires Admin for full process names")
+        lbl_hint.setStyleSheet("color: #777; font-size: 10px;")
+        info_layout.addWidget(lbl_info)
+        info_layout.addStretch()
+        info_layout.addWidget(lbl_hint)
+        layout.addLayout(info_layout)
+
+        # Table
+        self.table = QTableWidget()
+        self.table.setColumnCount(len(APPS_COLUMNS))
+        self.table.setHorizontalHeaderLabels([title for title, _ in APPS_COLUMNS])
+        self.table.verticalHeader().setVisible(False)
+        self.table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.table.setSelectionMode(QTableWidget.SingleSelection)
+        self.table.setShowGrid(False)
+        self.table.setIconSize(QSize(24, 24)) # Ukuran Icon
+        
+        self.table.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.table.customContextMenuRequested.connect(self.show_table_context_menu)
+        
+        header = self.table.horizontalHeader()
+        header.setSectionResizeMode(0, QHeaderView.Stretch) # Name Stretch
+        header.setSectionResizeMode(COL_PID, QHeaderView.ResizeToContents)
+        # Throughput hanya bila worker berhasil membuka sock_diag (on_backend_ready)
+        for col in (COL_RX, COL_TX):
+            self.table.setColumnHidden(col, True)
+        
+        layout.addWidget(self.table)
+
+        # Buttons
+        btn_layout = QHBoxLayout()
+        self.btn_kill = QPushButton("End Task")
+        self.btn_kill.setIcon(QIcon.fromTheme("process-stop")) # Try standard icon
+        self.btn_kill.clicked.connect(self.kill_process)
+        
+        self.btn_close = QPushButton("Close")
+        self.btn_close.clicked.connect(self.close)
+        
+        btn_layout.addStretch()
+        btn_layout.addWidget(self.btn_kill)
+        btn_layout.addWidget(self.btn_close)
+        layout.addLayout(btn_layout)
+
+        self.apply_theme()
+        
+        self.icon_provider = QFileIconProvider()
+
+        # Worker (di-pause otomatis saat window tidak terlihat)
+        self.worker = NetworkAppsWorker()
+        self.worker.apps_signal.connect(self.update_table)
+        self.worker.backend_ready.connect(self.on_backend_ready)
+        self.worker.start()
+        get_sampling_policy().register(self, self.worker.set_rate)
+
+    def on_backend_ready(self, has_throughput):
+        # Tanpa sock_diag (non-Linux, kernel tanpa inet_diag, netlink ditolak) rx/tx selalu None
+        for col in (COL_RX, COL_TX):
+            self.table.setColumnHidden(col, not has_throughput)
+        if has_throughput:
+            self.table.sortByColumn(COL_RX, Qt.DescendingOrder)
+
+    def apply_theme(self):
+        if self.theme:
+            c = self.theme.get_colors()
+            self.setStyleSheet(f"background-color: {c['bg_main']}; color: {c['text_primary']};")
+            self.table.setStyleSheet(f"""
+                QTableWidget {{ background-color: {c['bg_secondary']}; border: 1px solid #444; }}
+                QHeaderView::section {{ background-color: {c['bg_header']}; border: none; padding: 4px; }}
+                QTableWidget::item {{ padding: 5px; }}
+                QTableWidget::item:selected {{ background-color: {c['accent_red']}; }}
+            """)
+            self.btn_kill.setStyleSheet(f"background-color: {c['accent_red']}; color: white; border-radius: 4px; padding: 6px 12px;")
+            self.btn_close.setStyleSheet("background-color: #555; color: white; border-radius: 4px; padding: 6px 12px;")
+        else:
+            self.setStyleSheet("background-color: #2b2b2b; color: #eee;")
+            self.table.setStyleSheet("QTableWidget { background-color: #333; border: 1px solid #444; }")
+            self.btn_kill.setStyleSheet("background-color: #d32f2f; color: white; padding: 6px;")
+            self.btn_close.setStyleSheet("background-color: #555; color: white; padding: 6px;")
+
+    def update_table(self, data):
+        current_row = self.table.currentRow()
+        sel_pid = None
+        if current_row >= 0:
+            item = self.table.item(current_row, 1)
+            if item: sel_pid = item.text()
+
+        # Sorting dimatikan selama mengisi agar baris tidak berpindah di tengah jalan
+        self.table.setSortingEnabled(False)
+        self.table.setRowCount(len(data))
+        
+        for i, row in enumerate(data):
+            # Column 0: Icon + Name
+            name_item = QTableWidgetItem(row['name'])
+            
+            # --- GET ICON FROM PATH ---
+            if row['path'] and os.path.exists(row['path']):
+                file_info = QFileInfo(row['path'])
+                icon = self.icon_provider.icon(file_info)
+                name_item.setIcon(icon)
+            
+            self.table.setItem(i, 0, name_item)
+            
+            # Column 1: PID (sort numerik)
+            self.table.setItem(i, COL_PID, NumericItem(str(row['pid']), row['pid']))
+            
+            # Column 2: Remote
+            self.table.setItem(i, 2, QTableWidgetItem(str(row['raddr'])))
+
+            # Column 3-4: Throughput TCP (B/s), sort numerik
+            for col in (COL_RX, COL_TX):
+                value = row[APPS_COLUMNS[col][1]]
+                speed_item = NumericItem(format_speed(value), value)
+                speed_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                self.table.setItem(i, col, speed_item)
+            
+            # Column 5: Status
+            stat_item = QTableWidgetItem("ACTIVE")
+            stat_item.setForeground(QBrush(QColor("#4caf50"))) # Green
+            stat_item.setTextAlignment(Qt.AlignCenter)
+            self.table.setItem(i, COL_STATUS, stat_item)
+
+            # Restore selection
+            if str(row['pid']) == sel_pid:
+                self.table.selectRow(i)
+                
+        self.table.setSortingEnabled(True)
+        # --- BARU: Kembalikan status tombol ---
+        if hasattr(self, 'btn_refresh'):
+            self.btn_refresh.setEnabled(True)
+            self.btn_refresh.setText("Refresh Connection")
+
+    def kill_process(self):
+        row = self.table.currentRow()
+        if row < 0: return
+
+        pid_text = self.table.item(row, 1).text()
+        name_text = self.table.item(row, 0).text()
+        
+        msg = QMessageBox(self)
+        msg.setWindowTitle("End Task")
+        msg.setText(f"Stop process {name_text}?")
+        msg.setIcon(QMessageBox.Question)
+        msg.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
+        
+        # Style message box
+        if self.theme:
+            c = self.theme.get_colors()
+            msg.setStyleSheet(f"background-color: {c['bg_main']}; color: {c['text_primary']};")
+        
+        if msg.exec() == QMessageBox.Yes:
+            try:
+                psutil.Process(int(pid_text)).terminate()
+            except Exception as e:
+                QMessageBox.critical(self, "Error", str(e))
+
+    # --- BARU: Fungsi Handler Tombol ---
+    def handle_refresh(self):
+        # Ubah status tombol jadi disable agar tidak di-spam
+        self.btn_refresh.setEnabled(False)
+        self.btn_refresh.setText("Refreshing...")
+        
+        # Bersihkan tabel untuk memberi efek visual "reset"
+        self.table.setRowCount(0)
+        
+        # Kita tidak perlu memanggil thread secara manual karena 
+        # AppsNetworkThread berjalan otomatis setiap 2 detik.
+        # Data akan muncul lagi saat thread mengirim sinyal update_table berikutnya.
+
+    def show_table_context_menu(self, pos):
+        """Tampilkan context menu saat klik kanan pada tabel"""
+        row = self.table.rowAt(pos.y())
+        if row < 0:
+            return
+
+        self.table.selectRow(row)
+
+        menu = QMenu(self)
+        if self.theme:
+            menu.setStyleSheet(self.theme.get_menu_style() if hasattr(self.theme, 'get_menu_style') else "")
+        else:
+            menu.setStyleSheet("""
+                QMenu {
+                    background-color: #2d2d2d;
+                    color: #eee;
+                    border: 1px solid #555;
+                    padding: 4px;
+                }
+                QMenu::item {
+                    padding: 6px 20px;
+                    border-radius: 3px;
+                }
+                QMenu::item:selected {
+                    background-color: #444;
+                }
+                QMenu::separator {
+                    height: 1px;
+                    background: #555;
+                    margin: 3px 8px;
+                }
+            """)
+
+        act_open_location = QAction("📂  Open File Location", self)
+        act_open_location.triggered.connect(lambda: self.open_file_location(row))
+        menu.addAction(act_open_location)
+
+        menu.addSeparator()
+
+        act_kill = QAction("🛑  End Task", self)
+        act_kill.triggered.connect(self.kill_process)
+        menu.addAction(act_kill)
+
+        menu.exec(self.table.viewport().mapToGlobal(pos))
+
+    def open_file_location(self, row):
+        """Buka folder lokasi file executable dari proses yang dipilih"""
+        if row < 0:
+            return
+
+        # Ambil PID dari kolom 1
+        pid_item = self.table.item(row, 1)
+        if not pid_item:
+            return
+
+        try:
+            pid = int(pid_item.text())
+            proc = psutil.Process(pid)
+            exe_path = proc.exe()
+        except (psutil.NoSuchProcess, psutil.AccessDenied, ValueError) as e:
+            QMessageBox.warning(self, "Open File Location", f"Cannot get process path:\n{e}")
+            return
+
+        if not exe_path or not os.path.exists(exe_path):
+            QMessageBox.warning(self, "Open File Location", f"File not found:\n{exe_path}")
+            return
+
+        folder_path = os.path.dirname(exe_path)
+        system = platform.system()
+
+        try:
+            if system == "Windows":
+                # Buka Explorer dan highlight file-nya
+                subprocess.Popen(["explorer", "/select,", exe_path])
+            elif system == "Darwin":
+                subprocess.Popen(["open", "-R", exe_path])
+            else:
+                # Linux: buka folder saja (highlight file tidak didukung di semua file manager)
+                subprocess.Popen(["xdg-open", folder_path])
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to open location:\n{e}")
+
+    def shutdown(self):
+        """Stop worker permanen; close biasa hanya menyembunyikan (worker di-pause)"""
+        if self.worker.isRunning():
+            self.worker.stop()
+        self.close()
@@ -1,17 +1,16 @@
 import sys
-import psutil
-import time
 import os
-import subprocess
-import platform
+import time
 from PySide6.QtWidgets import (QApplication, QWidget, QVBoxLayout, QHBoxLayout, 
                                QLabel, QProgressBar, QPushButton, QMenu, QFrame, 
-                               QSizeGrip, QDialog, QTableWidget, QTableWidgetItem,
-                               QHeaderView, QMessageBox, QFileIconProvider)
-from PySide6.QtCore import (Qt, QThread, Signal, QPoint, QSettings, QFileInfo, 
-                            QSize, QTimer)
-from PySide6.QtGui import (QAction, QFont, QColor, QBrush, QPainter, QPainterPath, 
-                           QPen, QLinearGradient, QIcon, QGradient)
+                               QSizeGrip)
+from PySide6.QtCore import Qt, Signal, QPoint, QSettings
+from PySide6.QtGui import (QAction, QFont, QColor, QPainter, QPainterPath, 
+                           QPen, QLinearGradient, QIcon)
+
+from macan_sampler import get_sampling_hub, METRIC_NET
+from macan_history import get_metric_store
+from macan_policy import get_sampling_policy
 
 # --- IMPORT THEME MANAGER ---
 try:
@@ -44,6 +43,8 @@ def get_app_icon():
 # --- HELPER: CUSTOM GRAPH WIDGET (cFosSpeed Style) ---
 # Mode: 0 = Fill (default), 1 = Line, 2 = Bar
 GRAPH_MODES = ["Fill", "Line", "Bar"]
+GRAPH_SECONDS = 60   # Lebar window graph (detik terakhir)
+GRAPH_GAP = 10.0     # Jarak antar sample > ini (detik) = celah; hub idle = 5 detik
 
 class TrafficGraph(QWidget):
     mode_changed = Signal(int)
@@ -51,8 +52,11 @@ class TrafficGraph(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setFixedHeight(60)
-        self.dl_history = [0.0] * 60
-        self.ul_history = [0.0] * 60
+        # Data dibaca dari metric store bersama: run sample [(x 0..1, value)],
+        # x dari timestamp sehingga sample sesi sebelumnya tidak tampil sebagai data terkini
+        self.store = get_metric_store()
+        self.dl_runs = []
+        self.ul_runs = []
         self.max_speed = 1024 * 10
 
         self.color_dl = QColor("#00bcd4")
@@ -75,13 +79,29 @@ class TrafficGraph(QWidget):
             self.update()
         super().mousePressEvent(event)
 
-    def update_data(self, dl, ul):
-        self.dl_history.pop(0)
-        self.dl_history.append(dl)
-        self.ul_history.pop(0)
-        self.ul_history.append(ul)
-
-        current_max = max(max(self.dl_history), max(self.ul_history))
+    @staticmethod
+    def _runs(ts, values, now):
+        """Pecah sample menjadi run tanpa celah > GRAPH_GAP; x = posisi waktu 0..1"""
+        runs = []
+        prev = None
+        for t, value in zip(ts, values):
+            if prev is None or t - prev > GRAPH_GAP:
+                runs.append([])
+            runs[-1].append((1.0 - (now - t) / GRAPH_SECONDS, value))
+            prev = t
+        return runs
+
+    def refresh(self):
+        """Ambil sample dl/ul GRAPH_SECONDS terakhir (menurut timestamp) dari metric store"""
+        now = time.time()
+        dl_series = self.store.series("dl")
+        ul_series = self.store.series("ul")
+        self.dl_runs = self._runs(*dl_series.recent(GRAPH_SECONDS, now), now)
+        self.ul_runs = self._runs(*ul_series.recent(GRAPH_SECONDS, now), now)
+
+        dl_stats = dl_series.stats(seconds=GRAPH_SECONDS, now=now)
+        ul_stats = ul_series.stats(seconds=GRAPH_SECONDS, now=now)
+        current_max = max(dl_stats[1] if dl_stats else 0, ul_stats[1] if ul_stats else 0)
         if current_max > 0:
             self.max_speed = current_max * 1.2
         else:
@@ -116,15 +136,24 @@ class TrafficGraph(QWidget):
         elif self.graph_mode == 2:
             self._draw_bar(painter, w, h)
 
-    def _draw_fill(self, painter, w, h):
-        step_x = w / (len(self.dl_history) - 1)
+    def _line_path(self, runs, w, h):
+        path = QPainterPath()
+        for run in runs:
+            x, val = run[0]
+            path.moveTo(x * w, h - (val / self.max_speed * h))
+            for x, val in run[1:]:
+                path.lineTo(x * w, h - (val / self.max_speed * h))
+        return path
 
+    def _draw_fill(self, painter, w, h):
+        # Satu area per run: celah tetap kosong
         path_dl = QPainterPath()
-        path_dl.moveTo(0, h)
-        for i, val in enumerate(self.dl_history):
-            path_dl.lineTo(i * step_x, h - (val / self.max_speed * h))
-        path_dl.lineTo(w, h)
-        path_dl.closeSubpath()
+        for run in self.dl_runs:
+            path_dl.moveTo(run[0][0] * w, h)
+            for x, val in run:
+                path_dl.lineTo(x * w, h - (val / self.max_speed * h))
+            path_dl.lineTo(run[-1][0] * w, h)
+            path_dl.closeSubpath()
 
         grad_dl = QLinearGradient(0, 0, 0, h)
         c_dl = QColor(self.color_dl)
@@ -133,145 +162,36 @@ class TrafficGraph(QWidget):
         grad_dl.setColorAt(1, Qt.transparent)
         painter.fillPath(path_dl, grad_dl)
         painter.setPen(QPen(self.color_dl, 1.5))
-        painter.drawPath(path_dl)
+        painter.drawPath(self._line_path(self.dl_runs, w, h))
 
-        path_ul = QPainterPath()
-        path_ul.moveTo(0, h - (self.ul_history[0] / self.max_speed * h))
-        for i, val in enumerate(self.ul_history):
-            path_ul.lineTo(i * step_x, h - (val / self.max_speed * h))
         painter.setPen(QPen(self.color_ul, 1.5))
-        painter.drawPath(path_ul)
+        painter.drawPath(self._line_path(self.ul_runs, w, h))
 
     def _draw_line(self, painter, w, h):
-        step_x = w / (len(self.dl_history) - 1)
-
-        path_dl = QPainterPath()
-        path_dl.moveTo(0, h - (self.dl_history[0] / self.max_speed * h))
-        for i, val in enumerate(self.dl_history):
-            path_dl.lineTo(i * step_x, h - (val / self.max_speed * h))
         painter.setPen(QPen(self.color_dl, 2))
-        painter.drawPath(path_dl)
-
-        path_ul = QPainterPath()
-        path_ul.moveTo(0, h - (self.ul_history[0] / self.max_speed * h))
-        for i, val in enumerate(self.ul_history):
-            path_ul.lineTo(i * step_x, h - (val / self.max_speed * h))
+        painter.drawPath(self._line_path(self.dl_runs, w, h))
         painter.setPen(QPen(self.color_ul, 2))
-        painter.drawPath(path_ul)
+        painter.drawPath(self._line_path(self.ul_runs, w, h))
 
     def _draw_bar(self, painter, w, h):
-        n = len(self.dl_history)
-        bar_w = max(1, w / n - 1)
-        step_x = w / n
-
-        for i in range(n):
-            x = i * step_x
-
-            dl_h = (self.dl_history[i] / self.max_speed) * h
-            c_dl = QColor(self.color_dl)
-            c_dl.setAlpha(180)
-            painter.fillRect(int(x), int(h - dl_h), max(1, int(bar_w)), max(1, int(dl_h)), c_dl)
-
-            ul_h = (self.ul_history[i] / self.max_speed) * (h * 0.6)
-            c_ul = QColor(self.color_ul)
-            c_ul.setAlpha(160)
-            painter.fillRect(int(x), int(h - ul_h), max(1, int(bar_w)), max(1, int(ul_h)), c_ul)
+        step_x = w / GRAPH_SECONDS
+        bar_w = max(1, int(step_x - 1))
 
+        c_dl = QColor(self.color_dl)
+        c_dl.setAlpha(180)
+        for run in self.dl_runs:
+            for x, val in run:
+                dl_h = (val / self.max_speed) * h
+                painter.fillRect(int(x * w - step_x), int(h - dl_h), bar_w, max(1, int(dl_h)), c_dl)
 
+        c_ul = QColor(self.color_ul)
+        c_ul.setAlpha(160)
+        for run in self.ul_runs:
+            for x, val in run:
+                ul_h = (val / self.max_speed) * (h * 0.6)
+                painter.fillRect(int(x * w - step_x), int(h - ul_h), bar_w, max(1, int(ul_h)), c_ul)
 
-# --- WORKER: NETWORK MONITOR (SPEED) ---
-class NetworkWorker(QThread):
-    stats_signal = Signal(float, float)
 
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self._running = True
-
-    def run(self):
-        last_net = psutil.net_io_counters()
-        while self._running:
-            try:
-                for _ in range(10):
-                    if not self._running:
-                        return
-                    time.sleep(0.1)
-
-                if not self._running:
-                    return
-
-                current_net = psutil.net_io_counters()
-                bytes_sent = current_net.bytes_sent - last_net.bytes_sent
-                bytes_recv = current_net.bytes_recv - last_net.bytes_recv
-                last_net = current_net
-
-                if self._running:
-                    self.stats_signal.emit(float(bytes_recv), float(bytes_sent))
-            except Exception as e:
-                print(f"Net Monitor error: {e}")
-                break
-
-    def stop(self):
-        self._running = False
-        self.wait(3000)
-
-# --- WORKER: NETWORK APPS SCANNER ---
-class NetworkAppsWorker(QThread):
-    apps_signal = Signal(list)
-
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self._running = True
-
-    def run(self):
-        while self._running:
-            try:
-                connections = psutil.net_connections(kind='inet')
-                data = []
-                icon_provider = QFileIconProvider()
-                seen_pids = set()
-
-                for conn in connections:
-                    if not self._running:
-                        return
-                    if conn.status != psutil.CONN_ESTABLISHED:
-                        continue
-                    if conn.pid in seen_pids:
-                        continue
-                    try:
-                        proc = psutil.Process(conn.pid)
-                        proc_name = proc.name()
-                        exe_path = proc.exe()
-                    except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                        continue
-
-                    raddr = f"{conn.raddr.ip}:{conn.raddr.port}" if conn.raddr else "Unknown"
-                    seen_pids.add(conn.pid)
-                    data.append({
-                        'pid': conn.pid,
-                        'name': proc_name,
-                        'path': exe_path,
-                        'raddr': raddr,
-                        'status': conn.status
-                    })
-
-                if self._running:
-                    self.apps_signal.emit(data)
-
-                for _ in range(30):
-                    if not self._running:
-                        return
-                    time.sleep(0.1)
-
-            except Exception as e:
-                print(f"Apps Worker Error: {e}")
-                for _ in range(30):
-                    if not self._running:
-                        return
-                    time.sleep(0.1)
-
-    def stop(self):
-        self._running = False
-        self.wait(3000)
 
 # --- UI COMPONENT: NET STAT BAR ---
 class NetStat(QWidget):
@@ -343,290 +263,6 @@ class NetStat(QWidget):
         elif bytes_sec < 1024 * 1024: return f"{bytes_sec / 1024:.1f} KB/s"
         else: return f"{bytes_sec / (1024 * 1024):.1f} MB/s"
 
-# --- WINDOW: NETWORK APPS MANAGER ---
-class NetworkAppsWindow(QDialog):
-    def __init__(self, parent=None, theme_manager=None):
-        super().__init__(parent)
-        self.theme = theme_manager
-        self.setWindowTitle("Live App Connections")
-        self.resize(550, 450)
-        self.setWindowIcon(get_app_icon())
-        
-        layout = QVBoxLayout(self)
-
-        # --- BARU: Area Toolbar untuk Tombol Refresh ---
-        toolbar_layout = QHBoxLayout()
-        
-        self.btn_refresh = QPushButton("Refresh Connection")
-        self.btn_refresh.setCursor(Qt.PointingHandCursor)
-        # Style sedikit agar terlihat bagus
-        self.btn_refresh.setStyleSheet("""
-            QPushButton {
-                padding: 6px 15px;
-                font-weight: bold;
-                border-radius: 4px;
-                background-color: #2d2d2d;
-                color: white;
-                border: 1px solid #555;
-            }
-            QPushButton:hover {
-                background-color: #3d3d3d;
-                border: 1px solid #777;
-            }
-            QPushButton:pressed {
-                background-color: #1a1a1a;
-            }
-            QPushButton:disabled {
-                background-color: #1a1a1a;
-                color: #555;
-            }
-        """)
-        self.btn_refresh.clicked.connect(self.handle_refresh)
-
-        toolbar_layout.addWidget(self.btn_refresh)
-        toolbar_layout.addStretch() # Mendorong tombol ke kiri (spasi kosong di kanan)
-        
-        layout.addLayout(toolbar_layout)
-        # -----------------------------------------------
-        
-        # Info
-        info_layout = QHBoxLayout()
-        lbl_info = QLabel("<b>Active Connections</b>")
-        lbl_hint = QLabel("Requires Admin for full process names")
-        lbl_hint.setStyleSheet("color: #777; font-size: 10px;")
-        info_layout.addWidget(lbl_info)
-        info_layout.addStretch()
-        info_layout.addWidget(lbl_hint)
-        layout.addLayout(info_layout)
-
-        # Table
-        self.table = QTableWidget()
-        self.table.setColumnCount(4)
-        self.table.setHorizontalHeaderLabels(["App", "PID", "Remote Address", "Status"])
-        self.table.verticalHeader().setVisible(False)
-        self.table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.table.setSelectionMode(QTableWidget.SingleSelection)
-        self.table.setShowGrid(False)
-        self.table.setIconSize(QSize(24, 24)) # Ukuran Icon
-        
-        self.table.setContextMenuPolicy(Qt.CustomContextMenu)
-        self.table.customContextMenuRequested.connect(self.show_table_context_menu)
-        
-        header = self.table.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.Stretch) # Name Stretch
-        header.setSectionResizeMode(1, QHeaderView.ResizeToContents)
-        
-        layout.addWidget(self.table)
-
-        # Buttons
-        btn_layout = QHBoxLayout()
-        self.btn_kill = QPushButton("End Task")
-        self.btn_kill.setIcon(QIcon.fromTheme("process-stop")) # Try standard icon
-        self.btn_kill.clicked.connect(self.kill_process)
-        
-        self.btn_close = QPushButton("Close")
-        self.btn_close.clicked.connect(self.close)
-        
-        btn_layout.addStretch()
-        btn_layout.addWidget(self.btn_kill)
-        btn_layout.addWidget(self.btn_close)
-        layout.addLayout(btn_layout)
-
-        self.apply_theme()
-        
-        self.icon_provider = QFileIconProvider()
-
-        # Worker
-        self.worker = NetworkAppsWorker()
-        self.worker.apps_signal.connect(self.update_table)
-        self.worker.start()
-
-    def apply_theme(self):
-        if self.theme:
-            c = self.theme.get_colors()
-            self.setStyleSheet(f"background-color: {c['bg_main']}; color: {c['text_primary']};")
-            self.table.setStyleSheet(f"""
-                QTableWidget {{ background-color: {c['bg_secondary']}; border: 1px solid #444; }}
-                QHeaderView::section {{ background-color: {c['bg_header']}; border: none; padding: 4px; }}
-                QTableWidget::item {{ padding: 5px; }}
-                QTableWidget::item:selected {{ background-color: {c['accent_red']}; }}
-            """)
-            self.btn_kill.setStyleSheet(f"background-color: {c['accent_red']}; color: white; border-radius: 4px; padding: 6px 12px;")
-            self.btn_close.setStyleSheet(f"background-color: #555; color: white; border-radius: 4px; padding: 6px 12px;")
-        else:
-            self.setStyleSheet("background-color: #2b2b2b; color: #eee;")
-            self.table.setStyleSheet("QTableWidget { background-color: #333; border: 1px solid #444; }")
-            self.btn_kill.setStyleSheet("background-color: #d32f2f; color: white; padding: 6px;")
-            self.btn_close.setStyleSheet("background-color: #555; color: white; padding: 6px;")
-
-    def update_table(self, data):
-        current_row = self.table.currentRow()
-        sel_pid = None
-        if current_row >= 0:
-            item = self.table.item(current_row, 1)
-            if item: sel_pid = item.text()
-
-        self.table.setRowCount(len(data))
-        self.table.setSortingEnabled(False)
-        
-        for i, row in enumerate(data):
-            # Column 0: Icon + Name
-            name_item = QTableWidgetItem(row['name'])
-            
-            # --- GET ICON FROM PATH ---
-            if row['path'] and os.path.exists(row['path']):
-                file_info = QFileInfo(row['path'])
-                icon = self.icon_provider.icon(file_info)
-                name_item.setIcon(icon)
-            
-            self.table.setItem(i, 0, name_item)
-            
-            # Column 1: PID
-            self.table.setItem(i, 1, QTableWidgetItem(str(row['pid'])))
-            
-            # Column 2: Remote
-            self.table.setItem(i, 2, QTableWidgetItem(str(row['raddr'])))
-            
-            # Column 3: Status
-            stat_item = QTableWidgetItem("ACTIVE")
-            stat_item.setForeground(QBrush(QColor("#4caf50"))) # Green
-            stat_item.setTextAlignment(Qt.AlignCenter)
-            self.table.setItem(i, 3, stat_item)
-
-            # Restore selection
-            if str(row['pid']) == sel_pid:
-                self.table.selectRow(i)
-                
-        self.table.setSortingEnabled(True)
-        # --- BARU: Kembalikan status tombol ---
-        if hasattr(self, 'btn_refresh'):
-            self.btn_refresh.setEnabled(True)
-            self.btn_refresh.setText("Refresh Connection")
-
-    def kill_process(self):
-        row = self.table.currentRow()
-        if row < 0: return
-
-        pid_text = self.table.item(row, 1).text()
-        name_text = self.table.item(row, 0).text()
-        
-        msg = QMessageBox(self)
-        msg.setWindowTitle("End Task")
-        msg.setText(f"Stop process {name_text}?")
-        msg.setIcon(QMessageBox.Question)
-        msg.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
-        
-        # Style message box
-        if self.theme:
-            c = self.theme.get_colors()
-            msg.setStyleSheet(f"background-color: {c['bg_main']}; color: {c['text_primary']};")
-        
-        if msg.exec() == QMessageBox.Yes:
-            try:
-                psutil.Process(int(pid_text)).terminate()
-            except Exception as e:
-                QMessageBox.critical(self, "Error", str(e))
-
-    # --- BARU: Fungsi Handler Tombol ---
-    def handle_refresh(self):
-        # Ubah status tombol jadi disable agar tidak di-spam
-        self.btn_refresh.setEnabled(False)
-        self.btn_refresh.setText("Refreshing...")
-        
-        # Bersihkan tabel untuk memberi efek visual "reset"
-        self.table.setRowCount(0)
-        
-        # Kita tidak perlu memanggil thread secara manual karena 
-        # AppsNetworkThread berjalan otomatis setiap 2 detik.
-        # Data akan muncul lagi saat thread mengirim sinyal update_table berikutnya.
-
-    def show_table_context_menu(self, pos):
-        """Tampilkan context menu saat klik kanan pada tabel"""
-        row = self.table.rowAt(pos.y())
-        if row < 0:
-            return
-
-        self.table.selectRow(row)
-
-        menu = QMenu(self)
-        if self.theme:
-            menu.setStyleSheet(self.theme.get_menu_style() if hasattr(self.theme, 'get_menu_style') else "")
-        else:
-            menu.setStyleSheet("""
-                QMenu {
-                    background-color: #2d2d2d;
-                    color: #eee;
-                    border: 1px solid #555;
-                    padding: 4px;
-                }
-                QMenu::item {
-                    padding: 6px 20px;
-                    border-radius: 3px;
-                }
-                QMenu::item:selected {
-                    background-color: #444;
-                }
-                QMenu::separator {
-                    height: 1px;
-                    background: #555;
-                    margin: 3px 8px;
-                }
-            """)
-
-        act_open_location = QAction("📂  Open File Location", self)
-        act_open_location.triggered.connect(lambda: self.open_file_location(row))
-        menu.addAction(act_open_location)
-
-        menu.addSeparator()
-
-        act_kill = QAction("🛑  End Task", self)
-        act_kill.triggered.connect(self.kill_process)
-        menu.addAction(act_kill)
-
-        menu.exec(self.table.viewport().mapToGlobal(pos))
-
-    def open_file_location(self, row):
-        """Buka folder lokasi file executable dari proses yang dipilih"""
-        if row < 0:
-            return
-
-        # Ambil PID dari kolom 1
-        pid_item = self.table.item(row, 1)
-        if not pid_item:
-            return
-
-        try:
-            pid = int(pid_item.text())
-            proc = psutil.Process(pid)
-            exe_path = proc.exe()
-        except (psutil.NoSuchProcess, psutil.AccessDenied, ValueError) as e:
-            QMessageBox.warning(self, "Open File Location", f"Cannot get process path:\n{e}")
-            return
-
-        if not exe_path or not os.path.exists(exe_path):
-            QMessageBox.warning(self, "Open File Location", f"File not found:\n{exe_path}")
-            return
-
-        folder_path = os.path.dirname(exe_path)
-        system = platform.system()
-
-        try:
-            if system == "Windows":
-                # Buka Explorer dan highlight file-nya
-                subprocess.Popen(["explorer", "/select,", exe_path])
-            elif system == "Darwin":
-                subprocess.Popen(["open", "-R", exe_path])
-            else:
-                # Linux: buka folder saja (highlight file tidak didukung di semua file manager)
-                subprocess.Popen(["xdg-open", folder_path])
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to open location:\n{e}")
-
-    def closeEvent(self, event):
-        if self.worker.isRunning():
-            self.worker.stop()
-        super().closeEvent(event)
-
 # --- MAIN CLASS ---
 class MacanNetwork(QWidget):
     def __init__(self, parent=None):
@@ -644,9 +280,10 @@ class MacanNetwork(QWidget):
         self.setup_ui()
         self.load_settings()
 
-        self.worker = NetworkWorker(self)
-        self.worker.stats_signal.connect(self.on_stats_update)
-        self.worker.start()
+        self.hub = get_sampling_hub()
+        self.hub.sample_ready.connect(self.on_sample)
+        self.hub.subscribe(self, (METRIC_NET,))
+        get_sampling_policy().register(self)
 
     def setup_ui(self):
         self.container = QFrame()
@@ -693,6 +330,7 @@ class MacanNetwork(QWidget):
         # 2. Grafik Realtime (cFos Style)
         self.graph = TrafficGraph()
         self.graph.mode_changed.connect(self.on_graph_mode_changed)
+        self.graph.refresh()
         content_layout.addWidget(self.graph)
 
         # 3. Stats Bar (Text & Simple Bar)
@@ -717,10 +355,14 @@ class MacanNetwork(QWidget):
         # Trik agar grip ada di pojok kanan bawah container
         self.sizegrip.setParent(self.container)
 
+    def on_sample(self, sample):
+        if 'dl' in sample:
+            self.on_stats_update(sample['dl'], sample['ul'])
+
     def on_stats_update(self, dl, ul):
         self.row_dl.update_speed(dl)
         self.row_ul.update_speed(ul)
-        self.graph.update_data(dl, ul)
+        self.graph.refresh()
 
     def on_graph_mode_changed(self, mode):
         self.save_settings()
@@ -747,10 +389,10 @@ class MacanNetwork(QWidget):
 
     def closeEvent(self, event):
         self.save_settings()
-        if hasattr(self, 'worker') and self.worker.isRunning():
-            self.worker.stop()
+        if hasattr(self, 'hub'):
+            self.hub.unsubscribe(self)
         if self.apps_window:
-            self.apps_window.close()
+            self.apps_window.shutdown()
         event.accept()
 
     def apply_theme(self):
@@ -785,6 +427,8 @@ class MacanNetwork(QWidget):
     def show_network_apps(self):
         """Membuka jendela detail aplikasi di tengah layar"""
         if not self.apps_window:
+            # Deferred import: window ini jarang dibuka
+            from macan_netapps import NetworkAppsWindow
             self.apps_window = NetworkAppsWindow(self, self.theme)
         
         # --- LOGIKA POSISI TENGAH LAYAR ---
@@ -851,4 +495,4 @@ if __name__ == "__main__":
     app.setFont(font)
     w = MacanNetwork()
     w.show()
-    sys.exit(app.exec())
\ No newline at end of file
+    sys.exit(app.exec())
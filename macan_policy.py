@@ -0,0 +1,158 @@
+"""
+Macan Sampling Policy - Adaptive sampling rate untuk Macan Monitoring Suite
+File: macan_policy.py
+
+Menurunkan rate (atau pause) sampling saat modul tidak terlihat
+(hidden/minimized), saat session idle, atau saat layar terkunci, lalu
+kembali ke rate penuh begitu modul tampil lagi.
+"""
+
+import os
+import sys
+import ctypes
+from PySide6.QtCore import QObject, QEvent, QTimer
+
+try:
+    from PySide6.QtDBus import QDBusConnection, QDBusInterface
+    DBUS_AVAILABLE = True
+except ImportError:
+    DBUS_AVAILABLE = False
+
+from macan_sampler import get_sampling_hub
+
+RATE_FULL = 1.0
+RATE_IDLE = 5.0          # Session idle: interval 5x lebih jarang
+RATE_PAUSED = None       # Tidak terlihat / layar terkunci
+
+IDLE_THRESHOLD = 300     # Detik tanpa input sebelum dianggap idle
+SESSION_POLL_MS = 5000
+
+
+# --- SESSION STATE ---
+class SessionMonitor:
+    """Deteksi idle & lock per platform; nilai default: aktif & tidak terkunci"""
+
+    def __init__(self):
+        self._login1 = None
+        if sys.platform == "win32":
+            self._user32 = ctypes.windll.user32
+            self._kernel32 = ctypes.windll.kernel32
+        elif DBUS_AVAILABLE and sys.platform.startswith("linux"):
+            try:
+                session = os.environ.get("XDG_SESSION_ID")
+                path = f"/org/freedesktop/login1/session/{session}" if session else "/org/freedesktop/login1/session/auto"
+                iface = QDBusInterface("org.freedesktop.login1", path,
+                                       "org.freedesktop.login1.Session",
+                                       QDBusConnection.systemBus())
+                if iface.isValid():
+                    self._login1 = iface
+            except Exception as e:
+                print(f"Session monitor: logind unavailable ({e})")
+
+    def idle_seconds(self):
+        if sys.platform == "win32":
+            class LASTINPUTINFO(ctypes.Structure):
+                _fields_ = [("cbSize", ctypes.c_uint), ("dwTime", ctypes.c_uint)]
+            info = LASTINPUTINFO()
+            info.cbSize = ctypes.sizeof(info)
+            if self._user32.GetLastInputInfo(ctypes.byref(info)):
+                return ((self._kernel32.GetTickCount() - info.dwTime) & 0xFFFFFFFF) / 1000.0
+            return 0.0
+        if self._login1 is not None and self._login1.property("IdleHint"):
+            return float(IDLE_THRESHOLD)
+        return 0.0
+
+    def is_locked(self):
+        if sys.platform == "win32":
+            # Input desktop tidak bisa di-switch saat workstation terkunci
+            DESKTOP_SWITCHDESKTOP = 0x0100
+            hdesk = self._user32.OpenInputDesktop(0, False, DESKTOP_SWITCHDESKTOP)
+            if not hdesk:
+                return True
+            try:
+                return not self._user32.SwitchDesktop(hdesk)
+            finally:
+                self._user32.CloseDesktop(hdesk)
+        if self._login1 is not None:
+            return bool(self._login1.property("LockedHint"))
+        return False
+
+
+# --- POLICY ---
+class SamplingPolicy(QObject):
+    """
+    Event filter pada widget modul. Setiap perubahan Show/Hide/minimize atau
+    status session menghitung ulang rate lalu meneruskannya ke target
+    (default: hub.set_rate untuk widget tersebut).
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.hub = get_sampling_hub()
+        self.session = SessionMonitor()
+        self._targets = {}  # widget -> list of callable(scale)
+        self._idle = False
+        self._locked = False
+
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.poll_session)
+        self.timer.start(SESSION_POLL_MS)
+
+    def register(self, widget, *targets):
+        """Pantau widget; targets = callable(scale). Tanpa targets: rate hub milik widget"""
+        if not targets:
+            targets = (lambda scale, w=widget: self.hub.set_rate(w, scale),)
+        self._targets[widget] = list(targets)
+        widget.installEventFilter(self)
+        widget.destroyed.connect(lambda _=None, w=widget: self._targets.pop(w, None))
+        self.apply(widget)
+
+    def unregister(self, widget):
+        if self._targets.pop(widget, None) is not None:
+            widget.removeEventFilter(self)
+
+    def rate_for(self, widget):
+        if not widget.isVisible() or widget.isMinimized():
+            return RATE_PAUSED
+        if self._locked:
+            return RATE_PAUSED
+        if self._idle:
+            return RATE_IDLE
+        return RATE_FULL
+
+    def apply(self, widget):
+        scale = self.rate_for(widget)
+        for target in self._targets.get(widget, ()):
+            target(scale)
+
+    def apply_all(self):
+        for widget in list(self._targets):
+            self.apply(widget)
+
+    def eventFilter(self, obj, event):
+        if event.type() in (QEvent.Show, QEvent.Hide, QEvent.WindowStateChange) and obj in self._targets:
+            # Hide dikirim sebelum isVisible() berubah; hitung ulang setelah event diproses
+            QTimer.singleShot(0, lambda w=obj: self.apply(w) if w in self._targets else None)
+        return False
+
+    def poll_session(self):
+        try:
+            idle = self.session.idle_seconds() >= IDLE_THRESHOLD
+            locked = self.session.is_locked()
+        except Exception as e:
+            print(f"Session monitor error: {e}")
+            return
+        if idle != self._idle or locked != self._locked:
+            self._idle = idle
+            self._locked = locked
+            self.apply_all()
+
+
+_policy_instance = None
+
+def get_sampling_policy():
+    """Get global sampling policy instance (Singleton)"""
+    global _policy_instance
+    if _policy_instance is None:
+        _policy_instance = SamplingPolicy()
+    return _policy_instance
@@ -0,0 +1,1278 @@
+"""
+Macan Process Model - Model/view untuk tabel proses Macan Task Manager
+File: macan_procmodel.py
+
+ProcessTableModel menyimpan satu baris per PID. Update dari worker di-diff
+terhadap isi model: baris baru di-insert, PID yang hilang di-remove, dan
+dataChanged hanya dikirim untuk cell yang nilainya berubah. Worker mengirim
+delta (added/removed/changed) lewat apply_delta(). Model mengurutkan
+barisnya sendiri (sorted() sekali per delta, satu layoutChanged); proxy
+hanya memfilter dan meneruskan sort() sehingga selection & scroll tetap
+terjaga tanpa re-sort per dataChanged.
+
+ProcessTreeModel menerima delta yang sama dan menyusun pohon parent/child
+(ppid) dengan total CPU/RSS per subtree; perubahan struktur & urutan satu
+delta digabung dalam satu layoutChanged.
+
+ProcessGroupModel mengelompokkan proses per aplikasi (exe), per user, atau
+per cgroup (slice/service/container, Linux); total CPU/RSS/IO dan jumlah
+proses per grup dijaga incremental dari delta. Di mode cgroup total CPU &
+memory diambil dari file cgroup (delta["cgroups"]) bila tersedia.
+
+Kolom History digambar SparklineDelegate dari ProcessHistoryPool
+(macan_history.py); model hanya menyediakan PID untuk kolom tersebut.
+
+ProcessSearchIndex adalah index trigram atas name/user/PID/path yang di-update
+dari delta yang sama; hasilnya dipasang ke proxy lewat set_matches().
+"""
+
+from PySide6.QtCore import (Qt, QAbstractTableModel, QAbstractItemModel,
+                            QModelIndex, QSortFilterProxyModel, QEvent, QPointF)
+from PySide6.QtGui import QBrush, QColor, QPainter, QPen, QPolygonF
+from PySide6.QtWidgets import QStyledItemDelegate, QToolTip
+
+from macan_cgroup import cgroup_unit
+
+# (field, header) — urutan kolom tabel
+COLUMNS = [
+    ("name", "Name"),
+    ("pid", "PID"),
+    ("user", "User"),
+    ("mem", "Memory (MB)"),
+    ("cpu", "CPU %"),
+    ("io_read", "Read KB/s"),
+    ("io_write", "Write KB/s"),
+    ("threads", "Threads"),
+    ("ctx_vol", "Vol. CS/s"),
+    ("ctx_invol", "Invol. CS/s"),
+    ("history", "History"),
+]
+COLUMN_FIELDS = [field for field, _ in COLUMNS]
+COLUMN_INDEX = {field: i for i, field in enumerate(COLUMN_FIELDS)}
+COLUMN_COUNT = len(COLUMNS)
+
+SORT_ROLE = Qt.UserRole + 1   # nilai mentah untuk sorting (angka tetap angka)
+PID_ROLE = Qt.UserRole + 2
+
+# data() dipanggil per role per cell saat paint; role datang sebagai int dan
+# lookup atribut enum PySide (Qt.DisplayRole) ~3 µs, jadi di-cache di sini
+DISPLAY_ROLE = int(Qt.DisplayRole)
+DECORATION_ROLE = int(Qt.DecorationRole)
+TOOLTIP_ROLE = int(Qt.ToolTipRole)
+ALIGNMENT_ROLE = int(Qt.TextAlignmentRole)
+FOREGROUND_ROLE = int(Qt.ForegroundRole)
+ALIGN_RIGHT = int(Qt.AlignRight | Qt.AlignVCenter)
+# Role yang dijawab model; role lain (font, background, check state) langsung None
+DATA_ROLES = {DISPLAY_ROLE, SORT_ROLE, PID_ROLE, TOOLTIP_ROLE, DECORATION_ROLE,
+              ALIGNMENT_ROLE, FOREGROUND_ROLE}
+
+CPU_HIGH = 50
+CPU_WARN = 20
+CPU_HIGH_BRUSH = QBrush(QColor("#ff5555"))
+CPU_WARN_BRUSH = QBrush(QColor("#ff9800"))
+
+TEXT_FIELDS = {"name", "user"}   # sorting case-insensitive
+RIGHT_ALIGNED = {"mem", "cpu", "io_read", "io_write", "threads", "ctx_vol", "ctx_invol"}
+
+HISTORY_FIELD = "history"
+SPARK_CPU_PEN = QPen(QColor("#4fc3f7"), 1.2)
+SPARK_MEM_PEN = QPen(QColor("#ffb74d"), 1.0)
+SPARK_CPU_FLOOR = 5.0    # % — skala minimum agar noise idle tidak terlihat seperti spike
+SPARK_MEM_SPAN = 1.0     # MB — rentang minimum sumbu memory
+
+
+def history_data(record, role):
+    """Kolom History: isi digambar delegate, sorting mengikuti CPU"""
+    if role == PID_ROLE:
+        return record["pid"]
+    if role == SORT_ROLE:
+        return record["cpu"]
+    return None
+
+
+def sort_key(field):
+    """Key sorted() untuk kolom `field`: nilai SORT_ROLE, teks case-insensitive"""
+    if field == HISTORY_FIELD:
+        field = "cpu"
+    if field in TEXT_FIELDS:
+        return lambda record: (record.get(field) or "").lower()
+    return lambda record: record.get(field) or 0
+
+
+def format_field(field, value):
+    if value is None:
+        return ""  # Field opsional yang tidak dikumpulkan / tidak bisa dibaca
+    if field in ("io_read", "io_write"):
+        return f"{value:.1f}"
+    if field in ("ctx_vol", "ctx_invol"):
+        return f"{value:.0f}"
+    if field == "mem":
+        return f"{value:.2f}"
+    if field == "cpu":
+        return f"{value:.1f}"
+    return str(value)
+
+
+class ProcessTableModel(QAbstractTableModel):
+    """Tabel proses keyed by PID; `icon_for(record)` opsional untuk kolom Name"""
+
+    def __init__(self, icon_for=None, parent=None):
+        super().__init__(parent)
+        self.icon_for = icon_for
+        self._rows = []      # list of dict (record dari worker)
+        self._row_of = {}    # pid -> index baris
+        self._sort = None    # (field, descending); None = urutan masuk
+        self._sorting = True # False saat view tabel tersembunyi: sort ditunda
+
+    # --- Qt model interface ---
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return COLUMNS[section][1]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role not in DATA_ROLES or not index.isValid():
+            return None
+        record = self._rows[index.row()]
+        field = COLUMN_FIELDS[index.column()]
+        if field == HISTORY_FIELD:
+            return history_data(record, role)
+
+        if role == DISPLAY_ROLE:
+            return format_field(field, record.get(field))
+        if role == SORT_ROLE:
+            return record.get(field, 0)
+        if role == PID_ROLE:
+            return record["pid"]
+        if role == DECORATION_ROLE and field == "name" and self.icon_for:
+            return self.icon_for(record)
+        if role == ALIGNMENT_ROLE and field in RIGHT_ALIGNED:
+            return ALIGN_RIGHT
+        if role == FOREGROUND_ROLE and field == "cpu":
+            if record["cpu"] > CPU_HIGH:
+                return CPU_HIGH_BRUSH
+            if record["cpu"] > CPU_WARN:
+                return CPU_WARN_BRUSH
+        return None
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        if 0 <= column < len(COLUMN_FIELDS):
+            self._sort = (COLUMN_FIELDS[column], order == Qt.DescendingOrder)
+        else:
+            self._sort = None
+        self._resort()
+
+    def set_sorting(self, enabled):
+        """Tunda sorting selama view tabel tidak tampil; diaktifkan lagi = urutkan sekali"""
+        self._sorting = enabled
+        self._resort()
+
+    def _resort(self):
+        """Urutkan ulang baris; satu layoutChanged, persistent index ikut dipetakan per PID"""
+        if self._sort is None or not self._sorting:
+            return
+        field, descending = self._sort
+        order = sorted(self._rows, key=sort_key(field), reverse=descending)
+        if all(a is b for a, b in zip(order, self._rows)):
+            return
+        self.layoutAboutToBeChanged.emit()
+        persistent = self.persistentIndexList()
+        pids = [self._rows[index.row()]["pid"] for index in persistent]
+        self._rows = order
+        self._row_of = {record["pid"]: i for i, record in enumerate(order)}
+        self.changePersistentIndexList(
+            persistent, [self.index(self._row_of[pid], index.column())
+                         for pid, index in zip(pids, persistent)])
+        self.layoutChanged.emit()
+
+    # --- Update dari worker ---
+    def record(self, row):
+        return self._rows[row]
+
+    def row_of(self, pid):
+        return self._row_of.get(pid)
+
+    def apply_delta(self, delta):
+        """Terapkan delta dari ProcessWorker (lihat ProcessWorker.delta_signal)"""
+        if delta["full"]:
+            self.update_processes(delta["added"])
+            return
+
+        if delta["removed"]:
+            rows = sorted((self._row_of[pid] for pid in delta["removed"] if pid in self._row_of),
+                          reverse=True)
+            self._remove_rows(rows)
+
+        changed = {}
+        for pid, diff in delta["changed"].items():
+            row = self._row_of.get(pid)
+            if row is not None:
+                self._update_row(self._rows[row], diff, changed)
+
+        added = [d for d in delta["added"] if d["pid"] not in self._row_of]
+        self._insert_rows(added)
+        self._resort()
+        self._emit_changed(changed)
+
+    def drop_fields(self, fields):
+        """Buang field yang tidak lagi dikumpulkan worker dari semua record"""
+        for record in self._rows:
+            for field in fields:
+                record.pop(field, None)
+        columns = [COLUMN_INDEX[field] for field in fields if field in COLUMN_INDEX]
+        if self._rows and columns:
+            self.dataChanged.emit(self.index(0, min(columns)),
+                                  self.index(len(self._rows) - 1, max(columns)))
+
+    def update_processes(self, data_list):
+        """Diff snapshot penuh terhadap isi model"""
+        incoming = {d["pid"]: d for d in data_list}
+
+        # 1. Remove PID yang hilang (run berurutan, dari bawah ke atas)
+        gone = sorted((row for pid, row in self._row_of.items() if pid not in incoming),
+                      reverse=True)
+        self._remove_rows(gone)
+
+        # 2. Update cell yang berubah
+        changed = {}
+        for record in self._rows:
+            self._update_row(record, incoming.pop(record["pid"]), changed)
+
+        # 3. Insert sisanya di akhir, lalu urutkan sekali
+        self._insert_rows(list(incoming.values()))
+        self._resort()
+        self._emit_changed(changed)
+
+    def _insert_rows(self, records):
+        if not records:
+            return
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(records) - 1)
+        for new in records:
+            self._row_of[new["pid"]] = len(self._rows)
+            self._rows.append(dict(new))
+        self.endInsertRows()
+
+    def records(self):
+        return list(self._rows)
+
+    def _update_row(self, record, new, changed):
+        """Simpan `new`; kolom yang berubah dicatat di changed[pid] = (first, last)"""
+        first = last = None
+        for col, field in enumerate(COLUMN_FIELDS):
+            if field in new and record.get(field) != new[field]:
+                first = col if first is None else first
+                last = col
+        # Field non-kolom (mis. path) ikut disimpan tanpa sinyal
+        record.update(new)
+        if first is not None:
+            changed[record["pid"]] = (first, last)
+
+    def _emit_changed(self, changed):
+        # Satu dataChanged per delta (bounding box) setelah sort; view hanya repaint yang terlihat
+        if not changed:
+            return
+        rows = [self._row_of[pid] for pid in changed]
+        self.dataChanged.emit(self.index(min(rows), min(c[0] for c in changed.values())),
+                              self.index(max(rows), max(c[1] for c in changed.values())))
+
+    def _remove_rows(self, rows_desc):
+        if not rows_desc:
+            return
+        # Gabungkan index berurutan agar beginRemoveRows dipanggil per blok
+        start = end = rows_desc[0]
+        for row in rows_desc[1:] + [None]:
+            if row is not None and row == start - 1:
+                start = row
+                continue
+            self.beginRemoveRows(QModelIndex(), start, end)
+            del self._rows[start:end + 1]
+            self.endRemoveRows()
+            if row is not None:
+                start = end = row
+        self._row_of = {record["pid"]: i for i, record in enumerate(self._rows)}
+
+
+class ProcessProxyModel(QSortFilterProxyModel):
+    """
+    Filter PID (set_matches). Sorting dilakukan model sumber sekali per delta
+    (sort() diteruskan); tanpa dynamic sort proxy tidak me-re-sort lewat
+    data() setiap dataChanged. `tree` = source bertingkat (tree/grup);
+    source flat (ProcessTableModel) tidak pernah punya anak.
+    """
+
+    def __init__(self, parent=None, tree=False):
+        super().__init__(parent)
+        self.setDynamicSortFilter(False)
+        self._tree = tree
+        self._matches = None  # None = tanpa filter, selain itu set PID
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        self.sourceModel().sort(column, order)
+
+    def set_matches(self, matches, refilter=True):
+        """
+        Pasang hasil ProcessSearchIndex.search(). Baris yang di-insert
+        setelahnya otomatis dicek terhadap set ini; `refilter` hanya perlu
+        bila baris yang sudah ada bisa berubah status match-nya.
+        """
+        self._matches = matches
+        if refilter:
+            self.invalidateFilter()
+
+    def hasChildren(self, parent=QModelIndex()):
+        if not self._tree:
+            # QAbstractTableModel.hasChildren private di PySide6: jangan diteruskan
+            return not parent.isValid() and self.rowCount(parent) > 0
+        # Tanpa filter jawaban source sudah benar; versi Qt membangun mapping
+        # children tiap node tertutup (filterAcceptsRow per anak) saat relayout
+        if self._matches is None:
+            return self.sourceModel().hasChildren(self.mapToSource(parent))
+        return super().hasChildren(parent)
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        if self._matches is None:
+            return True
+        source = self.sourceModel()
+        return source.data(source.index(source_row, 0, source_parent), PID_ROLE) in self._matches
+
+
+# --- SPARKLINE ---
+class SparklineDelegate(QStyledItemDelegate):
+    """
+    Gambar history CPU (biru) & memory (oranye) per proses dari
+    ProcessHistoryPool. Sample terbaru di kanan; proses muda hanya mengisi
+    sebagian lebar. CPU diskalakan 0..max window, memory min..max window
+    agar tren naik (leak) tetap terlihat. Tooltip berisi ringkasan angka.
+    """
+
+    def __init__(self, pool, parent=None):
+        super().__init__(parent)
+        self.pool = pool
+
+    def paint(self, painter, option, index):
+        super().paint(painter, option, index)  # background & selection
+        series = self.pool.history(index.data(PID_ROLE))
+        if series is None or len(series[0]) < 2:
+            return
+        cpu, mem = series
+        rect = option.rect.adjusted(3, 4, -3, -4)
+        step = rect.width() / (self.pool.samples - 1)
+        x0 = rect.right() - (len(cpu) - 1) * step
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        lo = min(mem)
+        for values, base, span, pen in (
+                (mem, lo, max(max(mem) - lo, SPARK_MEM_SPAN), SPARK_MEM_PEN),
+                (cpu, 0.0, max(max(cpu), SPARK_CPU_FLOOR), SPARK_CPU_PEN)):
+            painter.setPen(pen)
+            painter.drawPolyline(QPolygonF([
+                QPointF(x0 + i * step, rect.bottom() - (v - base) / span * rect.height())
+                for i, v in enumerate(values)]))
+        painter.restore()
+
+    def helpEvent(self, event, view, option, index):
+        if event.type() == QEvent.ToolTip:
+            series = self.pool.history(index.data(PID_ROLE))
+            if series is not None:
+                cpu, mem = series
+                QToolTip.showText(event.globalPos(),
+                                  f"Last {len(cpu)} samples\n"
+                                  f"CPU: avg {sum(cpu) / len(cpu):.1f}% | max {max(cpu):.1f}%\n"
+                                  f"Memory: {mem[0]:.1f} → {mem[-1]:.1f} MB "
+                                  f"({mem[-1] - mem[0]:+.1f}) | max {max(mem):.1f}", view)
+                return True
+        return super().helpEvent(event, view, option, index)
+
+
+# --- SEARCH INDEX ---
+SEARCH_FIELDS = ("name", "user", "pid", "path")
+GRAM = 3
+
+
+def search_text(record):
+    # Field dipisah newline agar match tidak menyeberang antar field
+    return "\n".join(str(record[field]) for field in SEARCH_FIELDS).lower()
+
+
+def trigrams(text):
+    return {text[i:i + GRAM] for i in range(len(text) - GRAM + 1)}
+
+
+class ProcessSearchIndex:
+    """
+    Index trigram untuk filter MacanTask. Tiap term query (dipisah spasi,
+    semua harus cocok, case-insensitive substring) dicari lewat irisan
+    posting list trigram-nya lalu diverifikasi pada kandidat saja. Term
+    1-2 huruf dicek langsung; bila query hanya memperpanjang query
+    sebelumnya, kandidat dibatasi hasil sebelumnya.
+    """
+
+    def __init__(self):
+        self._docs = {}      # pid -> teks pencarian
+        self._fields = {}    # pid -> {field: value} untuk menerapkan diff `changed`
+        self._postings = {}  # trigram -> set(pid)
+        self._last = None    # (query, hasil) untuk penyempitan per keystroke
+
+    def __len__(self):
+        return len(self._docs)
+
+    def _index(self, pid, text):
+        self._docs[pid] = text
+        postings = self._postings
+        for gram in trigrams(text):
+            bucket = postings.get(gram)
+            if bucket is None:
+                postings[gram] = {pid}
+            else:
+                bucket.add(pid)
+
+    def _unindex(self, pid):
+        self._fields.pop(pid, None)
+        text = self._docs.pop(pid, None)
+        if text is None:
+            return
+        postings = self._postings
+        for gram in trigrams(text):
+            bucket = postings.get(gram)
+            if bucket is not None:
+                bucket.discard(pid)
+                if not bucket:
+                    del postings[gram]
+
+    def _set(self, record):
+        """Index ulang bila teks berubah; return True bila PID sudah ada sebelumnya"""
+        pid = record["pid"]
+        fields = {field: record[field] for field in SEARCH_FIELDS}
+        text = search_text(fields)
+        old = self._docs.get(pid)
+        if old == text:
+            self._fields[pid] = fields
+            return False
+        if old is not None:
+            self._unindex(pid)
+        self._fields[pid] = fields
+        self._index(pid, text)
+        return old is not None
+
+    def apply_delta(self, delta):
+        """
+        Update index dari delta ProcessWorker (sebelum model di-update).
+        Return True bila teks proses yang sudah ada berubah (perlu refilter).
+        """
+        self._last = None
+        retext = False
+        if delta["full"]:
+            incoming = {d["pid"]: d for d in delta["added"]}
+            for pid in [pid for pid in self._docs if pid not in incoming]:
+                self._unindex(pid)
+            for record in incoming.values():
+                retext |= self._set(record)
+            return retext
+
+        for pid in delta["removed"]:
+            self._unindex(pid)
+        for pid, diff in delta["changed"].items():
+            fields = self._fields.get(pid)
+            if fields is not None and any(field in diff for field in SEARCH_FIELDS):
+                retext |= self._set({**fields, **diff, "pid": pid})
+        for record in delta["added"]:
+            retext |= self._set(record)
+        return retext
+
+    def search(self, query):
+        """Set PID yang cocok dengan semua term, atau None bila query kosong"""
+        terms = query.lower().split()
+        if not terms:
+            self._last = None
+            return None
+
+        # Query yang hanya diperpanjang: hasilnya subset dari hasil sebelumnya
+        scope = None
+        if self._last is not None and query.startswith(self._last[0]):
+            scope = self._last[1]
+
+        docs = self._docs
+        for term in sorted(terms, key=len, reverse=True):
+            if len(term) >= GRAM:
+                buckets = sorted((self._postings.get(g, ()) for g in trigrams(term)), key=len)
+                candidates = set(buckets[0])
+                for bucket in buckets[1:]:
+                    if not candidates:
+                        break
+                    candidates &= bucket
+                if scope is not None:
+                    candidates &= scope
+            else:
+                candidates = docs.keys() if scope is None else scope
+            scope = {pid for pid in candidates if term in docs[pid]}
+            if not scope:
+                break
+
+        self._last = (query, scope)
+        return scope
+
+
+# --- TREE MODEL ---
+AGGREGATE_FIELDS = ("cpu", "mem")
+
+
+def node_sort_key(field):
+    """Key sorted() untuk ProcNode: CPU/Memory memakai total subtree seperti kolomnya"""
+    if field in AGGREGATE_FIELDS:
+        return lambda node: getattr(node, field)
+    key = sort_key(field)
+    return lambda node: key(node.record)
+
+
+class ProcNode:
+    """Node pohon proses; cpu/mem = total subtree (termasuk diri sendiri)"""
+    __slots__ = ("record", "parent", "children", "row", "cpu", "mem")
+
+    def __init__(self, record=None):
+        self.record = record
+        self.parent = None
+        self.children = []
+        self.row = 0
+        self.cpu = record["cpu"] if record else 0.0
+        self.mem = record["mem"] if record else 0.0
+
+
+class ProcessTreeModel(QAbstractItemModel):
+    """
+    Pohon proses berdasarkan ppid. Kolom CPU/Memory menampilkan total
+    subtree yang dijaga incremental: perubahan satu proses hanya menambah
+    selisihnya ke rantai ancestor (O(depth)), bukan menghitung ulang semua.
+    Snapshot penuh (resync) menghitung ulang total untuk membuang drift.
+
+    Model mengurutkan children-nya sendiri (lihat ProcessProxyModel). Delta yang
+    mengubah struktur (exit, proses baru, ganti ppid) diterapkan tanpa sinyal
+    per baris di dalam satu layoutAboutToBeChanged/layoutChanged: anak yatim
+    dipindah sekaligus, children yang tersentuh diurutkan & dinomori ulang,
+    lalu persistent index dipetakan ulang per node.
+    """
+
+    def __init__(self, icon_for=None, parent=None):
+        super().__init__(parent)
+        self.icon_for = icon_for
+        self.root = ProcNode()
+        self._nodes = {}      # pid -> ProcNode
+        self._orphans = {}    # ppid yang belum terlihat -> set(pid) di root
+        self._dirty = set()
+        self._touched = set() # node yang daftar children-nya berubah (row basi)
+        self._sort = None     # (field, descending); None = urutan masuk
+
+    # --- Qt model interface ---
+    def index(self, row, column, parent=QModelIndex()):
+        children = (parent.internalPointer() if parent.isValid() else self.root).children
+        if 0 <= row < len(children) and 0 <= column < COLUMN_COUNT:
+            return self.createIndex(row, column, children[row])
+        return QModelIndex()
+
+    def parent(self, index=QModelIndex()):
+        if not index.isValid():
+            return QModelIndex()
+        node = index.internalPointer().parent
+        if node is None or node is self.root:
+            return QModelIndex()
+        return self.createIndex(node.row, 0, node)
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return len(parent.internalPointer().children) if parent.column() == 0 else 0
+        return len(self.root.children)
+
+    def hasChildren(self, parent=QModelIndex()):
+        # Dipanggil view per baris top-level saat relayout; tanpa lewat rowCount()
+        if parent.isValid():
+            return parent.column() == 0 and bool(parent.internalPointer().children)
+        return bool(self.root.children)
+
+    def columnCount(self, parent=QModelIndex()):
+        return len(COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return COLUMNS[section][1]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role not in DATA_ROLES or not index.isValid():
+            return None
+        node = index.internalPointer()
+        record = node.record
+        field = COLUMN_FIELDS[index.column()]
+        if field == HISTORY_FIELD:
+            return history_data(record, role)
+        value = max(getattr(node, field), 0.0) if field in AGGREGATE_FIELDS else record.get(field)
+
+        if role == DISPLAY_ROLE:
+            return format_field(field, value)
+        if role == SORT_ROLE:
+            return 0 if value is None else value
+        if role == PID_ROLE:
+            return record["pid"]
+        if role == TOOLTIP_ROLE and field in AGGREGATE_FIELDS and node.children:
+            return (f"Subtree: {format_field(field, value)} | "
+                    f"Process only: {format_field(field, record[field])}")
+        if role == DECORATION_ROLE and field == "name" and self.icon_for:
+            return self.icon_for(record)
+        if role == ALIGNMENT_ROLE and field in RIGHT_ALIGNED:
+            return ALIGN_RIGHT
+        if role == FOREGROUND_ROLE and field == "cpu":
+            if value > CPU_HIGH:
+                return CPU_HIGH_BRUSH
+            if value > CPU_WARN:
+                return CPU_WARN_BRUSH
+        return None
+
+    def _index_of(self, node, column=0):
+        if node is self.root:
+            return QModelIndex()
+        return self.createIndex(node.row, column, node)
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        if 0 <= column < len(COLUMN_FIELDS):
+            self._sort = (COLUMN_FIELDS[column], order == Qt.DescendingOrder)
+        else:
+            self._sort = None
+        saved = self._begin_layout()
+        self._touched.update(self._parents())
+        self._end_layout(saved)
+
+    # --- Update dari worker ---
+    def apply_delta(self, delta):
+        if delta["full"]:
+            self.update_processes(delta["added"])
+            return
+        changed = delta["changed"]
+        if delta["removed"] or delta["added"] or any("ppid" in diff for diff in changed.values()):
+            saved = self._begin_layout()
+            for pid in delta["removed"]:
+                self._remove(pid)
+            for pid, diff in changed.items():
+                self._change(pid, diff)
+            self._add_all(delta["added"])
+            self._end_layout(saved)
+            return
+        for pid, diff in changed.items():
+            self._change(pid, diff)
+        self._flush_dirty()
+
+    def drop_fields(self, fields):
+        """Buang field yang tidak lagi dikumpulkan dari semua node (bukan field total subtree)"""
+        for node in self._nodes.values():
+            for field in fields:
+                node.record.pop(field, None)
+        self._dirty.update(self._nodes.values())
+        self._flush_dirty()
+
+    def update_processes(self, data_list):
+        """Diff snapshot penuh lalu hitung ulang semua total subtree"""
+        saved = self._begin_layout()
+        incoming = {d["pid"]: d for d in data_list}
+        for pid in [pid for pid in self._nodes if pid not in incoming]:
+            self._remove(pid)
+        added = []
+        for pid, record in incoming.items():
+            node = self._nodes.get(pid)
+            if node is None:
+                added.append(record)
+            elif node.record["ctime"] != record["ctime"]:
+                self._remove(pid)
+                added.append(record)
+            else:
+                self._change(pid, record)
+        self._add_all(added)
+        self._recompute(self.root)
+        self._touched.update(self._parents())
+        self._end_layout(saved)
+
+    def _parents(self):
+        return [self.root] + [node for node in self._nodes.values() if node.children]
+
+    def _begin_layout(self):
+        self.layoutAboutToBeChanged.emit()
+        persistent = self.persistentIndexList()
+        return persistent, [(index.internalPointer(), index.column()) for index in persistent]
+
+    def _end_layout(self, saved):
+        """Urutkan children yang tersentuh, petakan ulang persistent index, layoutChanged"""
+        parents = self._touched
+        if self._sort is not None:
+            parents.update(node.parent for node in self._dirty if node.parent is not None)
+        self._reorder(parents)
+        self._touched = set()
+        # layoutChanged membuat view membaca ulang semua baris, dataChanged tidak perlu
+        self._dirty.clear()
+        persistent, targets = saved
+        self.changePersistentIndexList(
+            persistent, [QModelIndex() if node.parent is None else self.createIndex(node.row, column, node)
+                         for node, column in targets])
+        self.layoutChanged.emit()
+
+    def _reorder(self, parents):
+        key = reverse = None
+        if self._sort is not None:
+            key, reverse = node_sort_key(self._sort[0]), self._sort[1]
+        for parent in parents:
+            if key is not None:
+                parent.children.sort(key=key, reverse=reverse)
+            for row, child in enumerate(parent.children):
+                child.row = row
+
+    def _add_all(self, records):
+        # Parent biasanya lebih tua: urutkan by ctime agar parent masuk dulu
+        for record in sorted(records, key=lambda r: r["ctime"]):
+            if record["pid"] not in self._nodes:
+                self._add(dict(record))
+
+    def _add(self, record):
+        pid = record["pid"]
+        node = ProcNode(record)
+        self._nodes[pid] = node
+        self._attach(node, self._parent_for(record))
+
+        # Adopsi anak yang masuk lebih dulu dari parent-nya
+        for child_pid in self._orphans.pop(pid, ()):
+            child = self._nodes.get(child_pid)
+            if child is not None and child.parent is self.root and child.record["ctime"] >= record["ctime"]:
+                self._move(child, node)
+
+    def _parent_for(self, record):
+        ppid = record.get("ppid", 0)
+        parent = self._nodes.get(ppid)
+        # Parent harus lebih tua dari anak (ppid bisa menunjuk PID daur ulang)
+        if parent is not None and ppid != record["pid"] and parent.record["ctime"] <= record["ctime"]:
+            return parent
+        if ppid and ppid != record["pid"]:
+            self._orphans.setdefault(ppid, set()).add(record["pid"])
+        return self.root
+
+    # _attach/_detach/_move/_remove tanpa sinyal: hanya dipanggil di antara
+    # _begin_layout() dan _end_layout(), yang juga menomori ulang row
+    def _attach(self, node, parent):
+        node.parent = parent
+        node.row = len(parent.children)
+        parent.children.append(node)
+        self._touched.add(parent)
+        self._propagate(parent, node.cpu, node.mem)
+
+    def _detach(self, node):
+        """Lepas node dari parent & kurangi total ancestor"""
+        parent = node.parent
+        parent.children.remove(node)
+        self._touched.add(parent)
+        self._propagate(parent, -node.cpu, -node.mem)
+        node.parent = None
+
+    def _move(self, node, new_parent):
+        self._detach(node)
+        self._attach(node, new_parent)
+
+    def _remove(self, pid):
+        node = self._nodes.pop(pid, None)
+        if node is None:
+            return
+        # Anak yatim naik ke root sampai scan berikutnya melaporkan ppid baru
+        for child in list(node.children):
+            self._move(child, self.root)
+        self._detach(node)
+        self._dirty.discard(node)
+        self._touched.discard(node)
+        self._forget_orphan(node.record.get("ppid"), pid)
+
+    def _forget_orphan(self, ppid, pid):
+        orphans = self._orphans.get(ppid)
+        if orphans is not None:
+            orphans.discard(pid)
+            if not orphans:
+                del self._orphans[ppid]
+
+    def _change(self, pid, diff):
+        node = self._nodes.get(pid)
+        if node is None:
+            return
+        record = node.record
+        d_cpu = diff.get("cpu", record["cpu"]) - record["cpu"]
+        d_mem = diff.get("mem", record["mem"]) - record["mem"]
+        reparent = "ppid" in diff and diff["ppid"] != record.get("ppid")
+        if reparent:
+            self._forget_orphan(record.get("ppid"), pid)
+        record.update(diff)
+        if d_cpu or d_mem:
+            node.cpu += d_cpu
+            node.mem += d_mem
+            self._propagate(node.parent, d_cpu, d_mem)
+        self._dirty.add(node)
+        if reparent:
+            new_parent = self._parent_for(record)
+            # Cegah siklus: parent baru tidak boleh berada di subtree node ini
+            walk = new_parent
+            while walk is not None and walk is not node:
+                walk = walk.parent
+            if walk is node:
+                new_parent = self.root
+            if new_parent is not node.parent:
+                self._move(node, new_parent)
+
+    def _propagate(self, node, d_cpu, d_mem):
+        while node is not None and node is not self.root:
+            node.cpu += d_cpu
+            node.mem += d_mem
+            self._dirty.add(node)
+            node = node.parent
+
+    def _recompute(self, node):
+        cpu, mem = (node.record["cpu"], node.record["mem"]) if node.record else (0.0, 0.0)
+        for child in node.children:
+            c, m = self._recompute(child)
+            cpu += c
+            mem += m
+        node.cpu, node.mem = cpu, mem
+        return cpu, mem
+
+    def _flush_dirty(self):
+        """Delta tanpa perubahan struktur: layout change bila urutan berubah, selain itu dataChanged"""
+        parents = {node.parent for node in self._dirty if node.parent is not None}
+        if self._sort is not None:
+            key, reverse = node_sort_key(self._sort[0]), self._sort[1]
+            for parent in parents:
+                order = sorted(parent.children, key=key, reverse=reverse)
+                if not all(a is b for a, b in zip(order, parent.children)):
+                    self._end_layout(self._begin_layout())
+                    return
+        # Satu dataChanged per parent (rentang row anak yang berubah)
+        rows = {}
+        for node in self._dirty:
+            if node.parent is not None:
+                first, last = rows.get(node.parent, (node.row, node.row))
+                rows[node.parent] = (min(first, node.row), max(last, node.row))
+        self._dirty.clear()
+        last_column = len(COLUMNS) - 1
+        for parent, (first, last) in rows.items():
+            index = self._index_of(parent)
+            self.dataChanged.emit(self.index(first, 0, index), self.index(last, last_column, index))
+
+    def records(self):
+        return [node.record for node in self._nodes.values()]
+
+
+# --- GROUP MODEL ---
+GROUP_SUM_FIELDS = ("cpu", "mem", "io_read", "io_write", "threads", "ctx_vol", "ctx_invol")
+GROUP_MODES = ("app", "user", "cgroup")
+
+
+def group_key(mode, record):
+    """(key, label) grup untuk record; aplikasi dikenali dari exe path, fallback nama"""
+    if mode == "user":
+        return record["user"], record["user"]
+    if mode == "cgroup":
+        # key = path cgroup grup, sama dengan key delta["cgroups"]
+        return cgroup_unit(record.get("cgroup", ""))
+    return record["path"] or record["name"], record["name"]
+
+
+class ProcGroup:
+    """Satu grup; totals = jumlah field GROUP_SUM_FIELDS semua member"""
+    __slots__ = ("key", "label", "row", "members", "row_of", "totals")
+
+    def __init__(self, key, label):
+        self.key = key
+        self.label = label
+        self.row = 0
+        self.members = []  # record dict, urutan = baris child
+        self.row_of = {}   # pid -> index di members
+        self.totals = dict.fromkeys(GROUP_SUM_FIELDS, 0.0)
+
+    def append(self, record):
+        self.row_of[record["pid"]] = len(self.members)
+        self.members.append(record)
+
+    def pop(self, row):
+        """Hapus member di `row`; member sesudahnya naik satu baris"""
+        record = self.members.pop(row)
+        del self.row_of[record["pid"]]
+        for i in range(row, len(self.members)):
+            self.row_of[self.members[i]["pid"]] = i
+        return record
+
+    def add_totals(self, record, sign=1):
+        for field in GROUP_SUM_FIELDS:
+            value = record.get(field)
+            if value is not None:
+                self.totals[field] += sign * value
+
+
+class ProcessGroupModel(QAbstractItemModel):
+    """
+    Dua level: grup (aplikasi / user) lalu member-nya. Delta worker hanya
+    menyentuh grup yang terkena: add/remove menambah/mengurangi total,
+    perubahan field menambah selisihnya, dan perubahan exe/nama/user
+    memindahkan member ke grup lain. Snapshot penuh menghitung ulang total.
+    Mode cgroup: CPU & memory grup dari delta["cgroups"] (cpu.stat /
+    memory.current, termasuk proses yang tidak dikirim di mode top-N);
+    field lain dan grup tanpa file cgroup tetap memakai jumlah member.
+
+    Seperti tabel & pohon, model mengurutkan grup dan member-nya sendiri
+    sekali per delta.
+    """
+
+    def __init__(self, mode="app", icon_for=None, parent=None):
+        super().__init__(parent)
+        self.mode = mode
+        self.icon_for = icon_for
+        self._groups = []      # urutan = baris level atas
+        self._group_of = {}    # key -> ProcGroup
+        self._member_of = {}   # pid -> ProcGroup
+        self._top = object()   # internalPointer untuk baris grup
+        self._dirty = set()    # grup yang baris totalnya perlu di-repaint
+        self._changed = {}     # ProcGroup -> set(pid) member yang berubah
+        self._stats = {}       # key grup -> {"cpu", "mem"} dari file cgroup
+        self._sort = None      # (field, descending); None = urutan masuk
+
+    def set_mode(self, mode, records):
+        """Ganti kriteria grup: rebuild penuh (jarang, dipicu user)"""
+        self.beginResetModel()
+        self.mode = mode
+        self._groups, self._group_of, self._member_of = [], {}, {}
+        for record in records:
+            key, label = group_key(mode, record)
+            group = self._group_of.get(key)
+            if group is None:
+                group = ProcGroup(key, label)
+                group.row = len(self._groups)
+                self._groups.append(group)
+                self._group_of[key] = group
+            record = dict(record)
+            group.append(record)
+            group.add_totals(record)
+            self._member_of[record["pid"]] = group
+        self._changed = {}
+        self._dirty = set(self._groups)
+        self.endResetModel()
+        self._flush_dirty()
+
+    # --- Qt model interface ---
+    def index(self, row, column, parent=QModelIndex()):
+        if not 0 <= column < len(COLUMNS):
+            return QModelIndex()
+        if not parent.isValid():
+            if 0 <= row < len(self._groups):
+                return self.createIndex(row, column, self._top)
+            return QModelIndex()
+        if parent.internalPointer() is not self._top:
+            return QModelIndex()
+        group = self._groups[parent.row()]
+        if 0 <= row < len(group.members):
+            return self.createIndex(row, column, group)
+        return QModelIndex()
+
+    def parent(self, index=QModelIndex()):
+        if not index.isValid():
+            return QModelIndex()
+        group = index.internalPointer()
+        if group is self._top:
+            return QModelIndex()
+        return self.createIndex(group.row, 0, self._top)
+
+    def rowCount(self, parent=QModelIndex()):
+        if not parent.isValid():
+            return len(self._groups)
+        if parent.internalPointer() is self._top and parent.column() == 0:
+            return len(self._groups[parent.row()].members)
+        return 0
+
+    def columnCount(self, parent=QModelIndex()):
+        return len(COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return COLUMNS[section][1]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role not in DATA_ROLES or not index.isValid():
+            return None
+        field = COLUMN_FIELDS[index.column()]
+        pointer = index.internalPointer()
+        if pointer is not self._top:
+            return self._member_data(pointer.members[index.row()], field, role)
+        return self._group_data(self._groups[index.row()], field, role)
+
+    def _member_data(self, record, field, role):
+        if field == HISTORY_FIELD:
+            return history_data(record, role)
+        value = record.get(field)
+        if role == DISPLAY_ROLE:
+            return format_field(field, value)
+        if role == SORT_ROLE:
+            return 0 if value is None else value
+        if role == PID_ROLE:
+            return record["pid"]
+        if role == DECORATION_ROLE and field == "name" and self.icon_for:
+            return self.icon_for(record)
+        if role == ALIGNMENT_ROLE and field in RIGHT_ALIGNED:
+            return ALIGN_RIGHT
+        if role == FOREGROUND_ROLE and field == "cpu":
+            if value > CPU_HIGH:
+                return CPU_HIGH_BRUSH
+            if value > CPU_WARN:
+                return CPU_WARN_BRUSH
+        return None
+
+    def _group_stats(self, group):
+        return self._stats.get(group.key) if self.mode == "cgroup" else None
+
+    def _group_value(self, group, field):
+        """Nilai kolom baris grup (juga dipakai untuk sorting)"""
+        stats = self._group_stats(group)
+        if stats is not None and field in stats:
+            return stats[field]
+        if field in GROUP_SUM_FIELDS:
+            return max(group.totals[field], 0.0)
+        if field == "name":
+            return group.label
+        if field == "pid":
+            return len(group.members)
+        if field == "user":
+            return group.key if self.mode == "user" else ""
+        return None
+
+    def _group_data(self, group, field, role):
+        count = len(group.members)
+        stats = self._group_stats(group)
+        value = self._group_value(group, field)
+
+        if role == DISPLAY_ROLE:
+            if field == "name":
+                return f"{group.label} ({count})"
+            if field == "pid":
+                return f"{count} proc"
+            return format_field(field, value) if field in GROUP_SUM_FIELDS else value
+        if role == SORT_ROLE:
+            return value if value is not None else 0
+        if role == TOOLTIP_ROLE and field == "name":
+            if stats is not None:
+                return (f"{group.key}\n{count} processes\n"
+                        "CPU & memory: cgroup totals (cpu.stat, memory.current)")
+            return f"{group.key}\n{count} processes"
+        if role == DECORATION_ROLE and field == "name" and self.icon_for and group.members:
+            return self.icon_for(group.members[0])
+        if role == ALIGNMENT_ROLE and (field in RIGHT_ALIGNED or field == "pid"):
+            return ALIGN_RIGHT
+        if role == FOREGROUND_ROLE and field == "cpu":
+            if value > CPU_HIGH:
+                return CPU_HIGH_BRUSH
+            if value > CPU_WARN:
+                return CPU_WARN_BRUSH
+        return None
+
+    # --- Update dari worker ---
+    def apply_delta(self, delta):
+        if self.mode == "cgroup":
+            self.set_group_stats(delta.get("cgroups") or {})
+        if delta["full"]:
+            self.update_processes(delta["added"])
+            return
+        for pid in delta["removed"]:
+            self._remove(pid)
+        for pid, diff in delta["changed"].items():
+            self._change(pid, diff)
+        for record in delta["added"]:
+            if record["pid"] not in self._member_of:
+                self._add(dict(record))
+        self._flush_dirty()
+
+    def set_group_stats(self, stats):
+        """Total per grup dari file cgroup; baris grup di-repaint di _flush_dirty()"""
+        self._stats = stats
+        self._dirty.update(self._group_of[key] for key in stats if key in self._group_of)
+
+    def drop_fields(self, fields):
+        """Buang field yang tidak lagi dikumpulkan dari member, lalu hitung ulang totalnya"""
+        for group in self._groups:
+            for field in fields:
+                for member in group.members:
+                    member.pop(field, None)
+                if field in GROUP_SUM_FIELDS:
+                    group.totals[field] = sum(member.get(field) or 0.0 for member in group.members)
+            self._changed[group] = set(group.row_of)
+            self._dirty.add(group)
+        self._flush_dirty()
+
+    def update_processes(self, data_list):
+        """Diff snapshot penuh, lalu hitung ulang total semua grup (buang drift)"""
+        incoming = {d["pid"]: d for d in data_list}
+        for pid in [pid for pid in self._member_of if pid not in incoming]:
+            self._remove(pid)
+        for pid, record in incoming.items():
+            group = self._member_of.get(pid)
+            if group is None:
+                self._add(dict(record))
+                continue
+            member = self._find(group, pid)[1]
+            if member["ctime"] != record["ctime"]:
+                self._remove(pid)
+                self._add(dict(record))
+            else:
+                self._change(pid, record)
+        for group in self._groups:
+            group.totals = dict.fromkeys(GROUP_SUM_FIELDS, 0.0)
+            for member in group.members:
+                group.add_totals(member)
+            self._dirty.add(group)
+        self._flush_dirty()
+
+    def _find(self, group, pid):
+        row = group.row_of.get(pid)
+        if row is None:
+            return None, None
+        return row, group.members[row]
+
+    def _group_for(self, record):
+        key, label = group_key(self.mode, record)
+        group = self._group_of.get(key)
+        if group is None:
+            group = ProcGroup(key, label)
+            row = len(self._groups)
+            self.beginInsertRows(QModelIndex(), row, row)
+            group.row = row
+            self._groups.append(group)
+            self._group_of[key] = group
+            self.endInsertRows()
+        return group
+
+    def _add(self, record):
+        group = self._group_for(record)
+        row = len(group.members)
+        self.beginInsertRows(self.createIndex(group.row, 0, self._top), row, row)
+        group.append(record)
+        self.endInsertRows()
+        group.add_totals(record)
+        self._member_of[record["pid"]] = group
+        self._dirty.add(group)
+
+    def _remove(self, pid):
+        group = self._member_of.pop(pid, None)
+        if group is None:
+            return None
+        row = group.row_of[pid]
+        self.beginRemoveRows(self.createIndex(group.row, 0, self._top), row, row)
+        record = group.pop(row)
+        self.endRemoveRows()
+        group.add_totals(record, -1)
+        if group.members:
+            self._dirty.add(group)
+        else:
+            self._drop_group(group)
+        return record
+
+    def _drop_group(self, group):
+        self.beginRemoveRows(QModelIndex(), group.row, group.row)
+        del self._groups[group.row]
+        del self._group_of[group.key]
+        # Renumber sebelum endRemoveRows: handler rowsRemoved memanggil parent()
+        for i in range(group.row, len(self._groups)):
+            self._groups[i].row = i
+        self.endRemoveRows()
+        self._dirty.discard(group)
+
+    def _change(self, pid, diff):
+        group = self._member_of.get(pid)
+        if group is None:
+            return
+        row, record = self._find(group, pid)
+        if group_key(self.mode, {**record, **diff})[0] != group.key:
+            # exe/nama/user berubah: pindah grup
+            record = self._remove(pid)
+            record.update(diff)
+            self._add(record)
+            return
+        for field in GROUP_SUM_FIELDS:
+            if field in diff:
+                group.totals[field] += diff[field] - (record.get(field) or 0.0)
+        record.update(diff)
+        self._changed.setdefault(group, set()).add(pid)
+        self._dirty.add(group)
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        if 0 <= column < len(COLUMN_FIELDS):
+            self._sort = (COLUMN_FIELDS[column], order == Qt.DescendingOrder)
+        else:
+            self._sort = None
+        self._dirty.update(self._groups)
+        self._flush_dirty()
+
+    def _group_sort_key(self, field):
+        if field == HISTORY_FIELD:
+            field = "cpu"
+        if field in TEXT_FIELDS:
+            return lambda group: (self._group_value(group, field) or "").lower()
+        return lambda group: self._group_value(group, field) or 0
+
+    def _resort(self):
+        """
+        Urutkan grup dan member grup yang berubah. Bila urutan berubah: satu
+        layoutChanged (persistent index dipetakan per grup/PID), return True.
+        """
+        if self._sort is None:
+            return False
+        field, descending = self._sort
+        groups = sorted(self._groups, key=self._group_sort_key(field), reverse=descending)
+        member_key = sort_key(field)
+        orders = {}
+        for group in self._dirty:
+            members = sorted(group.members, key=member_key, reverse=descending)
+            if not all(a is b for a, b in zip(members, group.members)):
+                orders[group] = members
+        if not orders and all(a is b for a, b in zip(groups, self._groups)):
+            return False
+
+        self.layoutAboutToBeChanged.emit()
+        persistent = self.persistentIndexList()
+        saved = []
+        for index in persistent:
+            pointer = index.internalPointer()
+            if pointer is self._top:
+                saved.append((self._groups[index.row()], None, index.column()))
+            else:
+                saved.append((pointer, pointer.members[index.row()]["pid"], index.column()))
+        self._groups = groups
+        for row, group in enumerate(groups):
+            group.row = row
+        for group, members in orders.items():
+            group.members = members
+            group.row_of = {record["pid"]: row for row, record in enumerate(members)}
+        self.changePersistentIndexList(
+            persistent, [self.createIndex(group.row, column, self._top) if pid is None
+                         else self.createIndex(group.row_of[pid], column, group)
+                         for group, pid, column in saved])
+        self.layoutChanged.emit()
+        return True
+
+    def _flush_dirty(self):
+        changed, self._changed = self._changed, {}
+        if self._resort():
+            # layoutChanged membuat view membaca ulang semua baris
+            self._dirty.clear()
+            return
+        last = len(COLUMNS) - 1
+        if self._dirty:
+            rows = [group.row for group in self._dirty]
+            self.dataChanged.emit(self.createIndex(min(rows), 0, self._top),
+                                  self.createIndex(max(rows), last, self._top))
+        # Satu dataChanged per grup (rentang member yang berubah)
+        for group, pids in changed.items():
+            rows = [group.row_of[pid] for pid in pids if pid in group.row_of]
+            if rows and self._group_of.get(group.key) is group:
+                self.dataChanged.emit(self.createIndex(min(rows), 0, group),
+                                      self.createIndex(max(rows), last, group))
+        self._dirty.clear()
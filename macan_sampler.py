@@ -0,0 +1,441 @@
+"""
+Macan Sampling Hub - Shared metric sampler untuk Macan Monitoring Suite
+File: macan_sampler.py
+
+Satu thread mengambil setiap metrik (CPU, RAM, Swap, Network, Battery, Disk)
+sekali per tick lalu mem-publish hasilnya ke semua subscriber, sehingga
+modul yang tampil bersamaan tidak membaca counter yang sama berkali-kali.
+
+CPU/RAM/Swap/Network dibaca lewat backend yang bisa diganti: ProcFSBackend
+(Linux, baca /proc langsung) atau PsutilBackend (fallback semua platform).
+Jalankan `python macan_sampler.py --bench` untuk membandingkan biaya per tick.
+"""
+
+import os
+import sys
+import time
+import threading
+from collections import deque
+import psutil
+from PySide6.QtCore import QThread, Signal, QCoreApplication
+
+from macan_history import get_metric_store
+
+# Metric groups yang bisa di-subscribe
+METRIC_SYSTEM = "system"    # cpu, ram, swap
+METRIC_NET = "net"          # dl, ul (bytes/s)
+METRIC_BATTERY = "battery"  # batt_percent, batt_plugged
+METRIC_DISK = "disk"        # disks (list of dict)
+
+ALL_METRICS = (METRIC_SYSTEM, METRIC_NET, METRIC_BATTERY, METRIC_DISK)
+
+# Interval default tiap metric group (detik)
+DEFAULT_INTERVALS = {
+    METRIC_SYSTEM: 1.0,
+    METRIC_NET: 1.0,
+    METRIC_BATTERY: 1.0,
+    METRIC_DISK: 5.0,
+}
+
+# Paksa backend tertentu: MACAN_SAMPLER_BACKEND=psutil / procfs
+BACKEND_ENV = "MACAN_SAMPLER_BACKEND"
+
+
+# --- BACKENDS ---
+class PsutilBackend:
+    """Backend portable berbasis psutil"""
+    name = "psutil"
+
+    def read_system(self):
+        """Return (cpu_percent, ram_percent, swap_percent)"""
+        cpu = psutil.cpu_percent(interval=None)
+        ram = psutil.virtual_memory().percent
+        swap = psutil.swap_memory().percent
+        return cpu, ram, swap
+
+    def read_net(self):
+        """Return (bytes_recv, bytes_sent) kumulatif semua interface"""
+        net = psutil.net_io_counters()
+        return net.bytes_recv, net.bytes_sent
+
+    def close(self):
+        pass
+
+
+class ProcFSBackend:
+    """
+    Backend Linux: file /proc dibuka sekali (fd persisten) lalu dibaca ulang
+    dengan pread dari offset 0 ke buffer yang sama setiap tick, kemudian
+    di-parse satu kali jalan tanpa membuat namedtuple.
+    """
+    name = "procfs"
+
+    def __init__(self, root="/proc"):
+        self._fds = {}
+        self._buf = bytearray(16384)
+        self._view = memoryview(self._buf)
+        self._last_cpu = None  # (busy, total)
+        for key in ("stat", "meminfo", "net/dev"):
+            self._fds[key] = os.open(os.path.join(root, key), os.O_RDONLY)
+
+    @staticmethod
+    def available(root="/proc"):
+        return (sys.platform.startswith("linux") and hasattr(os, "preadv")
+                and all(os.access(os.path.join(root, k), os.R_OK)
+                        for k in ("stat", "meminfo", "net/dev")))
+
+    def _read(self, key):
+        fd = self._fds[key]
+        n = os.preadv(fd, [self._buf], 0)
+        while n == len(self._buf):
+            # Buffer kurang besar (mis. banyak interface): gandakan lalu baca ulang
+            self._view.release()
+            self._buf = bytearray(len(self._buf) * 2)
+            self._view = memoryview(self._buf)
+            n = os.preadv(fd, [self._buf], 0)
+        return self._view[:n]
+
+    def read_system(self):
+        # /proc/stat: cukup baris pertama "cpu  user nice system idle iowait irq softirq steal ..."
+        data = self._read("stat")
+        end = self._buf.find(b"\n", 0, len(data))
+        fields = bytes(data[:end]).split()
+        times = [int(v) for v in fields[1:9]]
+        total = sum(times)
+        busy = total - times[3] - times[4]
+        cpu = 0.0
+        if self._last_cpu is not None:
+            d_total = total - self._last_cpu[1]
+            if d_total > 0:
+                cpu = round(max(0.0, min(100.0, (busy - self._last_cpu[0]) / d_total * 100)), 1)
+        self._last_cpu = (busy, total)
+
+        # /proc/meminfo: satu pass, berhenti setelah 4 key yang dibutuhkan ketemu
+        mem = {}
+        for line in bytes(self._read("meminfo")).split(b"\n"):
+            key, _, rest = line.partition(b":")
+            if key in (b"MemTotal", b"MemFree", b"MemAvailable", b"SwapTotal", b"SwapFree"):
+                mem[key] = int(rest.split()[0])
+                if len(mem) == 5:
+                    break
+        mem_total = mem.get(b"MemTotal", 0)
+        mem_avail = mem.get(b"MemAvailable", mem.get(b"MemFree", 0))
+        ram = round((mem_total - mem_avail) / mem_total * 100, 1) if mem_total else 0.0
+        swap_total = mem.get(b"SwapTotal", 0)
+        swap = round((swap_total - mem.get(b"SwapFree", 0)) / swap_total * 100, 1) if swap_total else 0.0
+        return cpu, ram, swap
+
+    def read_net(self):
+        # /proc/net/dev: 2 baris header, lalu "iface: rx_bytes ... (8 kolom) tx_bytes ..."
+        recv = sent = 0
+        lines = bytes(self._read("net/dev")).split(b"\n")
+        for line in lines[2:]:
+            _, sep, rest = line.partition(b":")
+            if not sep:
+                continue
+            cols = rest.split()
+            recv += int(cols[0])
+            sent += int(cols[8])
+        return recv, sent
+
+    def close(self):
+        for fd in self._fds.values():
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        self._fds.clear()
+
+
+# --- SCHEDULER ---
+class DeadlineScheduler:
+    """
+    Scheduler berbasis deadline absolut (time.monotonic). Setiap key punya
+    period sendiri; deadline berikutnya = deadline sebelumnya + period, jadi
+    waktu yang habis untuk sampling/GC tidak menggeser jadwal (drift-free).
+    Bila tertinggal lebih dari satu period, deadline yang terlewat dilompati.
+    """
+
+    def __init__(self, history=60):
+        self._periods = {}    # key -> period (detik)
+        self._deadlines = {}  # key -> deadline absolut berikutnya
+        self._last_fire = {}  # key -> waktu fire terakhir
+        self._lateness = deque(maxlen=history)
+
+    def set_period(self, key, period):
+        """Set/ubah period; None menghapus key dari jadwal"""
+        if period is None:
+            self._periods.pop(key, None)
+            self._deadlines.pop(key, None)
+            self._last_fire.pop(key, None)
+            return
+        old = self._periods.get(key)
+        self._periods[key] = period
+        if key not in self._deadlines:
+            self._deadlines[key] = time.monotonic()
+        elif old is not None and period < old:
+            # Rate naik: jangan tunggu sisa period lama
+            self._deadlines[key] = min(self._deadlines[key], self._last_fire.get(key, 0.0) + period)
+
+    def keys(self):
+        return set(self._periods)
+
+    def due(self, now):
+        return [k for k, d in self._deadlines.items() if d <= now]
+
+    def time_to_next(self, now):
+        """Detik sampai deadline terdekat, atau None bila jadwal kosong"""
+        if not self._deadlines:
+            return None
+        return max(0.0, min(self._deadlines.values()) - now)
+
+    def fire(self, key, now):
+        """
+        Catat bahwa key dijalankan pada `now`. Return (dt, lateness): dt adalah
+        selang nyata sejak fire sebelumnya (None pada fire pertama), lateness
+        adalah keterlambatan terhadap deadline (jitter penjadwalan).
+        """
+        deadline = self._deadlines[key]
+        period = self._periods[key]
+        lateness = now - deadline
+        self._lateness.append(lateness)
+
+        last = self._last_fire.get(key)
+        dt = (now - last) if last is not None else None
+        self._last_fire[key] = now
+
+        deadline += period
+        if deadline <= now:
+            missed = int((now - deadline) // period) + 1
+            deadline += missed * period
+        self._deadlines[key] = deadline
+        return dt, lateness
+
+    def jitter_stats(self):
+        """Return (mean, max) keterlambatan dalam detik dari riwayat terakhir"""
+        if not self._lateness:
+            return 0.0, 0.0
+        return sum(self._lateness) / len(self._lateness), max(self._lateness)
+
+
+def select_backend(name=None):
+    """Pilih backend: procfs di Linux bila tersedia, selain itu psutil"""
+    name = name or os.environ.get(BACKEND_ENV, "")
+    if name != "psutil" and ProcFSBackend.available():
+        try:
+            return ProcFSBackend()
+        except OSError as e:
+            print(f"Sampler: procfs backend unavailable ({e}), using psutil")
+    return PsutilBackend()
+
+
+class SamplingHub(QThread):
+    """
+    Central sampler. Subscriber mendaftar dengan subscribe(owner, metrics) dan
+    menerima hasil lewat sample_ready(dict); key pada dict hanya berisi metrik
+    yang diambil pada tick tersebut.
+    """
+    sample_ready = Signal(dict)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._running = False
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._subscribers = {}  # id(owner) -> [set(metrics), scale]
+        self.scheduler = DeadlineScheduler()
+        self._last_net = None  # (timestamp, bytes_recv, bytes_sent)
+        self.backend = select_backend()
+        self.store = get_metric_store()  # riwayat semua metrik (macan_history.py)
+        self.tick_cost = 0.0  # durasi (detik) sampling pada tick terakhir
+
+    # --- SUBSCRIPTION ---
+    def subscribe(self, owner, metrics):
+        """Daftarkan owner untuk metric groups tertentu; thread start otomatis"""
+        with self._lock:
+            self._subscribers[id(owner)] = [set(metrics), 1.0]
+        self._wake.set()
+        if not self.isRunning():
+            self._running = True
+            self.start()
+
+    def unsubscribe(self, owner):
+        with self._lock:
+            self._subscribers.pop(id(owner), None)
+        self._wake.set()
+
+    def set_rate(self, owner, scale):
+        """
+        Skala interval untuk satu subscriber: 1.0 = normal, >1 = lebih jarang,
+        None = pause (metric owner ini tidak ikut dihitung).
+        """
+        with self._lock:
+            entry = self._subscribers.get(id(owner))
+            if entry is None or entry[1] == scale:
+                return
+            entry[1] = scale
+        self._wake.set()
+
+    def active_periods(self):
+        """Return {metric: period}; period = interval tercepat dari subscriber aktif"""
+        with self._lock:
+            periods = {}
+            for metrics, scale in self._subscribers.values():
+                if scale is None:
+                    continue
+                for metric in metrics:
+                    period = DEFAULT_INTERVALS[metric] * scale
+                    if metric not in periods or period < periods[metric]:
+                        periods[metric] = period
+            return periods
+
+    # --- COLLECTORS ---
+    def _collect_system(self, sample):
+        sample['cpu'], sample['ram'], sample['swap'] = self.backend.read_system()
+
+    def _collect_net(self, sample):
+        # Rate dibagi dengan selang nyata antar pembacaan, bukan diasumsikan 1 detik
+        recv, sent = self.backend.read_net()
+        now = time.monotonic()
+        sample['dl'] = 0.0
+        sample['ul'] = 0.0
+        if self._last_net is not None:
+            dt = now - self._last_net[0]
+            if dt > 0:
+                sample['dl'] = max(0.0, (recv - self._last_net[1]) / dt)
+                sample['ul'] = max(0.0, (sent - self._last_net[2]) / dt)
+                sample['net_dt'] = dt
+        self._last_net = (now, recv, sent)
+
+    def _collect_battery(self, sample):
+        batt = psutil.sensors_battery()
+        if batt:
+            sample['batt_percent'] = int(batt.percent)
+            sample['batt_plugged'] = batt.power_plugged
+        else:
+            sample['batt_percent'] = -1
+            sample['batt_plugged'] = True
+
+    def _collect_disk(self, sample):
+        disk_data = []
+        for p in psutil.disk_partitions(all=False):
+            try:
+                if 'cdrom' in p.opts or p.fstype == '':
+                    continue
+                usage = psutil.disk_usage(p.mountpoint)
+                name = p.mountpoint
+                if name.endswith('\\'): name = name[:-1]
+                disk_data.append({
+                    'name': name,
+                    'device': p.device,
+                    'total': usage.total,
+                    'free': usage.free,
+                    'used': usage.used,
+                    'percent': usage.percent
+                })
+            except (PermissionError, OSError):
+                continue
+        sample['disks'] = disk_data
+
+    # --- LOOP ---
+    def run(self):
+        collectors = {
+            METRIC_SYSTEM: self._collect_system,
+            METRIC_NET: self._collect_net,
+            METRIC_BATTERY: self._collect_battery,
+            METRIC_DISK: self._collect_disk,
+        }
+        while self._running:
+            self._wake.clear()
+            periods = self.active_periods()
+
+            # Sinkronkan jadwal dengan metric yang sedang di-subscribe
+            for metric in ALL_METRICS:
+                if metric in periods:
+                    self.scheduler.set_period(metric, periods[metric])
+                elif metric in self.scheduler.keys():
+                    self.scheduler.set_period(metric, None)
+                    if metric == METRIC_NET:
+                        self._last_net = None
+
+            now = time.monotonic()
+            due = self.scheduler.due(now)
+            if due:
+                t_start = time.perf_counter()
+                sample = {}
+                lateness = 0.0
+                for metric in sorted(due, key=ALL_METRICS.index):
+                    _, late = self.scheduler.fire(metric, now)
+                    lateness = max(lateness, late)
+                    try:
+                        collectors[metric](sample)
+                    except Exception as e:
+                        print(f"Sampler error ({metric}): {e}")
+
+                if sample and self._running:
+                    self.store.append_sample(sample)
+                    self.tick_cost = time.perf_counter() - t_start
+                    sample['backend'] = self.backend.name
+                    sample['tick_cost'] = self.tick_cost
+                    sample['jitter'] = lateness
+                    sample['jitter_mean'], sample['jitter_max'] = self.scheduler.jitter_stats()
+                    self.sample_ready.emit(sample)
+
+            # Tidur sampai deadline terdekat (atau sampai ada subscriber baru)
+            self._wake.wait(self.scheduler.time_to_next(time.monotonic()))
+
+    def stop(self):
+        """Hentikan thread sampler secara aman"""
+        self._running = False
+        self._wake.set()
+        self.wait(3000)
+        self.backend.close()
+        self.store.flush()
+
+
+_hub_instance = None
+
+def get_sampling_hub():
+    """Get global sampling hub instance (Singleton)"""
+    global _hub_instance
+    if _hub_instance is None:
+        _hub_instance = SamplingHub()
+        # Pastikan thread berhenti sebelum QApplication di-destroy
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(_hub_instance.stop)
+    return _hub_instance
+
+
+# --- BENCHMARK ---
+def benchmark_backends(ticks=500):
+    """Ukur biaya rata-rata read_system + read_net per tick untuk tiap backend"""
+    backends = [PsutilBackend()]
+    if ProcFSBackend.available():
+        backends.append(ProcFSBackend())
+
+    results = {}
+    for backend in backends:
+        backend.read_system()
+        backend.read_net()
+        t0 = time.perf_counter()
+        c0 = time.process_time()
+        for _ in range(ticks):
+            backend.read_system()
+            backend.read_net()
+        results[backend.name] = ((time.perf_counter() - t0) / ticks,
+                                 (time.process_time() - c0) / ticks)
+        backend.close()
+    return results
+
+
+if __name__ == "__main__":
+    if "--bench" in sys.argv:
+        ticks = 500
+        results = benchmark_backends(ticks)
+        print(f"Per-tick sampling cost over {ticks} ticks (cpu+ram+swap+net):")
+        print(f"{'backend':<10}{'wall (us)':>12}{'cpu (us)':>12}")
+        for name, (wall, cpu) in results.items():
+            print(f"{name:<10}{wall * 1e6:>12.1f}{cpu * 1e6:>12.1f}")
+        if "psutil" in results and "procfs" in results:
+            print(f"speedup: {results['psutil'][0] / results['procfs'][0]:.1f}x")
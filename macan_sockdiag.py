@@ -0,0 +1,304 @@
+"""
+Macan Sock Diag - Throughput TCP per proses (Linux) untuk Live App Connections
+File: macan_sockdiag.py
+
+SockDiag mengambil semua socket TCP sekaligus lewat netlink NETLINK_SOCK_DIAG
+(inet_diag, sama dengan `ss -ti`) beserta tcp_info: tcpi_bytes_acked (upload)
+dan tcpi_bytes_received (download), kumulatif per socket. Socket dipetakan
+ke PID lewat inode (symlink /proc/<pid>/fd/* = "socket:[inode]").
+
+ProcessBandwidth menghitung rate per PID dari delta counter per socket.
+Socket yang sudah close di antara dua sample kehilangan byte terakhirnya;
+proses milik user lain tanpa akses /proc/<pid>/fd tidak bisa dipetakan.
+
+Jalankan `python macan_sockdiag.py --loopback` untuk uji end-to-end: proses
+anak mengirim data lewat 127.0.0.1 ke proses ini, lalu upload anak & download
+proses ini dibandingkan dengan jumlah byte yang benar-benar dikirim.
+"""
+
+import os
+import sys
+import time
+import socket
+import struct
+import threading
+import subprocess
+
+NETLINK_SOCK_DIAG = 4
+SOCK_DIAG_BY_FAMILY = 20
+NLM_F_REQUEST = 0x1
+NLM_F_DUMP = 0x300
+NLMSG_ERROR = 2
+NLMSG_DONE = 3
+NLMSG_HEADER = struct.Struct("=LHHLL")
+INET_DIAG_REQ = struct.Struct("=BBBxI")
+INET_DIAG_SOCKID_SIZE = 48
+INET_DIAG_MSG_SIZE = 72
+INET_DIAG_INFO = 2
+RECV_SIZE = 65536
+
+# Offset di struct tcp_info (linux/tcp.h, kernel >= 4.2)
+TCPI_BYTES_ACKED = 120
+TCPI_BYTES_RECEIVED = 128
+
+TCP_ESTABLISHED = 1
+TCP_LISTEN = 10
+# Semua state kecuali LISTEN (tidak punya traffic); bit 0 tidak dipakai
+TCP_STATES = ((1 << 12) - 1) & ~(1 << TCP_LISTEN) & ~1
+
+SOCK_DIAG_AVAILABLE = sys.platform.startswith("linux") and hasattr(socket, "AF_NETLINK")
+
+LOOPBACK_BYTES = 32 * 1024 * 1024
+LOOPBACK_SECONDS = 3.0
+LOOPBACK_CHUNK = 64 * 1024
+LOOPBACK_TOLERANCE = 0.05   # Selisih maksimum terukur vs dikirim
+
+
+class TcpSocket:
+    """Satu socket TCP dari dump sock_diag; sent/received None bila tanpa tcp_info"""
+    __slots__ = ("inode", "state", "laddr", "raddr", "sent", "received")
+
+    def __init__(self, inode, state, laddr, raddr, sent, received):
+        self.inode = inode
+        self.state = state
+        self.laddr = laddr
+        self.raddr = raddr
+        self.sent = sent
+        self.received = received
+
+
+class SockDiag:
+    """Dump socket TCP IPv4/IPv6 lewat satu socket netlink yang dipakai ulang"""
+
+    def __init__(self):
+        self.sock = socket.socket(socket.AF_NETLINK, socket.SOCK_DGRAM, NETLINK_SOCK_DIAG)
+        self.sock.bind((0, 0))
+        self._seq = 0
+
+    def dump_tcp(self):
+        sockets = []
+        for family in (socket.AF_INET, socket.AF_INET6):
+            self._request(family)
+            self._receive(family, sockets)
+        return sockets
+
+    def _request(self, family):
+        self._seq += 1
+        req = INET_DIAG_REQ.pack(family, socket.IPPROTO_TCP, 1 << (INET_DIAG_INFO - 1),
+                                 TCP_STATES) + bytes(INET_DIAG_SOCKID_SIZE)
+        header = NLMSG_HEADER.pack(NLMSG_HEADER.size + len(req), SOCK_DIAG_BY_FAMILY,
+                                   NLM_F_REQUEST | NLM_F_DUMP, self._seq, 0)
+        self.sock.send(header + req)
+
+    def _receive(self, family, sockets):
+        addr_len = 4 if family == socket.AF_INET else 16
+        while True:
+            data = self.sock.recv(RECV_SIZE)
+            offset = 0
+            while offset + NLMSG_HEADER.size <= len(data):
+                length, msg_type = NLMSG_HEADER.unpack_from(data, offset)[:2]
+                if length < NLMSG_HEADER.size:
+                    return
+                if msg_type == NLMSG_DONE:
+                    return
+                if msg_type == NLMSG_ERROR:
+                    errno = -struct.unpack_from("=i", data, offset + NLMSG_HEADER.size)[0]
+                    raise OSError(errno, f"sock_diag: {os.strerror(errno)}")
+                if msg_type == SOCK_DIAG_BY_FAMILY:
+                    sockets.append(self._parse(data, offset + NLMSG_HEADER.size,
+                                               offset + length, family, addr_len))
+                offset += (length + 3) & ~3
+
+    @staticmethod
+    def _parse(data, o, end, family, addr_len):
+        state = data[o + 1]
+        sport, dport = struct.unpack_from("!HH", data, o + 4)
+        src = socket.inet_ntop(family, data[o + 8:o + 8 + addr_len])
+        dst = socket.inet_ntop(family, data[o + 24:o + 24 + addr_len])
+        inode = struct.unpack_from("=I", data, o + 68)[0]
+        sent = received = None
+        attr = o + INET_DIAG_MSG_SIZE
+        while attr + 4 <= end:
+            attr_len, attr_type = struct.unpack_from("=HH", data, attr)
+            if attr_len < 4:
+                break
+            if attr_type == INET_DIAG_INFO and attr_len - 4 >= TCPI_BYTES_RECEIVED + 8:
+                sent, received = struct.unpack_from("=QQ", data, attr + 4 + TCPI_BYTES_ACKED)
+            attr += (attr_len + 3) & ~3
+        return TcpSocket(inode, state, (src, sport), (dst, dport), sent, received)
+
+    def close(self):
+        self.sock.close()
+
+
+def socket_owners(root="/proc"):
+    """{inode socket: pid} dari /proc/<pid>/fd; socket yang di-share ke child = PID pertama"""
+    owners = {}
+    with os.scandir(root) as it:
+        for entry in it:
+            if not entry.name.isdigit():
+                continue
+            pid = int(entry.name)
+            fd_dir = f"{root}/{entry.name}/fd"
+            try:
+                fds = os.listdir(fd_dir)
+            except OSError:
+                continue  # Proses milik user lain atau sudah exit
+            for fd in fds:
+                try:
+                    target = os.readlink(f"{fd_dir}/{fd}")
+                except OSError:
+                    continue
+                if target.startswith("socket:["):
+                    owners.setdefault(int(target[8:-1]), pid)
+    return owners
+
+
+class ProcessBandwidth:
+    """
+    Throughput TCP per PID. Per sample: satu dump sock_diag, lalu inode -> PID
+    dari cache; /proc/*/fd hanya di-walk ulang bila muncul inode baru (inode
+    yang tetap tidak punya owner, mis. milik user lain, di-cache sebagai None).
+    Socket baru dihitung dari 0, kecuali pada sample pertama (baseline).
+    """
+
+    def __init__(self, root="/proc"):
+        self.root = root
+        self.diag = SockDiag()
+        self._owners = {}      # inode -> pid / None
+        self._prev = None      # inode -> (sent, received) sample sebelumnya
+        self._prev_time = None
+
+    def sample(self, now=None):
+        """{pid: {"rx": B/s, "tx": B/s, "sockets": [TcpSocket]}} untuk socket yang terpetakan"""
+        now = time.monotonic() if now is None else now
+        sockets = [s for s in self.diag.dump_tcp() if s.inode]
+        owners = self._owners
+        if any(s.inode not in owners for s in sockets):
+            found = socket_owners(self.root)
+            owners = {s.inode: found.get(s.inode) for s in sockets}
+        else:
+            owners = {s.inode: owners[s.inode] for s in sockets}
+        self._owners = owners
+
+        prev, dt = self._prev, None
+        if prev is not None and now > self._prev_time:
+            dt = now - self._prev_time
+        traffic, fresh = {}, {}
+        for s in sockets:
+            pid = owners[s.inode]
+            if pid is None:
+                continue
+            entry = traffic.get(pid)
+            if entry is None:
+                entry = traffic[pid] = {"rx": 0.0, "tx": 0.0, "sockets": []}
+            entry["sockets"].append(s)
+            if s.sent is None:
+                continue
+            fresh[s.inode] = (s.sent, s.received)
+            if dt is not None:
+                sent, received = prev.get(s.inode, (0, 0))
+                entry["tx"] += max(s.sent - sent, 0) / dt
+                entry["rx"] += max(s.received - received, 0) / dt
+        self._prev, self._prev_time = fresh, now
+        return traffic
+
+    def close(self):
+        self.diag.close()
+
+
+def open_bandwidth():
+    """ProcessBandwidth, atau None bila sock_diag tidak tersedia (non-Linux, kernel tanpa inet_diag)"""
+    if not SOCK_DIAG_AVAILABLE:
+        return None
+    try:
+        meter = ProcessBandwidth()
+        meter.sample()  # Baseline + cek dump berjalan
+        return meter
+    except OSError:
+        return None
+
+
+# --- LOOPBACK TEST ---
+def loopback_send(port, total, seconds):
+    """Proses anak: kirim `total` byte ke 127.0.0.1:port selama kira-kira `seconds` detik"""
+    chunk = bytes(LOOPBACK_CHUNK)
+    pause = seconds * LOOPBACK_CHUNK / total
+    with socket.create_connection(("127.0.0.1", port)) as conn:
+        sent = 0
+        while sent < total:
+            n = min(LOOPBACK_CHUNK, total - sent)
+            conn.sendall(chunk[:n])
+            sent += n
+            time.sleep(pause)
+        # Socket tetap terbuka sampai pengukur selesai membaca counter terakhir
+        conn.recv(1)
+
+
+def loopback_check(total=LOOPBACK_BYTES, seconds=LOOPBACK_SECONDS):
+    """
+    Return dict hasil: byte terukur untuk upload proses anak & download proses
+    ini (integral rate x dt) dibanding `total` yang dikirim.
+    """
+    meter = ProcessBandwidth()
+    server = socket.create_server(("127.0.0.1", 0))
+    port = server.getsockname()[1]
+    last = time.monotonic()
+    meter.sample(last)
+    child = subprocess.Popen([sys.executable, os.path.abspath(__file__),
+                              "--loopback-send", str(port), str(total), str(seconds)])
+    conn, _ = server.accept()
+    received = [0]
+
+    def drain():
+        while received[0] < total:
+            data = conn.recv(RECV_SIZE)
+            if not data:
+                break
+            received[0] += len(data)
+
+    reader = threading.Thread(target=drain)
+    reader.start()
+    tx = rx = peak_tx = 0.0
+    while True:
+        done = not reader.is_alive()
+        time.sleep(0.25)
+        now = time.monotonic()
+        traffic = meter.sample(now)
+        child_tx = traffic.get(child.pid, {}).get("tx", 0.0)
+        tx += child_tx * (now - last)
+        rx += traffic.get(os.getpid(), {}).get("rx", 0.0) * (now - last)
+        peak_tx = max(peak_tx, child_tx)
+        last = now
+        if done:
+            break
+    conn.sendall(b"x")
+    child.wait()
+    conn.close()
+    server.close()
+    meter.close()
+    return {"sent": total, "received": received[0], "child_tx": tx, "self_rx": rx,
+            "peak_tx": peak_tx}
+
+
+if __name__ == "__main__":
+    if "--loopback-send" in sys.argv:
+        i = sys.argv.index("--loopback-send")
+        loopback_send(int(sys.argv[i + 1]), int(sys.argv[i + 2]), float(sys.argv[i + 3]))
+        sys.exit(0)
+    if "--loopback" in sys.argv:
+        if not SOCK_DIAG_AVAILABLE:
+            print("sock_diag requires Linux")
+            sys.exit(1)
+        r = loopback_check()
+        mb = 1024 * 1024
+        print(f"Loopback transfer: {r['sent'] / mb:.1f} MB sent, {r['received'] / mb:.1f} MB received")
+        print(f"{'measured':>10}{'MB':>10}{'error':>9}")
+        ok = True
+        for label, value in (("child tx", r["child_tx"]), ("self rx", r["self_rx"])):
+            error = abs(value - r["sent"]) / r["sent"]
+            ok = ok and error <= LOOPBACK_TOLERANCE
+            print(f"{label:>10}{value / mb:>10.1f}{error:>8.1%}")
+        print(f"peak child upload: {r['peak_tx'] / mb:.1f} MB/s")
+        print("OK" if ok else "MISMATCH")
+        sys.exit(0 if ok else 1)
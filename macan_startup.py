@@ -0,0 +1,64 @@
+"""
+Macan Startup Profiler - Breakdown waktu startup untuk Macan Monitoring
+File: macan_startup.py
+
+Aktif dengan argumen --profile-startup. Mencatat waktu import dan konstruksi
+per module sampai frame pertama tergambar, lalu mencetak ringkasannya.
+Sengaja hanya memakai stdlib agar bisa di-import paling awal.
+"""
+
+import sys
+import time
+from contextlib import contextmanager
+
+PROFILE_FLAG = "--profile-startup"
+
+
+class StartupProfiler:
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.t0 = time.perf_counter()
+        self.records = []  # (start_offset, depth, category, label, seconds)
+        self._depth = 0
+        self._done = False
+
+    @contextmanager
+    def section(self, category, label):
+        """Ukur satu blok (import/construct); no-op bila profiler nonaktif"""
+        if not self.enabled or self._done:
+            yield
+            return
+        start = time.perf_counter()
+        depth = self._depth
+        self._depth += 1
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            self.records.append((start - self.t0, depth, category, label,
+                                 time.perf_counter() - start))
+
+    def first_paint(self):
+        """Dipanggil dari paintEvent pertama; cetak report sekali saja"""
+        if not self.enabled or self._done:
+            return
+        self._done = True
+        self.report(time.perf_counter() - self.t0)
+
+    def report(self, total):
+        print(f"\n=== Startup profile ({PROFILE_FLAG}) ===")
+        print(f"{'start':>9}  {'category':<10}{'module':<28}{'time':>10}")
+        for start, depth, category, label, seconds in sorted(self.records):
+            name = "  " * depth + label
+            print(f"{start * 1e3:>7.1f}ms  {category:<10}{name:<28}{seconds * 1e3:>8.1f}ms")
+
+        top_level = sum(r[4] for r in self.records if r[1] == 0)
+        for category in ("import", "construct"):
+            spent = sum(r[4] for r in self.records if r[1] == 0 and r[2] == category)
+            print(f"{'':>9}  total {category:<32}{spent * 1e3:>8.1f}ms")
+        print(f"{'':>9}  {'untracked':<38}{(total - top_level) * 1e3:>8.1f}ms")
+        print(f"{'':>9}  {'first paint':<38}{total * 1e3:>8.1f}ms")
+        sys.stdout.flush()
+
+
+PROFILER = StartupProfiler(PROFILE_FLAG in sys.argv)
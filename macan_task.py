@@ -2,17 +2,35 @@ import sys
 import os
 import psutil
 import ctypes
+import time
 import subprocess
+import queue
+import random
+import threading
+from collections import deque, OrderedDict
 from PySide6.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QTableWidget, 
-    QTableWidgetItem, QPushButton, QHeaderView, QLabel, 
+    QDialog, QVBoxLayout, QHBoxLayout, QTableView, 
+    QPushButton, QHeaderView, QLabel, 
     QMessageBox, QMenu, QToolBar, QApplication, QInputDialog,
-    QFileIconProvider
+    QFileIconProvider, QAbstractItemView, QPlainTextEdit, QTreeView,
+    QStackedWidget, QLineEdit, QToolButton
 )
 from PySide6.QtCore import (
     QTimer, Qt, QUrl, QThread, Signal, QSettings, QFileInfo, QSize
 )
-from PySide6.QtGui import QAction, QBrush, QColor, QDesktopServices, QIcon
+from PySide6.QtGui import (QAction, QDesktopServices, QIcon, QKeySequence, QShortcut,
+                           QPixmap)
+
+from macan_sampler import get_sampling_hub, METRIC_SYSTEM
+from macan_policy import get_sampling_policy
+from macan_procscan import (select_scanner, top_indices, CORE_FIELDS, EXTRA_FIELDS,
+                            CGROUP_FIELD, DEFAULT_FIELDS)
+from macan_procmodel import (ProcessTableModel, ProcessTreeModel, ProcessGroupModel,
+                             ProcessProxyModel, ProcessSearchIndex, SparklineDelegate,
+                             COLUMNS, COLUMN_INDEX, HISTORY_FIELD, GROUP_MODES,
+                             SEARCH_FIELDS, PID_ROLE)
+from macan_history import ProcessHistoryPool
+from macan_cgroup import CgroupStats, cgroup_unit, CGROUP_AVAILABLE
 
 try:
     from macan_theme import get_theme_manager
@@ -20,77 +38,410 @@ try:
 except ImportError:
     THEME_AVAILABLE = False
 
+PROCESS_INTERVAL = 2.0
+
+# Delta protocol: hanya perubahan di atas threshold yang dikirim ke UI,
+# snapshot penuh tiap FULL_RESYNC_CYCLES sebagai pengaman konsistensi
+CPU_DELTA = 0.1          # persen
+MEM_DELTA = 0.1          # MB
+FULL_RESYNC_CYCLES = 30
+# Threshold delta untuk field opsional (lihat macan_procscan.EXTRA_FIELDS)
+EXTRA_DELTAS = {"io_read": 1.0, "io_write": 1.0, "ctx_vol": 1.0, "ctx_invol": 1.0,
+                "threads": 1}
+
+EVENT_LOG_SIZE = 2000    # Jumlah event start/exit yang disimpan di memory
+
+# Mode top-N: (label, (n, key)) — None = semua proses
+TOP_MODES = [
+    ("All Processes", None),
+    ("Top 20 by CPU", (20, "cpu")),
+    ("Top 50 by CPU", (50, "cpu")),
+    ("Top 20 by Memory", (20, "mem")),
+    ("Top 50 by Memory", (50, "mem")),
+    ("Top 20 by Disk I/O", (20, "io")),
+]
+TOP_KEY_LABELS = {"cpu": "CPU", "mem": "memory", "io": "disk I/O"}
+
+# Mode tampilan: (key, label). "app"/"user"/"cgroup" = ProcessGroupModel
+VIEW_MODES = [
+    ("list", "📋 List"),
+    ("tree", "🌳 Tree"),
+    ("app", "🗂️ By Application"),
+    ("user", "👤 By User"),
+]
+if CGROUP_AVAILABLE:
+    VIEW_MODES.append(("cgroup", "📦 By Slice / Container"))
+VIEW_LABELS = dict(VIEW_MODES)
+HISTORY_COLUMN_WIDTH = 120
+
+KILL_TIMEOUT = 3.0       # Detik menunggu terminate sebelum eskalasi ke kill
+KILL_STATUS_MS = 8000    # Lama hasil End Task tampil di info label
+
+ICON_SIZE = QSize(16, 16)
+ICON_CACHE_SIZE = 256    # Maks icon (per exe path) yang disimpan, LRU
+
+# Benchmark (--bench): jumlah proses palsu, churn = fraksi proses yang diganti
+# per siklus, active = fraksi proses yang CPU/memory-nya berubah per siklus
+BENCH_COUNTS = (1000, 5000, 20000)
+BENCH_CHURN = 0.02
+BENCH_ACTIVE = 0.25
+BENCH_CYCLES = 20
+# Model test (--model-test): sedikit proses + churn tinggi agar baris/grup sering hilang
+MODEL_TEST_COUNT = 40
+MODEL_TEST_CHURN = 0.3
+MODEL_TEST_CYCLES = 20
+MODEL_TEST_FILTER = "chrome"
+
 # --- WORKER THREAD ---
 class ProcessWorker(QThread):
-    data_signal = Signal(list, int)
+    """
+    Emit `delta_signal(dict)` per siklus:
+      full    : True bila `added` berisi snapshot lengkap (model di-reset/diff penuh)
+      added   : list record proses baru
+      removed : list PID yang sudah tidak ada
+      changed : {pid: {field: value}} hanya field yang berubah
+      count   : jumlah proses total (termasuk yang tidak dikirim di mode top-N)
+      events  : list event lifecycle {"event": "start"/"exit", "time", "pid", "name"}
+      cgroups : {key grup cgroup: {"cpu", "mem"}} dari cpu.stat/memory.current,
+                hanya saat field cgroup dikumpulkan (lihat macan_cgroup)
+      quota   : {"cpu": % dari quota, "cores"} bila Macan berjalan di cgroup
+                dengan CPU quota (container), selain itu None
 
-    def __init__(self):
+    Identitas proses = (pid, ctime): PID yang didaur ulang dikirim sebagai
+    removed + added, bukan sebagai perubahan baris lama. Di mode top-N
+    (set_top) hanya proses teratas yang dikirim; proses yang keluar/masuk
+    peringkat muncul sebagai removed/added, sedangkan event start/exit tetap
+    dihitung dari semua proses (scanner.identities).
+    """
+    delta_signal = Signal(object)
+
+    def __init__(self, scanner=None):
         super().__init__()
         self.running = True
-        self.proc_cache = {}
+        # procfs di Linux, psutil di tempat lain; benchmark memakai FakeProcessSource
+        self.scanner = scanner if scanner is not None else select_scanner()
+        self.cgroups = CgroupStats()
+        self._sent = {}        # pid -> record terakhir yang dikirim ke UI
+        self._alive = None     # {(pid, ctime): name} dari scan sebelumnya
+        self._cycle = 0
+        self._wake = threading.Event()
+        self.interval = PROCESS_INTERVAL
+        self.top = None        # None = semua proses, atau (n, key) untuk scanner
+        self.fields = DEFAULT_FIELDS  # field yang dikumpulkan scanner (lihat set_fields)
+        self._delta_fields = None     # fields saat delta terakhir dibuat
+
+    def set_top(self, top):
+        """Ganti mode top-N; snapshot penuh pada siklus berikutnya"""
+        self.top = top
+        self.request_resync()
+        self._wake.set()
+
+    def set_fields(self, fields):
+        """
+        Field (CORE_FIELDS/EXTRA_FIELDS) yang dikumpulkan scanner; field lain
+        berisi placeholder atau tidak ada, jadi kolom tersembunyi = gratis
+        """
+        fields = frozenset(fields)
+        if fields != self.fields:
+            self.fields = fields
+            self._wake.set()
+
+    def set_rate(self, scale):
+        """Dipanggil SamplingPolicy: None = pause, 1.0 = normal"""
+        self.interval = None if scale is None else PROCESS_INTERVAL * scale
+        self._wake.set()
+
+    def _sleep(self):
+        # Interruptible: stop()/set_rate() membangunkan thread lebih awal.
+        # Event di-clear di awal siklus (run), jadi wake selama scan tidak hilang
+        self._wake.wait(self.interval)
+
+    def request_resync(self):
+        """Snapshot penuh pada siklus berikutnya"""
+        self._cycle = 0
+
+    def refresh(self):
+        """Scan berikutnya dimulai sekarang (mis. setelah End Task)"""
+        self._wake.set()
+
+    def lifecycle_events(self, alive, now=None):
+        """Diff identitas proses {(pid, ctime): name} terhadap scan sebelumnya -> event start/exit"""
+        now = time.time() if now is None else now
+        previous, self._alive = self._alive, alive
+        if previous is None:
+            return []  # Scan pertama hanya baseline
+        events = [{"event": "exit", "time": now, "pid": key[0], "name": name}
+                  for key, name in previous.items() if key not in alive]
+        # Waktu start diambil dari ctime proses; exit = waktu terdeteksi
+        events.extend({"event": "start", "time": key[1], "pid": key[0], "name": name}
+                      for key, name in alive.items() if key not in previous)
+        events.sort(key=lambda e: e["time"])
+        return events
+
+    def dropped_fields(self, fields):
+        """
+        EXTRA_FIELDS yang tidak lagi dikumpulkan sejak delta sebelumnya; dibuang
+        dari record terkirim, UI membuangnya lewat delta["dropped"]
+        """
+        previous, self._delta_fields = self._delta_fields, fields
+        if previous is None:
+            return []
+        dropped = [field for field in EXTRA_FIELDS if field in previous and field not in fields]
+        if dropped:
+            for prev in self._sent.values():
+                for field in dropped:
+                    prev.pop(field, None)
+        return dropped
+
+    def make_delta(self, table_data, identities=None, fields=None):
+        """
+        Bandingkan snapshot dengan record yang terakhir dikirim. `identities`
+        = semua proses dari scanner; default diturunkan dari table_data.
+        `fields` = field yang dipakai scan ini (default self.fields).
+        """
+        if identities is None:
+            identities = {(d["pid"], d["ctime"]): d["name"] for d in table_data}
+        dropped = self.dropped_fields(self.fields if fields is None else fields)
+        events = self.lifecycle_events(identities)
+        count = len(identities)
+        if self._cycle % FULL_RESYNC_CYCLES == 0:
+            self._sent = {d["pid"]: d for d in table_data}
+            self._cycle += 1
+            return {"full": True, "added": table_data, "removed": [], "changed": {},
+                    "dropped": dropped, "count": count, "events": events}
+        self._cycle += 1
+
+        added, changed, removed = [], {}, []
+        current = set()
+        for d in table_data:
+            pid = d["pid"]
+            current.add(pid)
+            prev = self._sent.get(pid)
+            if prev is not None and prev["ctime"] != d["ctime"]:
+                removed.append(pid)  # PID daur ulang: proses berbeda
+                prev = None
+            if prev is None:
+                added.append(d)
+                self._sent[pid] = d
+                continue
+            diff = {}
+            if abs(d["cpu"] - prev["cpu"]) >= CPU_DELTA:
+                diff["cpu"] = d["cpu"]
+            if abs(d["mem"] - prev["mem"]) >= MEM_DELTA:
+                diff["mem"] = d["mem"]
+            for field in ("name", "user", "path", "ppid"):
+                if d[field] != prev[field]:
+                    diff[field] = d[field]
+            if CGROUP_FIELD in d and d[CGROUP_FIELD] != prev.get(CGROUP_FIELD):
+                diff[CGROUP_FIELD] = d[CGROUP_FIELD]
+            for field, threshold in EXTRA_DELTAS.items():
+                if field in d and (field not in prev or abs(d[field] - prev[field]) >= threshold):
+                    diff[field] = d[field]
+            if diff:
+                changed[pid] = diff
+                prev.update(diff)
+
+        gone = [pid for pid in self._sent if pid not in current]
+        for pid in gone:
+            del self._sent[pid]
+        return {"full": False, "added": added, "removed": removed + gone, "changed": changed,
+                "dropped": dropped, "count": count, "events": events}
+
+    def cgroup_totals(self, table_data):
+        """Satu read cpu.stat + memory.current per grup cgroup yang terlihat, bukan per PID"""
+        if CGROUP_FIELD not in self.fields:
+            return {}
+        units = {cgroup_unit(d.get(CGROUP_FIELD, ""))[0] for d in table_data}
+        units.discard("")
+        return self.cgroups.read(units)
 
     def run(self):
         while self.running:
+            self._wake.clear()
             try:
-                current_pids = set(psutil.pids())
-                cached_pids = list(self.proc_cache.keys())
-                for pid in cached_pids:
-                    if pid not in current_pids:
-                        del self.proc_cache[pid]
-
-                table_data = []
-                
-                for pid in current_pids:
-                    try:
-                        if pid not in self.proc_cache:
-                            p = psutil.Process(pid)
-                            self.proc_cache[pid] = p
-                            p.cpu_percent(interval=None)
-                        else:
-                            p = self.proc_cache[pid]
-
-                        with p.oneshot():
-                            name = p.name()
-                            try:
-                                username = p.username()
-                            except:
-                                username = "System"
-                            
-                            try:
-                                exe_path = p.exe()
-                            except:
-                                exe_path = ""
-
-                            mem_mb = p.memory_info().rss / (1024 * 1024)
-                            cpu = p.cpu_percent(interval=None)
-                        
-                        table_data.append({
-                            "pid": pid,
-                            "name": name,
-                            "user": username,
-                            "mem": mem_mb,
-                            "cpu": cpu,
-                            "path": exe_path
-                        })
-
-                    except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                        if pid in self.proc_cache: del self.proc_cache[pid]
-                        continue
-                
-                self.data_signal.emit(table_data, len(table_data))
-                self.sleep(2)
+                # set_fields() bisa dipanggil GUI thread di tengah siklus
+                fields = self.fields
+                table_data = self.scanner.scan(self.top, fields)
+                delta = self.make_delta(table_data, self.scanner.identities, fields)
+                delta["cgroups"] = self.cgroup_totals(table_data)
+                delta["quota"] = self.cgroups.read_quota()
+                self.delta_signal.emit(delta)
 
             except Exception as e:
                 print(f"Worker Error: {e}")
-                self.sleep(2)
+
+            self._sleep()
 
     def stop(self):
         self.running = False
+        self._wake.set()
+        self.wait(3000)
+        self.scanner.close()
+
+# --- ICON RESOLVER ---
+class IconResolver(QThread):
+    """
+    Resolve icon exe di luar GUI thread: cek file & QFileIconProvider bisa
+    lambat (network share, scan antivirus). Emit `icon_ready(path, QImage)`;
+    image null bila file tidak ada / tanpa icon. Request yang sama hanya
+    diproses sekali selama masih antre.
+    """
+    icon_ready = Signal(str, object)
+
+    def __init__(self):
+        super().__init__()
+        self._queue = queue.Queue()
+        self._pending = set()
+        self._lock = threading.Lock()
+
+    def request(self, path):
+        with self._lock:
+            if path in self._pending:
+                return
+            self._pending.add(path)
+        self._queue.put(path)
+
+    def run(self):
+        provider = QFileIconProvider()
+        while True:
+            path = self._queue.get()
+            if path is None:
+                break
+            image = None
+            try:
+                if os.path.exists(path):
+                    # QImage (bukan QPixmap) yang dikirim lintas thread
+                    image = provider.icon(QFileInfo(path)).pixmap(ICON_SIZE).toImage()
+            except Exception as e:
+                print(f"Icon Error ({path}): {e}")
+            with self._lock:
+                self._pending.discard(path)
+            self.icon_ready.emit(path, image)
+
+    def stop(self):
+        self._queue.put(None)
         self.wait(3000)
 
+
+# --- KILL PIPELINE ---
+class KillWorker(QThread):
+    """
+    End Task di luar GUI thread: terminate, tunggu (psutil.wait_procs) sampai
+    KILL_TIMEOUT, lalu kill yang masih hidup. `tree=True` ikut mengakhiri
+    semua descendant. `ctime` mencegah membunuh PID yang sudah didaur ulang.
+    Emit `finished_signal(dict)`: name, pid, terminated, killed, denied,
+    survivors (jumlah) dan error (str atau None).
+    """
+    finished_signal = Signal(object)
+
+    def __init__(self, pid, ctime, name, tree=False, timeout=KILL_TIMEOUT):
+        super().__init__()
+        self.pid = pid
+        self.ctime = ctime
+        self.name = name
+        self.tree = tree
+        self.timeout = timeout
+
+    def run(self):
+        result = {"pid": self.pid, "name": self.name, "tree": self.tree,
+                  "terminated": 0, "killed": 0, "denied": 0, "survivors": 0, "error": None}
+        try:
+            root = psutil.Process(self.pid)
+            if self.ctime is not None and abs(root.create_time() - self.ctime) > 1:
+                raise psutil.NoSuchProcess(self.pid)
+            procs = [root]
+            if self.tree:
+                # Snapshot descendant dulu; parent berikutnya tidak sempat respawn anak
+                procs = root.children(recursive=True) + procs
+        except psutil.NoSuchProcess:
+            result["error"] = "Process already exited"
+            self.finished_signal.emit(result)
+            return
+        except Exception as e:
+            result["error"] = str(e)
+            self.finished_signal.emit(result)
+            return
+
+        procs = self._signal(procs, "terminate", result)
+        ended, alive = self._wait(procs)
+        result["terminated"] = ended
+        if alive:
+            alive = self._signal(alive, "kill", result)
+            ended, alive = self._wait(alive)
+            result["killed"] = ended
+        result["survivors"] = len(alive)
+        self.finished_signal.emit(result)
+
+    def _wait(self, procs):
+        """Return (jumlah yang berakhir, list yang masih hidup); zombie dihitung berakhir"""
+        gone, alive = psutil.wait_procs(procs, timeout=self.timeout)
+        still = []
+        for p in alive:
+            try:
+                if p.status() != psutil.STATUS_ZOMBIE:
+                    still.append(p)
+            except psutil.NoSuchProcess:
+                pass
+        return len(procs) - len(still), still
+
+    def _signal(self, procs, method, result):
+        """Kirim terminate/kill; return proses yang berhasil dikirimi sinyal"""
+        sent = []
+        for p in procs:
+            try:
+                getattr(p, method)()
+                sent.append(p)
+            except psutil.NoSuchProcess:
+                pass
+            except psutil.AccessDenied:
+                result["denied"] += 1
+        return sent
+
+
+def format_kill_result(result):
+    target = f"{result['name']} ({result['pid']})"
+    if result["error"]:
+        return f"End Task {target}: {result['error']}"
+    ended = result["terminated"] + result["killed"]
+    parts = [f"Ended {target}" + (f" and its tree: {ended} processes" if result["tree"] else "")]
+    if result["killed"]:
+        parts.append(f"{result['killed']} force-killed")
+    if result["denied"]:
+        parts.append(f"{result['denied']} access denied")
+    if result["survivors"]:
+        parts.append(f"{result['survivors']} still running")
+    return ", ".join(parts)
+
+
+# --- PROCESS LOG ---
+def format_event(event):
+    stamp = time.strftime("%H:%M:%S", time.localtime(event["time"]))
+    return f"{stamp}  {event['event'].upper():<5}  {event['pid']:>7}  {event['name']}"
+
+
+class ProcessLogDialog(QDialog):
+    """Log start/exit proses (non-modal); diisi dari deque MacanTask lalu live"""
+
+    def __init__(self, events, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Process Log")
+        self.resize(520, 420)
+        layout = QVBoxLayout(self)
+        self.view = QPlainTextEdit()
+        self.view.setReadOnly(True)
+        self.view.setMaximumBlockCount(EVENT_LOG_SIZE)
+        self.view.setStyleSheet("font-family: Consolas, monospace;")
+        layout.addWidget(self.view)
+        self.view.setPlainText("\n".join(format_event(e) for e in events))
+
+    def append_events(self, events):
+        for event in events:
+            self.view.appendPlainText(format_event(event))
+
+
 # --- MAIN WINDOW ---
 class MacanTask(QDialog):
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, scanner=None):
         super().__init__(parent)
         self.theme = get_theme_manager() if THEME_AVAILABLE else None
         self.setWindowTitle("Macan Task Manager Pro")
@@ -121,28 +472,86 @@ class MacanTask(QDialog):
         self.info_label = QLabel(f"Initializing... | System: {os.name.upper()}")
         self.apply_info_label_style()
         self.info_container.addWidget(self.info_label)
+        self.info_container.addStretch()
+
+        # Filter: index trigram di-update dari delta worker, query per keystroke
+        self.search_index = ProcessSearchIndex()
+        self.filter_query = ""
+        self.filter_count = None
+        self.filter_edit = QLineEdit()
+        self.filter_edit.setPlaceholderText("Filter name, user, PID or path (Ctrl+F)")
+        self.filter_edit.setClearButtonEnabled(True)
+        self.filter_edit.setMinimumWidth(260)
+        self.filter_edit.textChanged.connect(self.set_filter)
+        QShortcut(QKeySequence.Find, self, self.filter_edit.setFocus)
+        self.info_container.addWidget(self.filter_edit)
         self.layout.addLayout(self.info_container)
 
-        # Table
-        self.table = QTableWidget()
-        self.table.setColumnCount(5)
-        self.table.setHorizontalHeaderLabels(["Name", "PID", "User", "Memory (MB)", "CPU %"])
+        # Icon: LRU per exe path, di-resolve async; placeholder sampai siap
+        self.icon_cache = OrderedDict()
+        self.default_icon = QFileIconProvider().icon(QFileIconProvider.Computer)
+        self.icon_resolver = IconResolver()
+        self.icon_resolver.icon_ready.connect(self.on_icon_ready)
+        self.icon_resolver.start()
+
+        # History CPU/memory per proses (pool ukuran tetap) untuk kolom sparkline
+        self.history_pool = ProcessHistoryPool()
+        self.sparkline = SparklineDelegate(self.history_pool, self)
+
+        # Table (model/view): model keyed by PID & mengurutkan dirinya sendiri, proxy memfilter
+        self.model = ProcessTableModel(icon_for=self.icon_for, parent=self)
+        self.proxy = ProcessProxyModel(self)
+        self.proxy.setSourceModel(self.model)
+
+        self.table = QTableView()
+        self.table.setModel(self.proxy)
         
         header = self.table.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.Stretch)
-        header.setSectionResizeMode(1, QHeaderView.Interactive)
-        header.setSectionResizeMode(2, QHeaderView.Interactive)
-        header.setSectionResizeMode(3, QHeaderView.Interactive)
-        header.setSectionResizeMode(4, QHeaderView.Interactive)
+        header.setSectionResizeMode(QHeaderView.Interactive)
+        header.setSectionResizeMode(COLUMN_INDEX["name"], QHeaderView.Stretch)
         
-        self.table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.table.setSelectionMode(QTableWidget.SingleSelection)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.SingleSelection)
         self.table.verticalHeader().setVisible(False)
+        self.table.verticalHeader().setDefaultSectionSize(24)
         self.table.setSortingEnabled(True)
+        self.table.sortByColumn(COLUMN_INDEX["cpu"], Qt.DescendingOrder)
         self.table.setShowGrid(False)
-        self.table.setIconSize(QSize(16, 16))
-        
-        self.layout.addWidget(self.table)
+        self.table.setIconSize(ICON_SIZE)
+        self.table.setItemDelegateForColumn(COLUMN_INDEX[HISTORY_FIELD], self.sparkline)
+        self.table.setColumnWidth(COLUMN_INDEX[HISTORY_FIELD], HISTORY_COLUMN_WIDTH)
+
+        # Tree (parent/child via ppid) dengan total CPU/RSS per subtree.
+        # Hanya di-update saat aktif; saat diaktifkan di-resync dari model tabel.
+        self.tree_model = ProcessTreeModel(icon_for=self.icon_for, parent=self)
+        self.tree_proxy = ProcessProxyModel(self, tree=True)
+        self.tree_proxy.setRecursiveFilteringEnabled(True)  # parent dari match tetap tampil
+        self.tree_proxy.setSourceModel(self.tree_model)
+
+        self.tree = self.make_tree_view(self.tree_proxy)
+
+        # Grup per aplikasi / user dengan total per grup; sama seperti tree,
+        # hanya di-update saat aktif
+        self.group_model = ProcessGroupModel(icon_for=self.icon_for, parent=self)
+        self.group_proxy = ProcessProxyModel(self, tree=True)
+        self.group_proxy.setRecursiveFilteringEnabled(True)
+        self.group_proxy.setSourceModel(self.group_model)
+        self.group_view = self.make_tree_view(self.group_proxy)
+
+        # Kolom opsional tersembunyi secara default; menu klik-kanan di header
+        for header in self.headers():
+            for field in EXTRA_FIELDS:
+                header.setSectionHidden(COLUMN_INDEX[field], True)
+            header.setContextMenuPolicy(Qt.CustomContextMenu)
+            header.customContextMenuRequested.connect(
+                lambda pos, header=header: self.show_column_menu(header.mapToGlobal(pos)))
+            header.sortIndicatorChanged.connect(self.update_collected_fields)
+
+        self.views = QStackedWidget()
+        self.views.addWidget(self.table)
+        self.views.addWidget(self.tree)
+        self.views.addWidget(self.group_view)
+        self.layout.addWidget(self.views)
 
         # Bottom Controls
         btn_layout = QHBoxLayout()
@@ -155,25 +564,56 @@ class MacanTask(QDialog):
         self.end_task_btn = QPushButton("☠️ End Task")
         self.end_task_btn.setObjectName("killBtn")
         self.end_task_btn.clicked.connect(self.kill_selected_process)
-        
+
+        self.end_tree_btn = QPushButton("🌲 End Process Tree")
+        self.end_tree_btn.setObjectName("killBtn")
+        self.end_tree_btn.setToolTip("End the selected process and all of its descendants")
+        self.end_tree_btn.clicked.connect(lambda: self.kill_selected_process(tree=True))
+
         btn_layout.addWidget(self.new_task_btn)
         btn_layout.addStretch()
+        btn_layout.addWidget(self.end_tree_btn)
         btn_layout.addWidget(self.end_task_btn)
         self.layout.addLayout(btn_layout)
 
-        # Icon Cache
-        self.icon_provider = QFileIconProvider()
-        self.icon_cache = {}
-        self.default_icon = self.icon_provider.icon(QFileIconProvider.Computer)
+        # Worker dibuat sebelum restore settings: mode view/kolom menentukan field-nya
+        self.worker = ProcessWorker(scanner)
 
         # Restore Settings
         self.restore_app_settings()
 
         # Start Worker
-        self.worker = ProcessWorker()
-        self.worker.data_signal.connect(self.update_table)
+        self.set_top_mode(self.settings.value("topMode", 0, type=int))
+        self.update_collected_fields()
+        self.worker.delta_signal.connect(self.apply_delta)
         self.worker.start()
 
+        # End Task berjalan di KillWorker; hasil tampil di info label
+        self.kill_jobs = set()
+        self.kill_status = ""
+        self.kill_status_timer = QTimer(self)
+        self.kill_status_timer.setSingleShot(True)
+        self.kill_status_timer.timeout.connect(self.clear_kill_status)
+
+        # Log lifecycle proses (event start/exit dari worker)
+        self.event_log = deque(maxlen=EVENT_LOG_SIZE)
+        self.log_dialog = None
+
+        # Ringkasan CPU/RAM diambil dari sampling hub bersama
+        self.system_summary = ""
+        self.process_count = 0
+        self.cgroup_quota = None
+        self.hub = get_sampling_hub()
+        self.hub.sample_ready.connect(self.on_sample)
+        self.hub.subscribe(self, (METRIC_SYSTEM,))
+
+        # Pause worker & ringkasan saat window hidden/minimized
+        get_sampling_policy().register(
+            self, lambda scale: self.hub.set_rate(self, scale), self.worker.set_rate)
+        # Close hanya menyembunyikan window (instance dipakai ulang oleh widget);
+        # thread & langganan hub dilepas saat aplikasi keluar
+        QApplication.instance().aboutToQuit.connect(self.shutdown)
+
     def apply_theme(self):
         """Apply theme to dialog"""
         if self.theme:
@@ -189,6 +629,7 @@ class MacanTask(QDialog):
                 }}
                 {self.theme.get_table_style()}
                 {self.theme.get_button_style()}
+                {self.theme.get_input_style()}
                 QToolBar {{ border: none; background: {c['bg_header']}; spacing: 5px; padding: 5px; }}
                 QToolBar QToolButton {{ 
                     color: {text_color}; 
@@ -201,7 +642,7 @@ class MacanTask(QDialog):
         else:
             self.setStyleSheet("""
                 QDialog { background-color: #2b2b2b; color: #f0f0f0; font-family: 'Segoe UI', sans-serif; }
-                QTableWidget { 
+                QTableView, QTreeView { 
                     background-color: #333333; 
                     color: #ffffff; 
                     gridline-color: #444444;
@@ -209,7 +650,7 @@ class MacanTask(QDialog):
                     selection-background-color: #0078d7;
                     selection-color: white;
                 }
-                QTableWidget::item { padding: 5px; }
+                QTableView::item, QTreeView::item { padding: 5px; }
                 QHeaderView::section {
                     background-color: #404040;
                     color: #cccccc;
@@ -233,6 +674,14 @@ class MacanTask(QDialog):
                 QToolBar { border: none; background: #333; spacing: 5px; padding: 5px; }
                 QToolBar QToolButton { color: white; background: #444; padding: 5px; border-radius: 3px; }
                 QToolBar QToolButton:hover { background: #555; }
+                QLineEdit {
+                    background-color: #333333;
+                    color: #f0f0f0;
+                    border: 1px solid #555;
+                    border-radius: 4px;
+                    padding: 4px 8px;
+                }
+                QLineEdit:focus { border: 1px solid #0078d7; }
             """)
 
     def apply_info_label_style(self):
@@ -256,6 +705,40 @@ class MacanTask(QDialog):
         action_conquer.triggered.connect(self.open_macan_conquer)
         toolbar.addAction(action_conquer)
 
+        # Mode tampilan: list, tree (ppid) atau grup per aplikasi / user
+        self.view_menu = QMenu(self)
+        self.view_actions = {}
+        for mode, label in VIEW_MODES:
+            action = self.view_menu.addAction(label)
+            action.setCheckable(True)
+            action.triggered.connect(lambda checked, mode=mode: self.set_view_mode(mode))
+            self.view_actions[mode] = action
+        self.action_view = QAction("📋 View: List", self)
+        self.action_view.setToolTip(
+            "List, process tree, or totals per application / user / cgroup")
+        self.action_view.setMenu(self.view_menu)
+        toolbar.addAction(self.action_view)
+        toolbar.widgetForAction(self.action_view).setPopupMode(QToolButton.InstantPopup)
+
+        # Mode top-N: worker hanya mengirim proses teratas
+        self.top_menu = QMenu(self)
+        self.top_actions = []
+        for i, (label, top) in enumerate(TOP_MODES):
+            action = self.top_menu.addAction(label)
+            action.setCheckable(True)
+            action.triggered.connect(lambda checked, i=i: self.set_top_mode(i))
+            self.top_actions.append(action)
+        self.action_top = QAction("🏆 Show: All", self)
+        self.action_top.setToolTip("Show only the heaviest processes (cheaper to keep open)")
+        self.action_top.setMenu(self.top_menu)
+        toolbar.addAction(self.action_top)
+        toolbar.widgetForAction(self.action_top).setPopupMode(QToolButton.InstantPopup)
+
+        action_log = QAction("📜 Process Log", self)
+        action_log.setToolTip("Process start/exit events")
+        action_log.triggered.connect(self.open_process_log)
+        toolbar.addAction(action_log)
+
     def restore_app_settings(self):
         if self.settings.value("geometry"):
             self.restoreGeometry(self.settings.value("geometry"))
@@ -264,13 +747,36 @@ class MacanTask(QDialog):
             
         if self.settings.value("tableState"):
             self.table.horizontalHeader().restoreState(self.settings.value("tableState"))
+        if self.settings.value("treeState"):
+            self.tree.header().restoreState(self.settings.value("treeState"))
+        if self.settings.value("groupState"):
+            self.group_view.header().restoreState(self.settings.value("groupState"))
+        # Visibilitas kolom mengikuti tabel di semua view
+        table_header = self.table.horizontalHeader()
+        for header in self.headers()[1:]:
+            for col in range(len(COLUMNS)):
+                header.setSectionHidden(col, table_header.isSectionHidden(col))
+        legacy = "tree" if self.settings.value("treeMode", False, type=bool) else "list"
+        self.set_view_mode(self.settings.value("viewMode", legacy))
 
     def closeEvent(self, event):
         self.settings.setValue("geometry", self.saveGeometry())
         self.settings.setValue("tableState", self.table.horizontalHeader().saveState())
-        self.worker.stop()
+        self.settings.setValue("treeState", self.tree.header().saveState())
+        self.settings.setValue("groupState", self.group_view.header().saveState())
+        self.settings.setValue("viewMode", self.view_mode)
+        self.settings.setValue("topMode", self.top_mode)
         super().closeEvent(event)
 
+    def shutdown(self):
+        """Hentikan worker/icon resolver & lepas hub + policy; aman dipanggil lebih dari sekali"""
+        get_sampling_policy().unregister(self)
+        self.worker.stop()
+        self.icon_resolver.stop()
+        for job in list(self.kill_jobs):
+            job.wait()
+        self.hub.unsubscribe(self)
+
     def run_new_task(self):
         text, ok = QInputDialog.getText(self, 'Run New Task', 'Open (Type command or path):')
         if ok and text:
@@ -279,66 +785,203 @@ class MacanTask(QDialog):
             except Exception as e:
                 QMessageBox.warning(self, "Error", f"Could not run task:\n{e}")
 
-    def update_table(self, data_list, total_count):
-        self.table.setSortingEnabled(False)
-        
-        current_scroll = self.table.verticalScrollBar().value()
-        selected_pid = None
-        current_row = self.table.currentRow()
-        if current_row >= 0:
-            pid_item = self.table.item(current_row, 1)
-            if pid_item: selected_pid = int(pid_item.text())
-
-        self.table.setRowCount(len(data_list))
-        self.info_label.setText(f"Processes: {total_count} | Threads Active | Mode: {os.name.upper()}")
-
-        for i, data in enumerate(data_list):
-            name = data['name']
-            path = data['path']
-            
-            if path and os.path.exists(path):
-                if name not in self.icon_cache:
-                    file_info = QFileInfo(path)
-                    icon = self.icon_provider.icon(file_info)
-                    self.icon_cache[name] = icon
-                display_icon = self.icon_cache[name]
-            else:
-                display_icon = self.default_icon
+    def apply_delta(self, delta):
+        # Biaya update sebanding jumlah perubahan; selection & scroll dijaga view/proxy
+        # Index & match di-update dulu agar baris baru langsung tersaring saat di-insert
+        retext = self.search_index.apply_delta(delta)
+        if self.filter_query:
+            self.apply_matches(self.search_index.search(self.filter_query), refilter=retext)
+        if delta["dropped"]:
+            # Kolom disembunyikan: nilai lama tidak boleh tertinggal di record/total grup.
+            # Tree & grup yang tidak aktif ikut dibersihkan (tree di-resync dengan merge)
+            for model in (self.model, self.tree_model, self.group_model):
+                model.drop_fields(delta["dropped"])
+        self.model.apply_delta(delta)
+        if self.view_mode == "tree":
+            self.tree_model.apply_delta(delta)
+        elif self.view_mode in GROUP_MODES:
+            self.group_model.apply_delta(delta)
+        # Satu kolom history per siklus worker; hanya baris yang terlihat di-repaint
+        self.history_pool.apply_delta(delta)
+        self.history_pool.tick()
+        self.current_view().viewport().update()
+        self.process_count = delta["count"]
+        self.cgroup_quota = delta.get("quota")
+        self.update_info_label()
+        if delta["events"]:
+            self.event_log.extend(delta["events"])
+            if self.log_dialog is not None and self.log_dialog.isVisible():
+                self.log_dialog.append_events(delta["events"])
 
-            name_item = QTableWidgetItem(name)
-            name_item.setIcon(display_icon)
-            self.table.setItem(i, 0, name_item)
+    def open_process_log(self):
+        if self.log_dialog is None:
+            self.log_dialog = ProcessLogDialog(self.event_log, self)
+        else:
+            self.log_dialog.view.setPlainText("\n".join(format_event(e) for e in self.event_log))
+        self.log_dialog.show()
+        self.log_dialog.raise_()
 
-            pid_item = QTableWidgetItem()
-            pid_item.setData(Qt.DisplayRole, data['pid'])
-            self.table.setItem(i, 1, pid_item)
+    def icon_for(self, record):
+        """Icon kolom Name per exe path; tidak pernah menyentuh filesystem di GUI thread"""
+        path = record['path']
+        if not path:
+            return self.default_icon
+        icon = self.icon_cache.get(path)
+        if icon is None:
+            self.icon_resolver.request(path)
+            return self.default_icon
+        self.icon_cache.move_to_end(path)
+        return icon
 
-            self.table.setItem(i, 2, QTableWidgetItem(data['user']))
+    def on_icon_ready(self, path, image):
+        icon = QIcon(QPixmap.fromImage(image)) if image is not None and not image.isNull() else None
+        self.icon_cache[path] = icon if icon is not None and not icon.isNull() else self.default_icon
+        self.icon_cache.move_to_end(path)
+        while len(self.icon_cache) > ICON_CACHE_SIZE:
+            self.icon_cache.popitem(last=False)
+        # Baris yang terlihat digambar ulang dan mengambil icon dari cache
+        self.current_view().viewport().update()
 
-            mem_item = QTableWidgetItem()
-            mem_item.setData(Qt.DisplayRole, data['mem'])
-            mem_item.setText(f"{data['mem']:.2f}")
-            mem_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            self.table.setItem(i, 3, mem_item)
+    def set_filter(self, text):
+        was_filtering = bool(self.filter_query)
+        self.filter_query = text.strip()
+        self.apply_matches(self.search_index.search(self.filter_query))
+        self.update_info_label()
+        if was_filtering != bool(self.filter_query):
+            self.update_collected_fields()
 
-            cpu_val = data['cpu']
-            cpu_item = QTableWidgetItem()
-            cpu_item.setData(Qt.DisplayRole, cpu_val)
-            cpu_item.setText(f"{cpu_val:.1f}")
-            cpu_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            
-            if cpu_val > 50:
-                cpu_item.setForeground(QBrush(QColor("#ff5555")))
-            elif cpu_val > 20:
-                cpu_item.setForeground(QBrush(QColor("#ff9800")))
-                
-            self.table.setItem(i, 4, cpu_item)
+    def apply_matches(self, matches, refilter=True):
+        self.filter_count = None if matches is None else len(matches)
+        self.proxy.set_matches(matches, refilter)
+        self.tree_proxy.set_matches(matches, refilter)
+        self.group_proxy.set_matches(matches, refilter)
 
-            if selected_pid and data['pid'] == selected_pid:
-                self.table.selectRow(i)
+    def show_column_menu(self, global_pos):
+        menu = QMenu(self)
+        header = self.table.horizontalHeader()
+        for col, (field, title) in enumerate(COLUMNS):
+            if field == "name":
+                continue
+            action = menu.addAction(title)
+            action.setCheckable(True)
+            action.setChecked(not header.isSectionHidden(col))
+            action.toggled.connect(lambda visible, col=col: self.set_column_visible(col, visible))
+        menu.exec(global_pos)
 
-        self.table.setSortingEnabled(True)
-        self.table.verticalScrollBar().setValue(current_scroll)
+    def set_column_visible(self, col, visible):
+        for header in self.headers():
+            header.setSectionHidden(col, not visible)
+        self.update_collected_fields()
+
+    def visible_fields(self):
+        header = self.table.horizontalHeader()
+        return {field for col, (field, _) in enumerate(COLUMNS) if not header.isSectionHidden(col)}
+
+    def needed_fields(self):
+        """Field yang harus dikumpulkan: kolom terlihat + sort aktif + filter + mode grup"""
+        fields = self.visible_fields()
+        sort_col = self.headers()[self.views.currentIndex()].sortIndicatorSection()
+        if 0 <= sort_col < len(COLUMNS):
+            fields.add(COLUMNS[sort_col][0])
+        if self.filter_query:
+            fields.update(SEARCH_FIELDS)
+        if self.view_mode == "user":
+            fields.add("user")
+        elif self.view_mode == "cgroup":
+            fields.add(CGROUP_FIELD)
+        if HISTORY_FIELD in fields:
+            fields.update(("cpu", "mem"))
+        return fields.intersection(CORE_FIELDS + EXTRA_FIELDS + (CGROUP_FIELD,))
+
+    def update_collected_fields(self, *args):
+        self.worker.set_fields(self.needed_fields())
+
+    def set_top_mode(self, i):
+        if not 0 <= i < len(TOP_MODES):
+            i = 0
+        self.top_mode = i
+        for j, action in enumerate(self.top_actions):
+            action.setChecked(j == i)
+        label, top = TOP_MODES[i]
+        self.action_top.setText("🏆 Show: All" if top is None else f"🏆 Show: {label}")
+        self.worker.set_top(top)
+
+    def make_tree_view(self, proxy):
+        view = QTreeView()
+        view.setModel(proxy)
+        view.setUniformRowHeights(True)
+        view.setSelectionBehavior(QAbstractItemView.SelectRows)
+        view.setSelectionMode(QAbstractItemView.SingleSelection)
+        view.setSortingEnabled(True)
+        view.sortByColumn(COLUMN_INDEX["cpu"], Qt.DescendingOrder)
+        view.setIconSize(ICON_SIZE)
+        view.setItemDelegateForColumn(COLUMN_INDEX[HISTORY_FIELD], self.sparkline)
+        view.setColumnWidth(COLUMN_INDEX[HISTORY_FIELD], HISTORY_COLUMN_WIDTH)
+        view.header().setStretchLastSection(False)
+        view.header().setSectionResizeMode(COLUMN_INDEX["name"], QHeaderView.Stretch)
+        return view
+
+    def headers(self):
+        return [self.table.horizontalHeader(), self.tree.header(), self.group_view.header()]
+
+    def set_view_mode(self, mode):
+        # Tree & grup hanya menerima delta saat aktif: resync dari model tabel.
+        # Model tabel selalu di-update, tapi hanya diurutkan saat tampil
+        if mode not in VIEW_LABELS:
+            mode = "list"
+        self.view_mode = mode
+        for key, action in self.view_actions.items():
+            action.setChecked(key == mode)
+        label = VIEW_LABELS[mode]
+        icon, text = label.split(" ", 1)
+        self.action_view.setText(f"{icon} View: {text}")
+        if mode == "tree":
+            self.tree_model.update_processes(self.model.records())
+            self.views.setCurrentWidget(self.tree)
+        elif mode in GROUP_MODES:
+            self.group_model.set_mode(mode, self.model.records())
+            self.views.setCurrentWidget(self.group_view)
+        else:
+            self.views.setCurrentWidget(self.table)
+        self.model.set_sorting(mode == "list")
+        self.update_collected_fields()
+
+    def current_view(self):
+        return self.views.currentWidget()
+
+    def selected_process(self):
+        """Return (pid, name) baris terpilih, atau None"""
+        index = self.current_view().selectionModel().currentIndex()
+        if not index.isValid():
+            return None
+        pid = index.data(PID_ROLE)
+        if pid is None:
+            return None  # Baris grup, bukan proses
+        name = index.siblingAtColumn(COLUMN_INDEX["name"]).data()
+        return pid, name
+
+    def on_sample(self, sample):
+        if 'cpu' in sample:
+            self.system_summary = f"CPU: {sample['cpu']:.1f}% | RAM: {sample['ram']:.1f}%"
+            self.update_info_label()
+
+    def update_info_label(self):
+        parts = [f"Processes: {self.process_count}"]
+        top = TOP_MODES[self.top_mode][1]
+        if top is not None:
+            parts.append(f"Showing top {top[0]} by {TOP_KEY_LABELS[top[1]]}")
+        if self.filter_count is not None:
+            parts.append(f"Matching: {self.filter_count}")
+        if self.system_summary:
+            parts.append(self.system_summary)
+        if self.cgroup_quota:
+            # CPU host dari /proc/stat tidak mencerminkan batas container
+            parts.append(f"Cgroup CPU: {self.cgroup_quota['cpu']:.1f}% of "
+                         f"{self.cgroup_quota['cores']:g} cores")
+        parts.append(f"Mode: {os.name.upper()}")
+        if self.kill_status:
+            parts.append(self.kill_status)
+        self.info_label.setText(" | ".join(parts))
 
     def open_recycle_bin(self):
         try:
@@ -366,36 +1009,312 @@ class MacanTask(QDialog):
         else:
             QMessageBox.warning(self, "Not Found", "Macan Conquer not found.")
 
-    def kill_selected_process(self):
-        current_row = self.table.currentRow()
-        if current_row < 0:
+    def kill_selected_process(self, tree=False):
+        selected = self.selected_process()
+        if not selected:
             return
+        pid, name = selected
 
-        pid_item = self.table.item(current_row, 1)
-        name_item = self.table.item(current_row, 0)
-
-        if not pid_item: return
-        
-        pid = int(pid_item.text())
-        name = name_item.text()
-
+        question = (f"Kill process {name} ({pid}) and all of its child processes?" if tree
+                    else f"Kill process: {name} ({pid})?")
         confirm = QMessageBox.question(
-            self, "End Task", 
-            f"Kill process: {name} ({pid})?",
+            self, "End Process Tree" if tree else "End Task",
+            question,
             QMessageBox.Yes | QMessageBox.No
         )
 
         if confirm == QMessageBox.Yes:
-            try:
-                proc = psutil.Process(pid)
-                proc.terminate()
-                self.worker.start()
-                QMessageBox.information(self, "Success", f"Process {name} terminated.")
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed: {e}")
+            row = self.model.row_of(pid)
+            ctime = self.model.record(row)["ctime"] if row is not None else None
+            job = KillWorker(pid, ctime, name, tree=tree)
+            job.finished_signal.connect(self.on_kill_finished)
+            job.finished.connect(lambda job=job: self.kill_jobs.discard(job))
+            self.kill_jobs.add(job)
+            self.kill_status = f"Ending {name} ({pid})..."
+            self.update_info_label()
+            job.start()
+
+    def on_kill_finished(self, result):
+        self.kill_status = format_kill_result(result)
+        self.update_info_label()
+        self.kill_status_timer.start(KILL_STATUS_MS)
+        self.worker.refresh()
+        if result["error"] or result["denied"] or result["survivors"]:
+            # Non-modal: tabel tetap bisa dipakai
+            box = QMessageBox(QMessageBox.Warning, "End Task", self.kill_status,
+                              QMessageBox.Ok, self)
+            box.setAttribute(Qt.WA_DeleteOnClose)
+            box.open()
+
+    def clear_kill_status(self):
+        self.kill_status = ""
+        self.update_info_label()
+
+# --- BENCHMARK ---
+FAKE_NAMES = ["chrome", "python", "code", "svchost", "bash", "postgres", "nginx",
+              "java", "node", "explorer", "systemd", "dockerd"]
+FAKE_USERS = ["root", "alice", "bob", "SYSTEM", "www-data"]
+
+
+class FakeProcessSource:
+    """
+    Scanner sintetis untuk benchmark (API sama dengan scanner macan_procscan):
+    `count` proses, tiap scan `churn` x count proses exit dan diganti proses
+    baru, `active` x count proses berubah CPU/memory. Deterministik per seed.
+    """
+    name = "fake"
+
+    def __init__(self, count, churn=BENCH_CHURN, active=BENCH_ACTIVE, seed=1):
+        self.rng = random.Random(seed)
+        self.churn = churn
+        self.active = active
+        self.procs = {}        # pid -> record master (scan() mengirim salinan)
+        self.identities = {}
+        self._next_pid = 1000
+        for _ in range(count):
+            self._spawn()
+
+    def _spawn(self):
+        rng = self.rng
+        pid = self._next_pid
+        self._next_pid += 1
+        name = rng.choice(FAKE_NAMES)
+        # Parent bisa sudah exit: tree view harus menangani orphan
+        ppid = rng.randrange(1000, pid) if pid > 1000 and rng.random() < 0.8 else 1
+        self.procs[pid] = {
+            "pid": pid, "ctime": 1.7e9 + pid, "ppid": ppid,
+            "name": name, "user": rng.choice(FAKE_USERS),
+            "path": f"/opt/fake/{name}/bin/{name}",
+            "mem": rng.uniform(1, 500), "cpu": 0.0,
+            "io_read": 0.0, "io_write": 0.0, "ctx_vol": 0.0, "ctx_invol": 0.0,
+            "threads": rng.randint(1, 64),
+            CGROUP_FIELD: f"/system.slice/{name}.service",
+        }
+
+    def scan(self, top=None, fields=DEFAULT_FIELDS):
+        rng, procs = self.rng, self.procs
+        for pid in rng.sample(list(procs), int(len(procs) * self.churn)):
+            del procs[pid]
+            self._spawn()
+        for pid in rng.sample(list(procs), int(len(procs) * self.active)):
+            record = procs[pid]
+            record["cpu"] = rng.expovariate(0.5)
+            record["mem"] = max(1.0, record["mem"] + rng.uniform(-5, 5))
+            record["io_read"] = rng.expovariate(0.01)
+            record["io_write"] = rng.expovariate(0.02)
+            record["ctx_vol"] = rng.expovariate(0.05)
+            record["ctx_invol"] = rng.expovariate(0.2)
+        self.identities = {(pid, r["ctime"]): r["name"] for pid, r in procs.items()}
+
+        # Seperti scanner asli: record baru tiap scan, field opsional sesuai `fields`
+        records = list(procs.values())
+        columns = {"cpu": [r["cpu"] for r in records], "mem": [r["mem"] for r in records]}
+        if top is not None and top[1] == "io":
+            columns["io"] = [r["io_read"] + r["io_write"] for r in records]
+        keep = ("pid", "ctime", "ppid", "name", "user", "path", "mem", "cpu") + tuple(
+            f for f in EXTRA_FIELDS + (CGROUP_FIELD,) if f in fields)
+        return [{k: records[i][k] for k in keep} for i in top_indices(columns, top)]
+
+    def close(self):
+        pass
+
+
+def peak_rss_mb():
+    """Peak RSS proses ini (MB) sejak start"""
+    try:
+        import resource
+    except ImportError:  # Windows
+        info = psutil.Process().memory_info()
+        return getattr(info, "peak_wset", info.rss) / (1024 * 1024)
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux: KB, macOS: byte
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def headless_app():
+    """QApplication untuk --bench/--model-test; settings pengguna tidak dibaca/ditulis"""
+    import tempfile
+
+    # QSettings native di Windows = registry
+    settings_dir = tempfile.mkdtemp(prefix="macan-bench-")
+    QSettings.setPath(QSettings.NativeFormat, QSettings.UserScope, settings_dir)
+    QSettings.setPath(QSettings.IniFormat, QSettings.UserScope, settings_dir)
+    return QApplication.instance() or QApplication([sys.argv[0]])
+
+
+def benchmark_task(counts=BENCH_COUNTS, churn=BENCH_CHURN, cycles=BENCH_CYCLES, view="list"):
+    """
+    Jalankan MacanTask headless dengan FakeProcessSource; siklus worker
+    dipanggil sinkron agar waktunya bisa dipisah dari waktu GUI thread.
+    Return {count: stats}:
+      worker_ms  : rata-rata make_delta per siklus inkremental (biaya scan
+                   asli diukur terpisah oleh macan_procscan --bench)
+      payload_kb : rata-rata ukuran delta (pickle) per siklus inkremental
+      gui_ms / gui_max_ms : apply_delta + repaint per siklus inkremental
+      full_*     : angka yang sama untuk snapshot penuh pertama
+      peak_rss_mb: peak RSS proses setelah count ini (kumulatif, count naik)
+    """
+    import gc
+    import pickle
+
+    app = headless_app()
+    results = {}
+    for count in counts:
+        source = FakeProcessSource(count, churn)
+        task = MacanTask(scanner=source)
+        # Thread worker dihentikan; siklus dijalankan manual di bawah
+        task.worker.stop()
+        task.resize(1200, 800)
+        task.show()
+        task.set_top_mode(0)
+        task.set_view_mode(view)
+        app.processEvents()
+        worker = task.worker
+        worker.request_resync()
+
+        samples = {True: [], False: []}  # delta["full"] -> [(worker, payload, gui)]
+        for _ in range(cycles + 1):
+            table_data = source.scan(worker.top, worker.fields)
+            t0 = time.perf_counter()
+            delta = worker.make_delta(table_data, source.identities)
+            t1 = time.perf_counter()
+            payload = len(pickle.dumps(delta, pickle.HIGHEST_PROTOCOL))
+            t2 = time.perf_counter()
+            task.apply_delta(delta)
+            app.processEvents()
+            t3 = time.perf_counter()
+            samples[delta["full"]].append(((t1 - t0) * 1e3, payload / 1024, (t3 - t2) * 1e3))
+
+        full_worker, full_payload, full_gui = samples[True][0]
+        incremental = samples[False]
+        n = max(1, len(incremental))
+        results[count] = {
+            "worker_ms": sum(s[0] for s in incremental) / n,
+            "payload_kb": sum(s[1] for s in incremental) / n,
+            "gui_ms": sum(s[2] for s in incremental) / n,
+            "gui_max_ms": max((s[2] for s in incremental), default=0.0),
+            "full_worker_ms": full_worker,
+            "full_payload_kb": full_payload,
+            "full_gui_ms": full_gui,
+            "peak_rss_mb": peak_rss_mb(),
+        }
+
+        # Tanpa close(): closeEvent menyimpan settings
+        task.shutdown()
+        task.hide()
+        task.deleteLater()
+        app.processEvents()
+        gc.collect()
+    # Tanpa app.exec() aboutToQuit tidak pernah terpanggil
+    get_sampling_hub().stop()
+    return results
+
+
+def model_test(views=("list", "tree", "app", "user", "cgroup"), count=MODEL_TEST_COUNT, churn=MODEL_TEST_CHURN,
+               cycles=MODEL_TEST_CYCLES):
+    """
+    Pasang QAbstractItemModelTester pada model & proxy tiap view, lalu
+    jalankan siklus FakeProcessSource (separuh siklus dengan filter aktif,
+    sepertiga tengah dengan kolom I/O terlihat lalu disembunyikan lagi).
+    Return {"view/model": [pesan kegagalan tester]}; kosong = konsisten.
+    """
+    from PySide6.QtCore import qInstallMessageHandler
+    from PySide6.QtTest import QAbstractItemModelTester
+
+    app = headless_app()
+    failures = []
+
+    def on_message(mode, context, message):
+        if context.category == "qt.modeltest":
+            failures.append(message)
+
+    previous = qInstallMessageHandler(on_message)
+    results = {}
+    try:
+        for view in views:
+            source = FakeProcessSource(count, churn)
+            task = MacanTask(scanner=source)
+            task.worker.stop()
+            task.show()
+            task.set_view_mode(view)
+            if view == "list":
+                models = {"model": task.model, "proxy": task.proxy}
+            elif view == "tree":
+                models = {"model": task.tree_model, "proxy": task.tree_proxy}
+            else:
+                models = {"model": task.group_model, "proxy": task.group_proxy}
+            for name, model in models.items():
+                del failures[:]
+                tester = QAbstractItemModelTester(
+                    model, QAbstractItemModelTester.FailureReportingMode.Warning)
+                worker = task.worker
+                worker.request_resync()
+                for cycle in range(cycles):
+                    if cycle == cycles // 4:
+                        task.set_filter(MODEL_TEST_FILTER)
+                    elif cycle == 3 * cycles // 4:
+                        task.set_filter("")
+                    if cycle == cycles // 3:
+                        task.set_column_visible(COLUMN_INDEX["io_read"], True)
+                    elif cycle == 2 * cycles // 3:
+                        task.set_column_visible(COLUMN_INDEX["io_read"], False)
+                    delta = worker.make_delta(source.scan(worker.top, worker.fields),
+                                              source.identities)
+                    task.apply_delta(delta)
+                    app.processEvents()
+                del tester
+                results[f"{view}/{name}"] = list(failures)
+            task.shutdown()
+            task.hide()
+            task.deleteLater()
+            app.processEvents()
+    finally:
+        qInstallMessageHandler(previous)
+    get_sampling_hub().stop()
+    return results
+
+
+def parse_bench_args(argv):
+    """--counts=1000,5000 --churn=0.05 --cycles=20 --view=tree"""
+    options = {}
+    for arg in argv:
+        key, _, value = arg.partition("=")
+        if key == "--counts" and value:
+            options["counts"] = tuple(int(v) for v in value.split(","))
+        elif key == "--churn" and value:
+            options["churn"] = float(value)
+        elif key == "--cycles" and value:
+            options["cycles"] = int(value)
+        elif key == "--view" and value:
+            options["view"] = value
+    return options
+
 
 if __name__ == "__main__":
+    if "--bench" in sys.argv:
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+        options = parse_bench_args(sys.argv[1:])
+        results = benchmark_task(**options)
+        print(f"MacanTask update cost (fake processes, churn "
+              f"{options.get('churn', BENCH_CHURN):.0%}/cycle, "
+              f"view {options.get('view', 'list')}, per incremental cycle):")
+        print(f"{'processes':>10}{'worker (ms)':>13}{'payload (KB)':>14}"
+              f"{'gui (ms)':>10}{'gui max':>9}{'full gui':>10}{'peak RSS (MB)':>15}")
+        for count, r in results.items():
+            print(f"{count:>10}{r['worker_ms']:>13.2f}{r['payload_kb']:>14.1f}"
+                  f"{r['gui_ms']:>10.1f}{r['gui_max_ms']:>9.1f}{r['full_gui_ms']:>10.1f}"
+                  f"{r['peak_rss_mb']:>15.0f}")
+        sys.exit(0)
+    if "--model-test" in sys.argv:
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+        results = model_test()
+        for name, failures in results.items():
+            print(f"{name:<14}{'OK' if not failures else f'{len(failures)} failures'}")
+            for message in failures[:3]:
+                print("   ", message.replace("\n", "\n    "))
+        sys.exit(0 if not any(results.values()) else 1)
+
     app = QApplication(sys.argv)
     window = MacanTask()
     window.show()
-    sys.exit(app.exec())
\ No newline at end of file
+    sys.exit(app.exec())
@@ -247,7 +247,7 @@ class MacanTheme(QObject):
     def get_table_style(self):
         if self.current_theme == "dark":
             return """
-                QTableWidget { 
+                QTableView, QTreeView { 
                     background-color: rgba(30, 30, 30, 150); 
                     color: #ffffff; 
                     gridline-color: rgba(68, 68, 68, 100);
@@ -263,13 +263,13 @@ class MacanTheme(QObject):
                     border-right: 1px solid #555;
                     font-weight: bold;
                 }
-                QTableWidget::item:hover {
+                QTableView::item:hover, QTreeView::item:hover {
                     background-color: rgba(255, 255, 255, 20);
                 }
             """
         else:
             return """
-                QTableWidget { 
+                QTableView, QTreeView { 
                     background-color: #ffffff; 
                     color: #212121; 
                     gridline-color: #e0e0e0;